@@ -6,7 +6,12 @@ including directory structure creation and scheduled execution logic.
 """
 
 import os
-from typing import Dict, List, Any, Optional, Tuple
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Optional, Set, Tuple
 from datetime import datetime, timedelta
 from abc import ABC, abstractmethod
 
@@ -16,15 +21,39 @@ from state_manager import StateManager
 from readme_generator import ReadmeGenerator
 
 
+# Number of concurrent downloads per archive (network-bound, so threads scale well)
+DEFAULT_DOWNLOAD_WORKERS = int(os.environ.get('DOWNLOAD_WORKERS', '8'))
+
+# Number of archives processed at the same time (1 disables the asyncio scheduler)
+DEFAULT_ARCHIVE_CONCURRENCY = int(os.environ.get('ARCHIVE_CONCURRENCY', '4'))
+
+# Bound process_archive method: archive -> (success, files_downloaded, files_failed, errors)
+ArchiveProcessFn = Callable[[Dict[str, Any]], Tuple[bool, int, int, List[str]]]
+
+
 class CategoryProcessor(ABC):
     """Abstract base class for category-specific processors."""
     
+    # Absolute paths of directories already created during this process
+    _created_dirs: Set[str] = set()
+    
+    # Shared by every processor (and the executor) so archives of different
+    # categories running concurrently never interleave error_handler updates
+    _log_lock = threading.Lock()
+    
     def __init__(self, file_manager: FileManager, error_handler: ErrorHandler,
-                 state_manager: StateManager, readme_generator: ReadmeGenerator):
+                 state_manager: StateManager, readme_generator: ReadmeGenerator,
+                 download_workers: int = DEFAULT_DOWNLOAD_WORKERS):
         self.file_manager = file_manager
         self.error_handler = error_handler
         self.state_manager = state_manager
         self.readme_generator = readme_generator
+        self.download_workers = max(1, download_workers)
+    
+    def _log_error(self, message: str, category: str) -> None:
+        """Log an error while holding the shared error-handler lock."""
+        with self._log_lock:
+            self.error_handler.log_error(message, category)
     
     @abstractmethod
     def process_archive(self, archive: Dict[str, Any]) -> Tuple[bool, int, int, List[str]]:
@@ -32,14 +61,106 @@ class CategoryProcessor(ABC):
         pass
     
     @abstractmethod
-    def create_directory_structure(self, archive: Dict[str, Any]) -> str:
+    def create_directory_structure(self, archive: Dict[str, Any],
+                                   folder_name: Optional[str] = None) -> str:
         """Create directory structure for the archive."""
         pass
     
     @abstractmethod
-    def should_process_in_scheduled_run(self, archive: Dict[str, Any]) -> bool:
-        """Determine if archive should be processed in scheduled runs."""
+    def should_process_in_scheduled_run(self, archive: Optional[Dict[str, Any]] = None) -> bool:
+        """Determine if archives of this category should be processed in scheduled runs."""
         pass
+    
+    def _ensure_directory(self, directory: str) -> str:
+        """Create directory once per process, skipping the makedirs stat on repeat calls."""
+        key = os.path.abspath(directory)
+        if key not in self._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(key)
+        return directory
+    
+    def _list_existing_files(self, directory: str) -> Set[str]:
+        """
+        Return names of files already in directory using a single scandir pass.
+        
+        A missing directory is created on the spot, so listing doubles as the
+        existence check and no separate makedirs stat is needed beforehand.
+        """
+        try:
+            with os.scandir(directory) as entries:
+                existing_files = {entry.name for entry in entries if entry.is_file()}
+            self._created_dirs.add(os.path.abspath(directory))
+            return existing_files
+        except FileNotFoundError:
+            # The directory may have been removed after an earlier scan cached it
+            self._created_dirs.discard(os.path.abspath(directory))
+            self._ensure_directory(directory)
+            return set()
+        except OSError:
+            return set()
+    
+    def _pending_downloads(self, directory: str, name_prefix: str,
+                           urls: List[str]) -> List[Tuple[str, Path]]:
+        """
+        Build (url, file_path) jobs for URLs whose numbered file is not on disk yet.
+        
+        Files are named "{name_prefix}_{NNN}.pdf" following the URL order.
+        """
+        existing_files = self._list_existing_files(directory)
+        base_path = Path(directory)
+        filenames = [f"{name_prefix}_{i:03d}.pdf" for i in range(1, len(urls) + 1)]
+        
+        # Skip files that already exist
+        return [
+            (url, base_path / filename)
+            for url, filename in zip(urls, filenames)
+            if filename not in existing_files
+        ]
+    
+    def _download_files(self, jobs: List[Tuple[str, Path]]) -> Tuple[List[str], int, List[str]]:
+        """
+        Download (url, file_path) jobs concurrently using a thread pool.
+        
+        Returns:
+            Tuple of (downloaded_filenames, files_failed, errors), with the
+            filenames in job order
+        """
+        downloaded = set()
+        files_failed = 0
+        errors = []
+        
+        if not jobs:
+            return [], files_failed, errors
+        
+        with ThreadPoolExecutor(max_workers=min(self.download_workers, len(jobs))) as pool:
+            futures = {
+                pool.submit(self.file_manager.download_file, url, file_path): (url, file_path)
+                for url, file_path in jobs
+            }
+            
+            for future in as_completed(futures):
+                url, file_path = futures[future]
+                try:
+                    success, download_error = future.result()
+                    
+                    if success:
+                        downloaded.add(file_path)
+                    else:
+                        files_failed += 1
+                        error_message = download_error or f"Failed to download {url}"
+                        errors.append(error_message)
+                        self._log_error(error_message, 'network')
+                        
+                except Exception as e:
+                    files_failed += 1
+                    error_msg = f"Error processing {url}: {str(e)}"
+                    errors.append(error_msg)
+                    self._log_error(error_msg, 'filesystem')
+        
+        downloaded_filenames = [
+            file_path.name for _, file_path in jobs if file_path in downloaded
+        ]
+        return downloaded_filenames, files_failed, errors
 
 
 class OldNewspaperProcessor(CategoryProcessor):
@@ -52,44 +173,17 @@ class OldNewspaperProcessor(CategoryProcessor):
         
         if not urls:
             error_msg = f"No URLs found for archive: {archive_name}"
-            self.error_handler.log_error(error_msg, 'configuration')
+            self._log_error(error_msg, 'configuration')
             return False, 0, 0, [error_msg]
         
         # Create directory structure
-        base_dir = self.create_directory_structure(archive)
+        base_dir = self.create_directory_structure(archive, archive_name)
         
-        files_downloaded = 0
-        files_failed = 0
-        errors = []
+        # Collect pending downloads with sequential numbering
+        jobs = self._pending_downloads(base_dir, archive_name, urls)
         
-        # Process each URL
-        for i, url in enumerate(urls, 1):
-            try:
-                # Generate filename with sequential numbering
-                filename = f"{archive_name}_{i:03d}.pdf"
-                file_path = os.path.join(base_dir, filename)
-                
-                # Skip if file already exists
-                if os.path.exists(file_path):
-                    continue
-                
-                # Download file (convert string path to Path object)
-                from pathlib import Path
-                success, download_error = self.file_manager.download_file(url, Path(file_path))
-                
-                if success:
-                    files_downloaded += 1
-                else:
-                    files_failed += 1
-                    error_message = download_error or f"Failed to download {url}"
-                    errors.append(error_message)
-                    self.error_handler.log_error(error_message, 'network')
-                    
-            except Exception as e:
-                files_failed += 1
-                error_msg = f"Error processing {url}: {str(e)}"
-                errors.append(error_msg)
-                self.error_handler.log_error(error_msg, 'filesystem')
+        downloaded_filenames, files_failed, errors = self._download_files(jobs)
+        files_downloaded = len(downloaded_filenames)
         
         # Generate publication README
         try:
@@ -100,34 +194,24 @@ class OldNewspaperProcessor(CategoryProcessor):
         except Exception as e:
             error_msg = f"Failed to generate README for {archive_name}: {str(e)}"
             errors.append(error_msg)
-            self.error_handler.log_error(error_msg, 'filesystem')
+            self._log_error(error_msg, 'filesystem')
         
         # Determine overall success
         success = files_downloaded > 0 and files_failed == 0
         
         return success, files_downloaded, files_failed, errors
     
-    def create_directory_structure(self, archive: Dict[str, Any]) -> str:
+    def create_directory_structure(self, archive: Dict[str, Any],
+                                   folder_name: Optional[str] = None) -> str:
         """Create static directory structure for old newspaper."""
-        folder_name = archive.get('folder', 'unknown')
-        
-        # Check if this archive has newspaper name info from crawling
-        source_info = archive.get('source_info', {})
-        newspaper_name = source_info.get('newspaper_name')
-        
-        if newspaper_name:
-            # Use newspaper name as folder name
-            base_dir = os.path.join('old-newspaper', folder_name)
-        else:
-            # Use original folder name
-            base_dir = os.path.join('old-newspaper', folder_name)
+        if folder_name is None:
+            folder_name = archive.get('folder', 'unknown')
+        base_dir = os.path.join('old-newspaper', folder_name)
         
         # Create directory if it doesn't exist
-        os.makedirs(base_dir, exist_ok=True)
-        
-        return base_dir
+        return self._ensure_directory(base_dir)
     
-    def should_process_in_scheduled_run(self, archive: Dict[str, Any]) -> bool:
+    def should_process_in_scheduled_run(self, archive: Optional[Dict[str, Any]] = None) -> bool:
         """Old newspapers are not processed in scheduled runs (static archives)."""
         return False
 
@@ -142,53 +226,27 @@ class NewspaperProcessor(CategoryProcessor):
         
         if not urls:
             error_msg = f"No URLs found for archive: {archive_name}"
-            self.error_handler.log_error(error_msg, 'configuration')
+            self._log_error(error_msg, 'configuration')
             return False, 0, 0, [error_msg]
         
         # Create base directory structure
-        base_dir = self.create_directory_structure(archive)
+        base_dir = self.create_directory_structure(archive, archive_name)
         
-        # Create year-specific directory
-        current_year = datetime.now().year
+        # Create year-specific directory; the date is fixed for the whole run
+        now = datetime.now()
+        current_year = now.year
+        date_str = now.strftime('%Y%m%d')
         year_dir = os.path.join(base_dir, str(current_year))
-        os.makedirs(year_dir, exist_ok=True)
         
-        files_downloaded = 0
-        files_failed = 0
-        errors = []
+        # Collect pending downloads with date and sequential numbering
+        # (the year directory is created while it is scanned)
+        jobs = self._pending_downloads(year_dir, f"{archive_name}_{date_str}", urls)
         
-        # Process each URL
-        for i, url in enumerate(urls, 1):
-            try:
-                # Generate filename with date and sequential numbering
-                date_str = datetime.now().strftime('%Y%m%d')
-                filename = f"{archive_name}_{date_str}_{i:03d}.pdf"
-                file_path = os.path.join(year_dir, filename)
-                
-                # Skip if file already exists
-                if os.path.exists(file_path):
-                    continue
-                
-                # Download file (convert string path to Path object)
-                from pathlib import Path
-                success, download_error = self.file_manager.download_file(url, Path(file_path))
-                
-                if success:
-                    files_downloaded += 1
-                else:
-                    files_failed += 1
-                    error_message = download_error or f"Failed to download {url}"
-                    errors.append(error_message)
-                    self.error_handler.log_error(error_message, 'network')
-                    
-            except Exception as e:
-                files_failed += 1
-                error_msg = f"Error processing {url}: {str(e)}"
-                errors.append(error_msg)
-                self.error_handler.log_error(error_msg, 'filesystem')
+        downloaded_filenames, files_failed, errors = self._download_files(jobs)
+        files_downloaded = len(downloaded_filenames)
         
         # Update archive configuration with year information
-        self._update_archive_years(archive, current_year, files_downloaded)
+        self._update_archive_years(archive, current_year, downloaded_filenames)
         
         # Generate publication README
         try:
@@ -199,29 +257,30 @@ class NewspaperProcessor(CategoryProcessor):
         except Exception as e:
             error_msg = f"Failed to generate README for {archive_name}: {str(e)}"
             errors.append(error_msg)
-            self.error_handler.log_error(error_msg, 'filesystem')
+            self._log_error(error_msg, 'filesystem')
         
         # Determine overall success
         success = files_downloaded > 0 and files_failed == 0
         
         return success, files_downloaded, files_failed, errors
     
-    def create_directory_structure(self, archive: Dict[str, Any]) -> str:
+    def create_directory_structure(self, archive: Dict[str, Any],
+                                   folder_name: Optional[str] = None) -> str:
         """Create dynamic directory structure for newspaper."""
-        folder_name = archive.get('folder', 'unknown')
+        if folder_name is None:
+            folder_name = archive.get('folder', 'unknown')
         base_dir = os.path.join('newspaper', folder_name)
         
         # Create base directory if it doesn't exist
-        os.makedirs(base_dir, exist_ok=True)
-        
-        return base_dir
+        return self._ensure_directory(base_dir)
     
-    def should_process_in_scheduled_run(self, archive: Dict[str, Any]) -> bool:
+    def should_process_in_scheduled_run(self, archive: Optional[Dict[str, Any]] = None) -> bool:
         """Newspapers are processed in scheduled runs (active publications)."""
         return True
     
-    def _update_archive_years(self, archive: Dict[str, Any], year: int, files_count: int) -> None:
-        """Update archive configuration with year information."""
+    def _update_archive_years(self, archive: Dict[str, Any], year: int,
+                              downloaded_filenames: List[str]) -> None:
+        """Update archive configuration with the files downloaded for a year."""
         if 'years' not in archive:
             archive['years'] = {}
         
@@ -229,17 +288,32 @@ class NewspaperProcessor(CategoryProcessor):
         if year_str not in archive['years']:
             archive['years'][year_str] = []
         
-        # Add placeholder entries for downloaded files
-        for i in range(files_count):
-            date_str = datetime.now().strftime('%Y%m%d')
-            filename = f"{archive.get('folder', 'unknown')}_{date_str}_{i+1:03d}.pdf"
-            if filename not in archive['years'][year_str]:
-                archive['years'][year_str].append(filename)
+        year_files = archive['years'][year_str]
+        existing = set(year_files)
+        year_files.extend([filename for filename in downloaded_filenames if filename not in existing])
 
 
 class CategoryProcessorFactory:
     """Factory class for creating category-specific processors."""
     
+    SUPPORTED_CATEGORIES = ('old-newspaper', 'newspaper')
+    
+    def __init__(self, file_manager: FileManager, error_handler: ErrorHandler,
+                 state_manager: StateManager, readme_generator: ReadmeGenerator):
+        """Build one shared processor per supported category."""
+        self._processors: Dict[str, CategoryProcessor] = {
+            category: self.create_processor(category, file_manager, error_handler,
+                                            state_manager, readme_generator)
+            for category in self.SUPPORTED_CATEGORIES
+        }
+    
+    def get(self, category: str) -> CategoryProcessor:
+        """Return the pre-built processor for the given category."""
+        try:
+            return self._processors[category]
+        except KeyError:
+            raise ValueError(f"Unsupported category: {category}") from None
+    
     @staticmethod
     def create_processor(category: str, file_manager: FileManager, 
                         error_handler: ErrorHandler, state_manager: StateManager,
@@ -259,69 +333,103 @@ class WorkflowExecutor:
     """Main executor for category-specific workflow processing."""
     
     def __init__(self, file_manager: FileManager, error_handler: ErrorHandler,
-                 state_manager: StateManager, readme_generator: ReadmeGenerator):
+                 state_manager: StateManager, readme_generator: ReadmeGenerator,
+                 max_concurrent_archives: int = DEFAULT_ARCHIVE_CONCURRENCY):
         self.file_manager = file_manager
         self.error_handler = error_handler
         self.state_manager = state_manager
         self.readme_generator = readme_generator
-        self.factory = CategoryProcessorFactory()
+        self.factory = CategoryProcessorFactory(
+            file_manager, error_handler, state_manager, readme_generator
+        )
+        self.max_concurrent_archives = max(1, max_concurrent_archives)
+        self._scheduled_categories: Optional[Set[str]] = None
     
     def process_archives_by_category(self, archives: Dict[str, List[Dict[str, Any]]], 
                                    is_scheduled_run: bool = False) -> None:
         """Process archives grouped by category."""
+        if is_scheduled_run:
+            archives = self.get_archives_for_processing(archives, is_scheduled_run)
+        
+        jobs = []
+        
         for category, archive_list in archives.items():
             if not archive_list:
                 continue
             
             try:
-                processor = self.factory.create_processor(
-                    category, self.file_manager, self.error_handler,
-                    self.state_manager, self.readme_generator
-                )
-                
-                for archive in archive_list:
-                    # Skip archives that shouldn't be processed in scheduled runs
-                    if is_scheduled_run and not processor.should_process_in_scheduled_run(archive):
-                        continue
-                    
-                    archive_name = archive.get('folder', 'unknown')
-                    start_time = datetime.now()
-                    
-                    try:
-                        success, files_downloaded, files_failed, errors = processor.process_archive(archive)
-                        
-                        processing_time = (datetime.now() - start_time).total_seconds()
-                        
-                        # Track result in state manager
-                        self.state_manager.track_download_result(
-                            archive_name=archive_name,
-                            category=category,
-                            success=success,
-                            files_downloaded=files_downloaded,
-                            files_failed=files_failed,
-                            errors=errors,
-                            processing_time=processing_time
-                        )
-                        
-                    except Exception as e:
-                        processing_time = (datetime.now() - start_time).total_seconds()
-                        error_msg = f"Critical error processing {archive_name}: {str(e)}"
-                        
-                        self.error_handler.log_error(error_msg, 'unknown')
-                        
-                        self.state_manager.track_download_result(
-                            archive_name=archive_name,
-                            category=category,
-                            success=False,
-                            files_downloaded=0,
-                            files_failed=1,
-                            errors=[error_msg],
-                            processing_time=processing_time
-                        )
-                        
+                processor = self.factory.get(category)
             except ValueError as e:
                 self.error_handler.log_error(f"Invalid category {category}: {str(e)}", 'configuration')
                 continue
+            
+            # Bind the processing method once per category rather than per archive
+            process = processor.process_archive
+            jobs.extend((process, archive, category) for archive in archive_list)
+        
+        if not jobs:
+            return
+        
+        if self.max_concurrent_archives > 1 and len(jobs) > 1 and not self._in_event_loop():
+            # Archives are independent, so a slow host only delays its own archive
+            results = asyncio.run(self._process_all(jobs))
+        else:
+            results = [
+                self._execute_archive(process, archive, category)
+                for process, archive, category in jobs
+            ]
+        
+        # Record all results with a single state update
+        self.state_manager.track_download_results_batch(results)
+    
+    async def _process_all(self, jobs: List[Tuple[ArchiveProcessFn, Dict[str, Any], str]]) -> List[Dict[str, Any]]:
+        """Process all archive jobs concurrently, bounded by max_concurrent_archives."""
+        semaphore = asyncio.Semaphore(self.max_concurrent_archives)
+        return await asyncio.gather(*[
+            self._process_archive_async(process, archive, category, semaphore)
+            for process, archive, category in jobs
+        ])
+    
+    async def _process_archive_async(self, process: ArchiveProcessFn, archive: Dict[str, Any],
+                                     category: str, semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        """Run the blocking archive processing in a worker thread."""
+        async with semaphore:
+            return await asyncio.to_thread(self._execute_archive, process, archive, category)
+    
+    def _execute_archive(self, process: ArchiveProcessFn, archive: Dict[str, Any],
+                         category: str) -> Dict[str, Any]:
+        """Process a single archive and return its result as track_download_result kwargs."""
+        archive_name = archive.get('folder', 'unknown')
+        start_time = time.monotonic()
+        
+        try:
+            success, files_downloaded, files_failed, errors = process(archive)
+        except Exception as e:
+            error_msg = f"Critical error processing {archive_name}: {str(e)}"
+            with CategoryProcessor._log_lock:
+                self.error_handler.log_error(error_msg, 'unknown')
+            success, files_downloaded, files_failed, errors = False, 0, 1, [error_msg]
+        
+        processing_time = time.monotonic() - start_time
+        
+        return {
+            'archive_name': archive_name,
+            'category': category,
+            'success': success,
+            'files_downloaded': files_downloaded,
+            'files_failed': files_failed,
+            'errors': errors,
+            'processing_time': processing_time
+        }
+    
+    @staticmethod
+    def _in_event_loop() -> bool:
+        """Check whether we are already running inside an asyncio event loop."""
+        try:
+            asyncio.get_running_loop()
+            return True
+        except RuntimeError:
+            return False
     
     def should_run_scheduled_processing(self) -> bool:
         """Determine if scheduled processing should run based on current time."""
@@ -335,13 +443,24 @@ class WorkflowExecutor:
             # Manual runs process all archives
             return all_archives
         
-        # Scheduled runs only process active publications (newspaper category)
-        filtered_archives = {}
-        
-        for category, archive_list in all_archives.items():
-            if category == 'newspaper':
-                # Only include active newspapers in scheduled runs
-                filtered_archives[category] = archive_list
-            # old-newspaper category is excluded from scheduled runs
-        
-        return filtered_archives
\ No newline at end of file
+        # Scheduled runs only process active publications
+        scheduled = self._get_scheduled_categories()
+        return {
+            category: archive_list
+            for category, archive_list in all_archives.items()
+            if category in scheduled
+        }
+    
+    def _get_scheduled_categories(self) -> Set[str]:
+        """Return the categories processed in scheduled runs, asking each processor once."""
+        if self._scheduled_categories is None:
+            scheduled = set()
+            for category in self.factory.SUPPORTED_CATEGORIES:
+                try:
+                    processor = self.factory.get(category)
+                except ValueError:
+                    continue
+                if processor.should_process_in_scheduled_run():
+                    scheduled.add(category)
+            self._scheduled_categories = scheduled
+        return self._scheduled_categories
@@ -10,12 +10,46 @@ import yaml
 import re
 import os
 import html
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
-from urllib.parse import urlparse
+import sys
+from typing import Dict, List, Any, Optional, Tuple, Iterator, TextIO, Callable
+from concurrent.futures import ProcessPoolExecutor, Future
+from collections import defaultdict
+from dataclasses import dataclass, fields, replace
+from urllib.parse import urlsplit, SplitResult
+from yaml.composer import Composer
+from yaml.events import (
+    StreamEndEvent, MappingStartEvent, MappingEndEvent,
+    SequenceStartEvent, SequenceEndEvent
+)
 
 from error_handler import WorkflowLogger, ErrorCategory, create_workflow_logger
 
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+
+class _StreamingYamlLoader(YamlLoader):
+    """Loader that can compose one node at a time from the event stream.
+    
+    The C loader only composes whole documents, so the node-level methods are
+    borrowed from the pure-Python Composer; they rely solely on the event API.
+    """
+    compose_node = Composer.compose_node
+    compose_scalar_node = Composer.compose_scalar_node
+    compose_sequence_node = Composer.compose_sequence_node
+    compose_mapping_node = Composer.compose_mapping_node
+    
+    def __init__(self, stream):
+        super().__init__(stream)
+        self.anchors = {}
+    
+    def load_next_node(self) -> Any:
+        """Compose and construct the next node, keeping nothing but the result."""
+        return self.construct_document(self.compose_node(None, None))
+
 # Import crawler modules
 try:
     from directory_crawler import DirectoryCrawler, CrawlConfig
@@ -24,8 +58,43 @@ try:
 except ImportError:
     CRAWLER_AVAILABLE = False
 
+# Precompiled patterns used by string and folder name sanitization
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_FOLDER_INVALID_CHARS_RE = re.compile(r'[^\w\s-]|[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
+_FOLDER_SEPARATORS_RE = re.compile(r'[\s-]+')
 
-@dataclass
+# Any character the sanitization pipeline could change: HTML specials,
+# control characters, ':' and '=' (needed by every dangerous pattern other
+# than tags), and whitespace that is not a single space
+_NEEDS_SANITIZE_RE = re.compile(r'[<>&"\'\x00-\x1f\x7f:=]|[^\S ]| {2}')
+
+# Anchored URL structure check. Each host label (1-63 characters, no leading
+# or trailing hyphen) ends at a literal dot, so the pattern matches in linear
+# time, and the path excludes the same characters that URL security
+# validation rejects.
+_URL_RE = re.compile(
+    r'^(?i:https?)://'
+    r'(?:(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+[A-Za-z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/|[/?][^\s<>"\'\x00-\x1f\x7f]+)?$'
+)
+
+# URL security checks, each done in a single scan of the URL
+_DANGEROUS_URL_RE = re.compile(
+    r'javascript:|data:|vbscript:|file:|ftp:|<script|onclick|onload|onerror',
+    re.IGNORECASE
+)
+_SUSPICIOUS_URL_CHARS_RE = re.compile(r'[<>"\'\x00-\x1f\x7f]')
+
+# Persian (group 1) or Gregorian (group 2) year candidates. The lookahead
+# makes finditer try every position, so overlapping candidates are all seen.
+_YEAR_RE = re.compile(r'(?=(1[3-4]\d{2})|((?:19|20|21)\d{2}))')
+
+
+@dataclass(slots=True, frozen=True)
 class Archive:
     """Data class representing an archive configuration."""
     title_fa: str
@@ -35,6 +104,10 @@ class Archive:
     years: Dict[str, List[str]]
 
 
+# Archive field names in declaration order, which is also the YAML key order
+ARCHIVE_FIELDS = tuple(field.name for field in fields(Archive))
+
+
 class ConfigurationError(Exception):
     """Custom exception for configuration-related errors."""
     pass
@@ -53,6 +126,12 @@ class ConfigParser:
     MAX_YEARS_PER_ARCHIVE = 100
     MAX_ARCHIVES = 100
     
+    # Archive entries beyond this many are validated in worker processes
+    PARALLEL_VALIDATION_THRESHOLD = 8
+    
+    # Hosts that configured URLs may never point at
+    LOCAL_HOSTS = frozenset({'localhost', '127.0.0.1', '0.0.0.0', '::1'})
+    
     # Dangerous patterns to sanitize
     DANGEROUS_PATTERNS = [
         r'<script[^>]*>.*?</script>',  # Script tags
@@ -65,6 +144,12 @@ class ConfigParser:
         r'<embed[^>]*>.*?</embed>',   # Embed tags
     ]
     
+    # All dangerous patterns combined so sanitization is a single regex pass
+    _DANGEROUS_RE = re.compile(
+        '|'.join(f'(?:{pattern})' for pattern in DANGEROUS_PATTERNS),
+        re.IGNORECASE | re.DOTALL
+    )
+    
     def __init__(self, config_path: str = 'urls.yml', logger: Optional[WorkflowLogger] = None):
         """Initialize the configuration parser.
         
@@ -74,68 +159,107 @@ class ConfigParser:
         """
         self.config_path = config_path
         self.logger = logger or create_workflow_logger("config_parser")
+        
+        # Validated archives from the last parse, keyed by file identity
+        self._cache_key: Optional[Tuple[str, int, int]] = None
+        self._cached_archives: List[Archive] = []
+        
+        # URL pattern detector shared by all crawl checks, created on first use
+        self._detector = None
+    
+    @property
+    def detector(self) -> Optional['URLPatternDetector']:
+        """Shared URLPatternDetector, or None when crawler modules are unavailable."""
+        if self._detector is None and CRAWLER_AVAILABLE:
+            self._detector = URLPatternDetector()
+        return self._detector
     
     def parse_configuration(self) -> List[Archive]:
         """Parse and validate the urls.yml configuration file.
         
+        The validated result is reused while the file's path, modification
+        time and size are unchanged.
+        
         Returns:
             List of Archive objects
             
         Raises:
             ConfigurationError: If configuration is invalid or file cannot be read
         """
+        cache_key = self._get_cache_key()
+        if cache_key is None or cache_key != self._cache_key:
+            self._cached_archives = self._load_and_validate()
+            self._cache_key = cache_key
+        
+        # Hand out copies so callers can modify years without touching the cache
+        return [
+            replace(archive, years={year: list(urls) for year, urls in archive.years.items()})
+            for archive in self._cached_archives
+        ]
+    
+    def _get_cache_key(self) -> Optional[Tuple[str, int, int]]:
+        """Return (path, mtime_ns, size) for the configuration file, or None if it cannot be stat'ed."""
+        try:
+            stat = os.stat(self.config_path)
+        except OSError:
+            return None
+        return self.config_path, stat.st_mtime_ns, stat.st_size
+    
+    def _load_and_validate(self) -> List[Archive]:
+        """Read the configuration file and validate every archive entry.
+        
+        Returns:
+            List of Archive objects
+            
+        Raises:
+            ConfigurationError: If configuration is invalid or file cannot be read
+        """
+        archives = []
+        pending: List[Tuple[int, Future]] = []
+        pool: Optional[ProcessPoolExecutor] = None
+        
+        # Archive entries are constructed and validated one at a time as the
+        # file streams in, so the first invalid entry aborts the parse early.
+        # Past the threshold, validation moves to worker processes and overlaps
+        # with parsing the rest of the file.
         try:
             with open(self.config_path, 'r', encoding='utf-8') as file:
-                config_data = yaml.safe_load(file)
+                for i, archive_data in enumerate(self._iter_archive_entries(file)):
+                    # Check overall limits
+                    if i >= self.MAX_ARCHIVES:
+                        self._raise_configuration_error(
+                            f"Too many archives (more than {self.MAX_ARCHIVES}), "
+                            f"maximum allowed: {self.MAX_ARCHIVES}"
+                        )
+                    
+                    if i < self.PARALLEL_VALIDATION_THRESHOLD:
+                        archives.append(self._validate_indexed_entry(
+                            i, lambda: self.validate_archive_entry(archive_data, i)
+                        ))
+                    else:
+                        if pool is None:
+                            pool = ProcessPoolExecutor()
+                        pending.append((i, pool.submit(_validate_archive_static, i, archive_data)))
                 
             self.logger.log_success(
                 f"Successfully loaded configuration file",
                 file_path=self.config_path
             )
             
+            for i, future in pending:
+                archives.append(self._validate_indexed_entry(i, future.result))
+            
+        except ConfigurationError:
+            raise
         except FileNotFoundError as e:
-            error = ConfigurationError(f"Configuration file not found: {self.config_path}")
-            self.logger.log_error(error, ErrorCategory.CONFIGURATION, file_path=self.config_path)
-            raise error
+            self._raise_configuration_error(f"Configuration file not found: {self.config_path}")
         except yaml.YAMLError as e:
-            error = ConfigurationError(f"Invalid YAML syntax: {e}")
-            self.logger.log_error(error, ErrorCategory.CONFIGURATION, file_path=self.config_path)
-            raise error
+            self._raise_configuration_error(f"Invalid YAML syntax: {e}")
         except Exception as e:
-            error = ConfigurationError(f"Error reading configuration file: {e}")
-            self.logger.log_error(error, ErrorCategory.CONFIGURATION, file_path=self.config_path)
-            raise error
-        
-        if not isinstance(config_data, dict) or 'archives' not in config_data:
-            error = ConfigurationError("Configuration must contain 'archives' key")
-            self.logger.log_error(error, ErrorCategory.CONFIGURATION, file_path=self.config_path)
-            raise error
-        
-        # Check overall limits
-        if len(config_data['archives']) > self.MAX_ARCHIVES:
-            error = ConfigurationError(f"Too many archives ({len(config_data['archives'])}), maximum allowed: {self.MAX_ARCHIVES}")
-            self.logger.log_error(error, ErrorCategory.CONFIGURATION, file_path=self.config_path)
-            raise error
-        
-        archives = []
-        for i, archive_data in enumerate(config_data['archives']):
-            try:
-                archive = self.validate_archive_entry(archive_data, i)
-                archives.append(archive)
-                
-                self.logger.log_success(
-                    f"Validated archive entry: {archive.title_fa}",
-                    context={"archive_index": i, "folder": archive.folder, "category": archive.category}
-                )
-                
-            except ConfigurationError as e:
-                error = ConfigurationError(f"Archive entry {i}: {e}")
-                self.logger.log_error(
-                    error, ErrorCategory.CONFIGURATION,
-                    file_path=self.config_path,
-                    context={"archive_index": i}
-                )
-                raise error
+            self._raise_configuration_error(f"Error reading configuration file: {e}")
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
         
         self.logger.log_success(
             f"Successfully parsed {len(archives)} archive entries",
@@ -145,6 +269,75 @@ class ConfigParser:
         
         return archives
     
+    def _iter_archive_entries(self, file: TextIO) -> Iterator[Any]:
+        """Yield the raw entries of the top-level 'archives' list one by one.
+        
+        Args:
+            file: Open configuration file
+            
+        Yields:
+            Each archive entry as plain Python data
+            
+        Raises:
+            ConfigurationError: If the document has no 'archives' list
+            yaml.YAMLError: If the YAML is malformed
+        """
+        loader = _StreamingYamlLoader(file)
+        try:
+            found_archives = False
+            loader.get_event()  # StreamStart
+            
+            if not loader.check_event(StreamEndEvent):
+                loader.get_event()  # DocumentStart
+                
+                if loader.check_event(MappingStartEvent):
+                    loader.get_event()
+                    while not loader.check_event(MappingEndEvent):
+                        key = loader.load_next_node()
+                        
+                        if key != 'archives':
+                            loader.compose_node(None, None)  # Skip the value
+                            continue
+                        
+                        found_archives = True
+                        if not loader.check_event(SequenceStartEvent):
+                            self._raise_configuration_error("Configuration 'archives' must be a list")
+                        
+                        loader.get_event()
+                        while not loader.check_event(SequenceEndEvent):
+                            yield loader.load_next_node()
+                        loader.get_event()
+            
+            if not found_archives:
+                self._raise_configuration_error("Configuration must contain 'archives' key")
+        finally:
+            loader.dispose()
+    
+    def _validate_indexed_entry(self, index: int, validate: Callable[[], Archive]) -> Archive:
+        """Run one archive entry's validation, logging the outcome against its index."""
+        try:
+            archive = validate()
+        except ConfigurationError as e:
+            error = ConfigurationError(f"Archive entry {index}: {e}")
+            self.logger.log_error(
+                error, ErrorCategory.CONFIGURATION,
+                file_path=self.config_path,
+                context={"archive_index": index}
+            )
+            raise error
+        
+        self.logger.log_success(
+            f"Validated archive entry: {archive.title_fa}",
+            context={"archive_index": index, "folder": archive.folder, "category": archive.category}
+        )
+        return archive
+    
+    def _raise_configuration_error(self, message: str) -> None:
+        """Log a configuration error against the config file and raise it."""
+        error = ConfigurationError(message)
+        self.logger.log_error(error, ErrorCategory.CONFIGURATION, file_path=self.config_path)
+        raise error
+    
     def validate_archive_entry(self, archive_data: Dict[str, Any], index: int) -> Archive:
         """Validate a single archive entry with comprehensive security checks.
         
@@ -251,20 +444,15 @@ class ConfigParser:
                 if len(url_cleaned) > self.MAX_STRING_LENGTH:
                     raise ConfigurationError(f"URL {i+1} in year {year} exceeds maximum length of {self.MAX_STRING_LENGTH} characters")
                 
-                # Basic URL format validation
-                if not self._is_valid_url(url_cleaned):
-                    raise ConfigurationError(f"Invalid URL format in year {year}: {url_cleaned}")
+                # URL format and security validation
+                self._check_url(url_cleaned, year)
                 
-                # Security validation
-                is_secure, security_error = self._validate_url_security(url_cleaned)
-                if not is_secure:
-                    raise ConfigurationError(f"URL security validation failed in year {year}: {security_error}")
-                
-                validated_urls.append(url_cleaned)
+                # Interned so duplicate URLs across years and archives share one object
+                validated_urls.append(sys.intern(url_cleaned))
                 total_urls += 1
             
             if validated_urls:  # Only include years with URLs
-                validated_years[year] = validated_urls
+                validated_years[sys.intern(year)] = validated_urls
         
         return validated_years
     
@@ -277,7 +465,8 @@ class ConfigParser:
         Returns:
             True if valid year format, False otherwise
         """
-        return bool(re.match(r'^\d{4}$', year))
+        # isdecimal() accepts exactly the characters matched by \d
+        return isinstance(year, str) and len(year) == 4 and year.isdecimal()
     
     def _is_valid_url(self, url: str) -> bool:
         """Basic URL validation.
@@ -288,16 +477,11 @@ class ConfigParser:
         Returns:
             True if URL appears valid, False otherwise
         """
-        # Basic URL pattern matching
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-            r'localhost|'  # localhost...
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+        # Cheap prefix check before running the regex
+        if not url[:8].lower().startswith(('http://', 'https://')):
+            return False
         
-        return bool(url_pattern.match(url))
+        return _URL_RE.match(url) is not None
     
     def _sanitize_string_input(self, input_str: str, field_name: str, max_length: int = None) -> str:
         """
@@ -317,19 +501,21 @@ class ConfigParser:
         if not isinstance(input_str, str):
             raise ConfigurationError(f"{field_name} must be a string")
         
-        # Remove dangerous patterns
-        sanitized = input_str
-        for pattern in self.DANGEROUS_PATTERNS:
-            sanitized = re.sub(pattern, '', sanitized, flags=re.IGNORECASE)
-        
-        # HTML escape to prevent HTML injection
-        sanitized = html.escape(sanitized)
-        
-        # Remove control characters except newlines and tabs
-        sanitized = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', sanitized)
-        
-        # Normalize whitespace
-        sanitized = re.sub(r'\s+', ' ', sanitized).strip()
+        if _NEEDS_SANITIZE_RE.search(input_str) is None:
+            # Clean input: the pipeline below would only strip the ends
+            sanitized = input_str.strip()
+        else:
+            # Remove dangerous patterns
+            sanitized = self._DANGEROUS_RE.sub('', input_str)
+            
+            # HTML escape to prevent HTML injection
+            sanitized = html.escape(sanitized)
+            
+            # Remove control characters except newlines and tabs
+            sanitized = _CONTROL_CHARS_RE.sub('', sanitized)
+            
+            # Normalize whitespace
+            sanitized = _WHITESPACE_RE.sub(' ', sanitized).strip()
         
         # Check length
         max_len = max_length or self.MAX_STRING_LENGTH
@@ -354,48 +540,75 @@ class ConfigParser:
         """
         try:
             # Basic format validation
-            parsed = urlparse(url)
+            parsed = urlsplit(url)
             
             # Check scheme
             if parsed.scheme not in ['http', 'https']:
                 return False, f"URL scheme '{parsed.scheme}' not allowed (only http/https)"
             
-            # Check for dangerous patterns in URL
-            url_lower = url.lower()
-            dangerous_url_patterns = [
-                'javascript:',
-                'data:',
-                'vbscript:',
-                'file:',
-                'ftp:',
-                '<script',
-                'onclick',
-                'onload',
-                'onerror',
-            ]
-            
-            for pattern in dangerous_url_patterns:
-                if pattern in url_lower:
-                    return False, f"URL contains dangerous pattern: {pattern}"
-            
             # Check for suspicious characters
-            if re.search(r'[<>"\'\x00-\x1f\x7f]', url):
+            if _SUSPICIOUS_URL_CHARS_RE.search(url):
                 return False, "URL contains suspicious characters"
             
-            # Check hostname
-            if not parsed.hostname:
-                return False, "URL must have a valid hostname"
-            
-            # Check for private/local addresses
-            hostname = parsed.hostname.lower()
-            if hostname in ['localhost', '127.0.0.1', '0.0.0.0', '::1']:
-                return False, f"Access to local address '{hostname}' not allowed"
+            safety_error = self._check_url_safety(url, parsed)
+            if safety_error:
+                return False, safety_error
             
             return True, None
             
         except Exception as e:
             return False, f"URL validation error: {e}"
     
+    def _check_url(self, url: str, year: str) -> None:
+        """Validate URL format and security, raising on the first problem.
+        
+        Args:
+            url: Stripped URL string to validate
+            year: Year the URL belongs to, for error reporting
+            
+        Raises:
+            ConfigurationError: If URL is malformed or unsafe
+        """
+        if not self._is_valid_url(url):
+            raise ConfigurationError(f"Invalid URL format in year {year}: {url}")
+        
+        # _is_valid_url already enforces the http(s) scheme and rejects
+        # suspicious characters, so only the remaining checks are needed
+        try:
+            safety_error = self._check_url_safety(url, urlsplit(url))
+        except Exception as e:
+            safety_error = f"URL validation error: {e}"
+        
+        if safety_error:
+            raise ConfigurationError(f"URL security validation failed in year {year}: {safety_error}")
+    
+    def _check_url_safety(self, url: str, parsed: SplitResult) -> Optional[str]:
+        """Check URL for dangerous patterns and disallowed hosts.
+        
+        Args:
+            url: URL to check
+            parsed: Parsed form of the URL
+            
+        Returns:
+            Error message, or None if the URL is safe
+        """
+        # Check for dangerous patterns in URL
+        match = _DANGEROUS_URL_RE.search(url)
+        if match:
+            return f"URL contains dangerous pattern: {match.group(0).lower()}"
+        
+        # Check hostname
+        # SplitResult.hostname is already lower-cased
+        hostname = parsed.hostname
+        if not hostname:
+            return "URL must have a valid hostname"
+        
+        # Check for private/local addresses
+        if hostname in self.LOCAL_HOSTS:
+            return f"Access to local address '{hostname}' not allowed"
+        
+        return None
+    
     def sanitize_folder_name(self, folder_name: str) -> str:
         """Sanitize folder name for filesystem compatibility.
         
@@ -405,25 +618,15 @@ class ConfigParser:
         Returns:
             Sanitized folder name safe for filesystem use
         """
-        # First apply general string sanitization
-        try:
-            sanitized = self._sanitize_string_input(folder_name, "folder name", 200)
-        except ConfigurationError:
-            # If general sanitization fails, try more aggressive cleaning
-            sanitized = folder_name
-        
-        # Remove or replace filesystem-invalid characters
-        # Keep alphanumeric, hyphens, underscores, and spaces
-        sanitized = re.sub(r'[^\w\s-]', '', sanitized)
-        
-        # Replace spaces with hyphens
-        sanitized = re.sub(r'\s+', '-', sanitized)
+        # Drop filesystem-invalid and control characters; keep word
+        # characters, hyphens and whitespace. HTML escaping and dangerous
+        # pattern removal are skipped: once only these characters remain the
+        # name is inert, and escaping would leave entity names like 'amp'.
+        sanitized = _FOLDER_INVALID_CHARS_RE.sub('', folder_name)
         
-        # Remove multiple consecutive hyphens
-        sanitized = re.sub(r'-+', '-', sanitized)
-        
-        # Remove leading/trailing hyphens
-        sanitized = sanitized.strip('-')
+        # Collapse runs of whitespace and hyphens into single hyphens and
+        # remove leading/trailing hyphens
+        sanitized = _FOLDER_SEPARATORS_RE.sub('-', sanitized).strip('-')
         
         # Ensure it's not empty
         if not sanitized:
@@ -446,20 +649,17 @@ class ConfigParser:
         """
         config_data = {
             'archives': [
-                {
-                    'title_fa': archive.title_fa,
-                    'folder': archive.folder,
-                    'category': archive.category,
-                    'description': archive.description,
-                    'years': archive.years
-                }
+                {name: getattr(archive, name) for name in ARCHIVE_FIELDS}
                 for archive in archives
             ]
         }
         
+        # The file is about to change, so drop the parsed result
+        self._cache_key = None
+        
         try:
             with open(self.config_path, 'w', encoding='utf-8') as file:
-                yaml.dump(config_data, file, default_flow_style=False, 
+                yaml.dump(config_data, file, Dumper=YamlDumper, default_flow_style=False,
                          allow_unicode=True, sort_keys=False)
                          
             self.logger.log_success(
@@ -484,9 +684,11 @@ class ConfigParser:
             Modified Archive object with successful URLs removed
         """
         updated_years = {}
+        successful = (successful_urls if isinstance(successful_urls, (set, frozenset))
+                      else frozenset(successful_urls))
         
         for year, urls in archive.years.items():
-            remaining_urls = [url for url in urls if url not in successful_urls]
+            remaining_urls = [url for url in urls if url not in successful]
             if remaining_urls:  # Only keep years that still have URLs
                 updated_years[year] = remaining_urls
         
@@ -565,8 +767,7 @@ class ConfigParser:
             return False
         
         try:
-            detector = URLPatternDetector()
-            analysis = detector.analyze_url(url, check_content=False)
+            analysis = self.detector.analyze_url(url, check_content=False)
             
             return analysis.url_type in [
                 URLType.DIRECTORY_LISTING,
@@ -591,7 +792,7 @@ class ConfigParser:
         """
         try:
             # Analyze URL to get optimal crawl config
-            detector = URLPatternDetector()
+            detector = self.detector
             analysis = detector.analyze_url(url, check_content=True)
             
             # Create crawl config
@@ -604,8 +805,8 @@ class ConfigParser:
             )
             
             # Perform crawling
-            crawler = DirectoryCrawler(config, self.logger)
-            result = crawler.crawl_directory(url)
+            with DirectoryCrawler(config, self.logger) as crawler:
+                result = crawler.crawl_directory(url)
             
             if result.discovered_files:
                 self.logger.log_success(
@@ -641,24 +842,24 @@ class ConfigParser:
         Returns:
             Dictionary mapping years to URL lists
         """
-        year_groups = {}
+        year_groups = defaultdict(list)
         ungrouped_urls = []
+        latest_year = None
         
         for url in urls:
             year = self._extract_year_from_url(url)
             if year:
                 year_str = str(year)
-                if year_str not in year_groups:
-                    year_groups[year_str] = []
                 year_groups[year_str].append(url)
+                if latest_year is None or year_str > latest_year:
+                    latest_year = year_str
             else:
                 ungrouped_urls.append(url)
         
         # Add ungrouped URLs to the most recent year or create a default year
         if ungrouped_urls:
-            if year_groups:
+            if latest_year is not None:
                 # Add to the most recent year
-                latest_year = max(year_groups.keys())
                 year_groups[latest_year].extend(ungrouped_urls)
             else:
                 # Create default year
@@ -666,7 +867,7 @@ class ConfigParser:
                 current_year = str(datetime.datetime.now().year)
                 year_groups[current_year] = ungrouped_urls
         
-        return year_groups
+        return dict(year_groups)
     
     def _extract_year_from_url(self, url: str) -> Optional[int]:
         """
@@ -678,23 +879,46 @@ class ConfigParser:
         Returns:
             Detected year or None
         """
-        # Persian/Jalali years (1300-1450)
-        persian_year_match = re.search(r'1[3-4]\d{2}', url)
-        if persian_year_match:
-            year = int(persian_year_match.group())
-            if 1300 <= year <= 1450:
-                return year
+        persian_year = None
+        gregorian_year = None
+        
+        # Single scan; only the first candidate of each calendar is considered
+        for match in _YEAR_RE.finditer(url):
+            persian, gregorian = match.groups()
+            if persian and persian_year is None:
+                persian_year = int(persian)
+                # Persian/Jalali years (1300-1450) take precedence
+                if persian_year <= 1450:
+                    return persian_year
+            elif gregorian and gregorian_year is None:
+                gregorian_year = int(gregorian)
+            
+            if persian_year is not None and gregorian_year is not None:
+                break
         
         # Gregorian years (1900-2100)
-        gregorian_year_match = re.search(r'(19|20|21)\d{2}', url)
-        if gregorian_year_match:
-            year = int(gregorian_year_match.group())
-            if 1900 <= year <= 2100:
-                return year
+        if gregorian_year is not None and gregorian_year <= 2100:
+            return gregorian_year
         
         return None
 
 
+# Parser used by validation worker processes, created once per process
+_worker_parser: Optional[ConfigParser] = None
+
+
+def _validate_archive_static(index: int, archive_data: Any) -> Archive:
+    """Validate one archive entry in a worker process.
+    
+    validate_archive_entry does not log, so the worker's parser gets a plain
+    logger and all reporting stays in the parent process.
+    """
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = ConfigParser(logger=create_workflow_logger("config_parser_worker"))
+    return _worker_parser.validate_archive_entry(archive_data, index)
+
+
 def main():
     """Main function for testing the configuration parser."""
     import sys
@@ -15,21 +15,124 @@ Features:
 """
 
 import re
+import json
 import time
+import html.parser
+import asyncio
+import importlib.util
 import requests
-from urllib.parse import urljoin, urlparse, unquote
-from typing import List, Dict, Set, Optional, Tuple
-from dataclasses import dataclass
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib.parse import urljoin, urlparse, unquote, urlsplit, urlunsplit, parse_qsl, urlencode
+from typing import List, Dict, Set, Optional, Tuple, Iterator, TextIO
+from dataclasses import dataclass, field
 from pathlib import Path
 import logging
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from error_handler import ErrorHandler
 
+# HTTP/2 lets concurrent listings on one archive server share a single
+# connection; httpx only negotiates it when the h2 package is installed
+try:
+    import httpx
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Errors raised by the HTTP client for a failed fetch
+if HTTP2_AVAILABLE:
+    FETCH_ERRORS = (requests.exceptions.RequestException, httpx.HTTPError)
+else:
+    FETCH_ERRORS = (requests.exceptions.RequestException,)
+
+
+def _supported_encodings() -> str:
+    """Build an Accept-Encoding value from the decoders installed for the HTTP clients."""
+    encodings = ['gzip', 'deflate']
+    
+    # requests (urllib3) and httpx both decode brotli and zstd through these packages
+    if importlib.util.find_spec('brotli') or importlib.util.find_spec('brotlicffi'):
+        encodings.append('br')
+    if importlib.util.find_spec('zstandard'):
+        encodings.append('zstd')
+    
+    return ', '.join(encodings)
+
+
+# Listings are repetitive text, so advertise the strongest compression we can decode
+ACCEPT_ENCODING = _supported_encodings()
+
+# JSON indexes (e.g. S3-style bucket listings) decode much faster with orjson
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Directory listings can hold thousands of links, so prefer a C HTML parser:
+# selectolax if installed, else BeautifulSoup on lxml, else a streaming
+# extractor on the stdlib tokenizer
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Only <a href> tags are needed, so BeautifulSoup skips building the rest of the tree
+_LINK_STRAINER = SoupStrainer('a', href=True)
+
+# Characters of HTML fed to the streaming link extractor at a time
+_HTML_CHUNK_SIZE = 64 * 1024
+
+# Precompiled patterns for link classification and year extraction
+_FILE_RE = re.compile(r'\.(?:pdf|docx?|txt|html?|rtf|odt)$')
+_DIRECTORY_RE = re.compile(
+    r'^\d{4}/?$'  # Year directories like "1377", "1378/"
+    r'|^[a-zA-Z]+-\d{4}/?$'  # Archive-year like "neshat-1377/"
+    r'|^(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)'  # Month names
+    r'|^(?:فروردین|اردیبهشت|خرداد|تیر|مرداد|شهریور|مهر|آبان|آذر|دی|بهمن|اسفند)',  # Persian months
+    re.IGNORECASE
+)
+# Links that never lead to files: anchors, non-HTTP schemes and Apache
+# mod_autoindex sort links (?C=N;O=D), which just re-list the same directory
+_SKIP_LINK_PREFIXES = ('#', 'mailto:', 'javascript:', 'tel:', 'data:', '?C=')
+_PARENT_LINKS = frozenset({'..', '../', './'})
+_DIRECTORY_INDICATORS = ('folder', 'dir', 'directory', '[dir]', '📁')
+_SLASHES_RE = re.compile(r'/{2,}')
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+# Persian or Gregorian year candidate at each position (lookahead, so overlaps are kept)
+_YEAR_RE = re.compile(r'(?=(?P<persian>1[3-4]\d{2})|(?P<gregorian>(?:19|20|21)\d{2}))')
+
+
+# Per-URL string work is memoized: the same link is classified, checked
+# against the blocked patterns and canonicalized in quick succession
+URL_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _url_features(url: str) -> Tuple[str, str, str]:
+    """Return the lowercased URL, unquoted path and unquoted query of a URL."""
+    parsed = urlparse(url)
+    return url.lower(), unquote(parsed.path).lower(), unquote(parsed.query).lower()
+
 
 @dataclass
 class CrawlResult:
-    """Result of directory crawling operation."""
+    """
+    Result of directory crawling operation.
+    
+    When the crawl streamed its files to CrawlConfig.output_file,
+    discovered_files is empty and total_files counts the lines written.
+    """
     base_url: str
     discovered_files: List[str]
     discovered_directories: List[str]
@@ -47,42 +150,176 @@ class CrawlConfig:
     max_total_files: int = 10000
     timeout: int = 30
     delay_between_requests: float = 1.0
+    max_concurrent_requests: int = 8
+    per_host_concurrency: int = 4
     follow_redirects: bool = True
     allowed_extensions: Set[str] = None
     blocked_patterns: Set[str] = None
     user_agent: str = "Iranian Archive Crawler 1.0"
+    cache_file: Optional[str] = None
+    output_file: Optional[str] = None
+    
+    # allowed_extensions as a tuple, so str.endswith checks them all in one call
+    _extension_suffixes: Tuple[str, ...] = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.allowed_extensions is None:
             self.allowed_extensions = {'.pdf', '.doc', '.docx', '.txt', '.html'}
         if self.blocked_patterns is None:
             self.blocked_patterns = {'admin', 'login', 'auth', 'private', 'secure'}
+        self._extension_suffixes = tuple(self.allowed_extensions)
+
+
+class _LinkExtractor(html.parser.HTMLParser):
+    """Collect (href, text) pairs of <a href> tags without building a document tree."""
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.links: List[Tuple[str, str]] = []
+        self._href: Optional[str] = None
+        self._text: List[str] = []
+    
+    def handle_starttag(self, tag, attrs):
+        if tag == 'a':
+            self._end_link()
+            href = dict(attrs).get('href')
+            if href is not None:
+                self._href = href
+    
+    def handle_endtag(self, tag):
+        if tag == 'a':
+            self._end_link()
+    
+    def handle_data(self, data):
+        if self._href is not None:
+            self._text.append(data)
+    
+    def close(self):
+        super().close()
+        self._end_link()
+    
+    def _end_link(self) -> None:
+        if self._href is not None:
+            self.links.append((self._href, ''.join(self._text)))
+            self._href = None
+            self._text.clear()
 
 
 class DirectoryCrawler:
     """Crawls directory-like URLs to discover downloadable files."""
     
+    # Connection reuse settings. Every new connection costs a DNS lookup and
+    # a handshake, so keep idle connections (and per-host pools) around long
+    # enough to outlast the politeness delay between fetches to one host.
+    POOL_CONNECTIONS = 32      # Number of per-host pools to cache
+    KEEPALIVE_EXPIRY = 60.0    # Seconds an idle connection is kept open
+    
     def __init__(self, config: CrawlConfig = None, error_handler: ErrorHandler = None):
         """Initialize the directory crawler."""
         self.config = config or CrawlConfig()
         self.error_handler = error_handler or ErrorHandler()
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': self.config.user_agent,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        })
+        self.session = self._create_session()
+        
+        # All blocked patterns in one alternation, so a URL is scanned once
+        self._blocked_re: Optional[re.Pattern] = None
+        if self.config.blocked_patterns:
+            self._blocked_re = re.compile('|'.join(map(re.escape, self.config.blocked_patterns)))
+        
+        # Politeness is enforced per host, so other hosts never wait on it
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._host_next_fetch: Dict[str, float] = {}
         
         # Tracking
         self.visited_urls: Set[str] = set()
         self.discovered_files: List[str] = []
         self.discovered_directories: List[str] = []
+        self._discovered_file_set: Set[str] = set()
+        self._discovered_directory_set: Set[str] = set()
+        self._file_count = 0
+        self._cap_reached = asyncio.Event()
+        self._output: Optional[TextIO] = None
         self.errors: List[str] = []
         
         # Setup logging
         self.logger = logging.getLogger(__name__)
+        
+        # Validators and children of fetched listings, keyed by canonical URL,
+        # so unchanged listings can be revalidated with a conditional GET
+        self._listing_cache: Dict[str, Dict[str, any]] = self._load_listing_cache()
+    
+    def _create_session(self):
+        """
+        Create the HTTP session shared by all fetches of this crawler.
+        
+        Returns:
+            httpx.Client speaking HTTP/2 when available, otherwise requests.Session
+        """
+        headers = {
+            'User-Agent': self.config.user_agent,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'Accept-Encoding': ACCEPT_ENCODING,
+        }
+        
+        if HTTP2_AVAILABLE:
+            self._request_options = {
+                'timeout': self.config.timeout,
+                'follow_redirects': self.config.follow_redirects,
+            }
+            # Concurrent requests to one host are multiplexed as HTTP/2 streams
+            limits = httpx.Limits(max_connections=self.config.max_concurrent_requests,
+                                  max_keepalive_connections=self.config.max_concurrent_requests,
+                                  keepalive_expiry=self.KEEPALIVE_EXPIRY)
+            return httpx.Client(http2=True, headers=headers, limits=limits)
+        
+        self._request_options = {
+            'timeout': self.config.timeout,
+            'allow_redirects': self.config.follow_redirects,
+        }
+        session = requests.Session()
+        session.headers.update(headers)
+        
+        # Sibling directories are fetched concurrently, so keep enough
+        # connections alive for every in-flight request
+        adapter = HTTPAdapter(pool_connections=self.POOL_CONNECTIONS,
+                              pool_maxsize=self.config.max_concurrent_requests)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
+    def close(self) -> None:
+        """Close the HTTP session and release pooled connections."""
+        self.session.close()
+    
+    def __enter__(self) -> 'DirectoryCrawler':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def crawl_many(self, base_urls: List[str], max_depth: int = None) -> List[CrawlResult]:
+        """
+        Crawl several directory URLs through this crawler's connection pool.
+        
+        Same-host base URLs reuse the kept-alive connections of the previous
+        crawls, and with output_file set all files go to one output file.
+        
+        Args:
+            base_urls: The base URLs to crawl, in order
+            max_depth: Maximum depth to crawl (overrides config)
+            
+        Returns:
+            One CrawlResult per base URL
+        """
+        if not self.config.output_file:
+            return [self.crawl_directory(base_url, max_depth) for base_url in base_urls]
+        
+        with open(self.config.output_file, 'w', encoding='utf-8') as output:
+            self._output = output
+            try:
+                return [self.crawl_directory(base_url, max_depth) for base_url in base_urls]
+            finally:
+                self._output = None
     
     def crawl_directory(self, base_url: str, max_depth: int = None) -> CrawlResult:
         """
@@ -97,11 +334,14 @@ class DirectoryCrawler:
         """
         start_time = time.time()
         
-        # Reset state
+        # Reset state (the previous result owns the old lists)
         self.visited_urls.clear()
-        self.discovered_files.clear()
-        self.discovered_directories.clear()
-        self.errors.clear()
+        self.discovered_files = []
+        self.discovered_directories = []
+        self._discovered_file_set.clear()
+        self._discovered_directory_set.clear()
+        self._file_count = 0
+        self.errors = []
         
         # Use provided max_depth or config default
         crawl_depth = max_depth or self.config.max_depth
@@ -109,80 +349,262 @@ class DirectoryCrawler:
         self.logger.info(f"Starting directory crawl: {base_url}")
         self.logger.info(f"Max depth: {crawl_depth}, Max files: {self.config.max_total_files}")
         
+        # Stream file URLs to disk as they are found instead of keeping them
+        # (crawl_many opens the output once for all of its crawls)
+        owns_output = self._output is None and bool(self.config.output_file)
+        
         try:
+            if owns_output:
+                self._output = open(self.config.output_file, 'w', encoding='utf-8')
+            
             # Start recursive crawling
-            self._crawl_recursive(base_url, 0, crawl_depth)
+            self._run(self._crawl_async(base_url, crawl_depth))
             
         except Exception as e:
             error_msg = f"Critical crawling error: {str(e)}"
             self.errors.append(error_msg)
             self.error_handler.log_error(error_msg, 'crawler')
         
+        finally:
+            if owns_output and self._output is not None:
+                self._output.close()
+                self._output = None
+        
+        self._save_listing_cache()
         processing_time = time.time() - start_time
         
         # Create result
         result = CrawlResult(
             base_url=base_url,
-            discovered_files=self.discovered_files.copy(),
-            discovered_directories=self.discovered_directories.copy(),
-            total_files=len(self.discovered_files),
+            discovered_files=self.discovered_files,
+            discovered_directories=self.discovered_directories,
+            total_files=self._file_count,
             crawl_depth=crawl_depth,
-            errors=self.errors.copy(),
+            errors=self.errors,
             processing_time=processing_time
         )
         
         self.logger.info(f"Crawl completed: {result.total_files} files, {len(result.discovered_directories)} directories")
         return result
     
-    def _crawl_recursive(self, url: str, current_depth: int, max_depth: int) -> None:
-        """Recursively crawl directories."""
-        # Check limits
-        if current_depth >= max_depth:
+    async def _crawl_async(self, base_url: str, max_depth: int) -> None:
+        """
+        Crawl breadth-first from base_url.
+        
+        Directories wait in a queue served by max_concurrent_requests workers,
+        so concurrency is bounded without holding a stack frame per level.
+        The crawl ends when the queue drains or as soon as max_total_files
+        is reached, cancelling whatever is still queued or in flight.
+        """
+        self._host_semaphores.clear()
+        self._host_next_fetch.clear()
+        self._cap_reached = asyncio.Event()
+        
+        queue: asyncio.Queue = asyncio.Queue()
+        queue.put_nowait((base_url, 0))
+        workers = [
+            asyncio.create_task(self._crawl_worker(queue, max_depth))
+            for _ in range(self.config.max_concurrent_requests)
+        ]
+        
+        drained = asyncio.create_task(queue.join())
+        cap_reached = asyncio.create_task(self._cap_reached.wait())
+        
+        try:
+            await asyncio.wait((drained, cap_reached), return_when=asyncio.FIRST_COMPLETED)
+            if cap_reached.done():
+                self.logger.warning(f"Reached maximum file limit: {self.config.max_total_files}")
+        finally:
+            tasks = [*workers, drained, cap_reached]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _crawl_worker(self, queue: asyncio.Queue, max_depth: int) -> None:
+        """Crawl queued directories and queue the subdirectories they link to."""
+        while True:
+            url, depth = await queue.get()
+            try:
+                for subdirectory in await self._crawl_url(url, depth, max_depth):
+                    queue.put_nowait((subdirectory, depth + 1))
+            except Exception as e:
+                # Keep the worker alive, otherwise queue.join() would never return
+                error_msg = f"Unexpected error crawling {url}: {str(e)}"
+                self.errors.append(error_msg)
+                self.logger.error(error_msg)
+            finally:
+                queue.task_done()
+    
+    async def _wait_for_host(self, host: str) -> None:
+        """Sleep until delay_between_requests has passed since the host's last fetch."""
+        delay = self.config.delay_between_requests
+        if delay <= 0:
             return
         
-        if len(self.discovered_files) >= self.config.max_total_files:
-            self.logger.warning(f"Reached maximum file limit: {self.config.max_total_files}")
+        now = time.monotonic()
+        start = max(now, self._host_next_fetch.get(host, now))
+        
+        # Reserve the slot before sleeping so concurrent fetches queue up behind it
+        self._host_next_fetch[host] = start + delay
+        if start > now:
+            await asyncio.sleep(start - now)
+    
+    @staticmethod
+    def _run(coro) -> None:
+        """Run a coroutine to completion, even when called from inside an event loop."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(coro)
             return
         
-        if url in self.visited_urls:
+        # asyncio.run cannot be nested, so drive the crawl from a helper thread
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pool.submit(asyncio.run, coro).result()
+    
+    def _load_listing_cache(self) -> Dict[str, Dict[str, any]]:
+        """Load the listing cache saved by a previous crawl, if configured."""
+        if not self.config.cache_file:
+            return {}
+        
+        try:
+            with open(self.config.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable crawl cache {self.config.cache_file}: {str(e)}")
+            return {}
+    
+    def _save_listing_cache(self) -> None:
+        """Persist the listing cache for the next crawl, if configured."""
+        if not self.config.cache_file:
             return
         
+        try:
+            with open(self.config.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(self._listing_cache, f, ensure_ascii=False)
+        except OSError as e:
+            self.logger.warning(f"Could not save crawl cache {self.config.cache_file}: {str(e)}")
+    
+    @staticmethod
+    def _conditional_headers(cached_listing: Optional[Dict[str, any]]) -> Optional[Dict[str, str]]:
+        """Build If-None-Match/If-Modified-Since headers from a cached listing."""
+        if not cached_listing:
+            return None
+        
+        headers = {}
+        if cached_listing.get('etag'):
+            headers['If-None-Match'] = cached_listing['etag']
+        if cached_listing.get('last_modified'):
+            headers['If-Modified-Since'] = cached_listing['last_modified']
+        return headers or None
+    
+    def _remember_listing(self, canonical_url: str, response, files: List[str],
+                          subdirectories: List[str], complete: bool) -> None:
+        """
+        Cache a listing's validators and children if the server sent any validators.
+        
+        Listings whose parse stopped early are not cached, since a later 304
+        would replay only the children seen before the cut.
+        """
+        etag = response.headers.get('etag')
+        last_modified = response.headers.get('last-modified')
+        
+        if complete and (etag or last_modified):
+            self._listing_cache[canonical_url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'files': files,
+                'directories': subdirectories,
+            }
+        else:
+            self._listing_cache.pop(canonical_url, None)
+    
+    def _fetch(self, url: str, headers: Optional[Dict[str, str]] = None):
+        """Fetch a single URL (blocking, run in a worker thread)."""
+        response = self.session.get(url, headers=headers, **self._request_options)
+        # 304 answers a conditional request; httpx treats every non-2xx as an error
+        if response.status_code != 304:
+            response.raise_for_status()
+        
+        self.logger.debug(
+            f"Fetched {url} over {getattr(response, 'http_version', 'HTTP/1.1')}, "
+            f"content-encoding: {response.headers.get('content-encoding', 'identity')}"
+        )
+        
+        return response
+    
+    async def _crawl_url(self, url: str, current_depth: int, max_depth: int) -> List[str]:
+        """
+        Fetch and parse a single directory.
+        
+        Returns:
+            Subdirectory URLs to crawl next
+        """
+        # Check limits
+        if current_depth >= max_depth:
+            return []
+        
+        if self._file_count >= self.config.max_total_files:
+            self.logger.warning(f"Reached maximum file limit: {self.config.max_total_files}")
+            return []
+        
+        canonical_url = self._canonicalize(url)
+        if canonical_url in self.visited_urls:
+            return []
+        
         # Check for blocked patterns
         if self._is_blocked_url(url):
             self.logger.debug(f"Skipping blocked URL: {url}")
-            return
+            return []
         
-        self.visited_urls.add(url)
+        self.visited_urls.add(canonical_url)
+        cached_listing = self._listing_cache.get(canonical_url)
+        subdirectories: List[str] = []
         
         try:
-            # Add delay between requests
-            if self.config.delay_between_requests > 0:
-                time.sleep(self.config.delay_between_requests)
+            host = urlparse(url).netloc
+            host_semaphore = self._host_semaphores.get(host)
+            if host_semaphore is None:
+                host_semaphore = asyncio.Semaphore(self.config.per_host_concurrency)
+                self._host_semaphores[host] = host_semaphore
             
-            # Fetch the page
-            response = self.session.get(
-                url, 
-                timeout=self.config.timeout,
-                allow_redirects=self.config.follow_redirects
-            )
-            response.raise_for_status()
+            async with host_semaphore:
+                # Add delay between requests to the same host
+                await self._wait_for_host(host)
+                
+                # Fetch the page without blocking the other workers
+                response = await asyncio.to_thread(
+                    self._fetch, url, self._conditional_headers(cached_listing)
+                )
             
             # Parse content
             content_type = response.headers.get('content-type', '').lower()
             
-            if 'text/html' in content_type:
+            if response.status_code == 304 and cached_listing:
+                # Unchanged since the last crawl: reuse its children without parsing
+                subdirectories = cached_listing['directories']
+                for file_url in cached_listing['files']:
+                    self._add_file(file_url)
+                for subdirectory in subdirectories:
+                    self._add_directory(subdirectory)
+            elif 'text/html' in content_type:
                 # Parse HTML directory listing
-                self._parse_html_directory(url, response.text, current_depth, max_depth)
+                files, subdirectories, complete = self._parse_html_directory(url, response.text)
+                self._remember_listing(canonical_url, response, files, subdirectories, complete)
             elif 'application/json' in content_type:
                 # Parse JSON directory listing
-                self._parse_json_directory(url, response.json(), current_depth, max_depth)
+                files, subdirectories, complete = self._parse_json_directory(
+                    url, self._decode_json(response)
+                )
+                self._remember_listing(canonical_url, response, files, subdirectories, complete)
             else:
                 # Check if it's a direct file
-                if self._is_downloadable_file(url):
-                    self.discovered_files.append(url)
+                if self._is_downloadable_file(url) and self._add_file(url):
                     self.logger.debug(f"Found direct file: {url}")
         
-        except requests.exceptions.RequestException as e:
+        except FETCH_ERRORS as e:
             error_msg = f"Failed to crawl {url}: {str(e)}"
             self.errors.append(error_msg)
             self.logger.warning(error_msg)
@@ -191,55 +613,174 @@ class DirectoryCrawler:
             error_msg = f"Unexpected error crawling {url}: {str(e)}"
             self.errors.append(error_msg)
             self.logger.error(error_msg)
+        
+        return subdirectories
     
-    def _parse_html_directory(self, base_url: str, html_content: str, current_depth: int, max_depth: int) -> None:
-        """Parse HTML directory listing to find files and subdirectories."""
+    def _parse_html_directory(self, base_url: str, html_content: str) -> Tuple[List[str], List[str], bool]:
+        """
+        Parse HTML directory listing to find files and subdirectories.
+        
+        Returns:
+            Tuple of (file URLs, subdirectory URLs, whether every link was read)
+        """
+        files = []
+        subdirectories = []
+        complete = True
+        
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Find all links
-            links = soup.find_all('a', href=True)
-            
             files_in_directory = 0
             
-            for link in links:
+            for href, link_text in self._iter_links(html_content):
+                if self._cap_reached.is_set():
+                    complete = False
+                    break
+                
                 if files_in_directory >= self.config.max_files_per_directory:
                     self.logger.warning(f"Reached max files per directory limit in {base_url}")
+                    complete = False
                     break
                 
-                href = link.get('href')
-                if not href or href.startswith('#') or href.startswith('mailto:'):
+                # Skip non-navigational and parent directory links
+                if not href or href.startswith(_SKIP_LINK_PREFIXES) or href in _PARENT_LINKS:
                     continue
                 
                 # Resolve relative URLs
                 full_url = urljoin(base_url, href)
                 
-                # Skip parent directory links
-                if href in ['..', '../', './']:
-                    continue
-                
                 # Check if it's a file or directory
                 if self._is_downloadable_file(full_url):
-                    if full_url not in self.discovered_files:
-                        self.discovered_files.append(full_url)
+                    files.append(full_url)
+                    if self._add_file(full_url):
                         files_in_directory += 1
                         self.logger.debug(f"Found file: {full_url}")
                 
-                elif self._looks_like_directory(href, link.text):
-                    if full_url not in self.discovered_directories:
-                        self.discovered_directories.append(full_url)
+                elif self._looks_like_directory(href, link_text):
+                    subdirectories.append(full_url)
+                    if self._add_directory(full_url):
                         self.logger.debug(f"Found directory: {full_url}")
-                        
-                        # Recursively crawl subdirectory
-                        self._crawl_recursive(full_url, current_depth + 1, max_depth)
         
         except Exception as e:
             error_msg = f"Error parsing HTML directory {base_url}: {str(e)}"
             self.errors.append(error_msg)
             self.logger.error(error_msg)
+            complete = False
+        
+        return files, subdirectories, complete
     
-    def _parse_json_directory(self, base_url: str, json_data: dict, current_depth: int, max_depth: int) -> None:
-        """Parse JSON directory listing (for APIs that return JSON)."""
+    def _add_file(self, url: str) -> bool:
+        """
+        Record a discovered file.
+        
+        Returns False if an equivalent URL was already known or the
+        max_total_files limit has been reached.
+        """
+        if self._cap_reached.is_set():
+            return False
+        
+        canonical_url = self._canonicalize(url)
+        if canonical_url in self._discovered_file_set:
+            return False
+        self._discovered_file_set.add(canonical_url)
+        self._file_count += 1
+        if self._output is not None:
+            self._output.write(f"{url}\n")
+        else:
+            self.discovered_files.append(url)
+        
+        # Stop the whole crawl, not just this listing
+        if self._file_count >= self.config.max_total_files:
+            self._cap_reached.set()
+        return True
+    
+    def _add_directory(self, url: str) -> bool:
+        """Record a discovered directory; returns False if an equivalent URL was already known."""
+        canonical_url = self._canonicalize(url)
+        if canonical_url in self._discovered_directory_set:
+            return False
+        self._discovered_directory_set.add(canonical_url)
+        self.discovered_directories.append(url)
+        return True
+    
+    @staticmethod
+    @lru_cache(maxsize=URL_CACHE_SIZE)
+    def _canonicalize(url: str) -> str:
+        """
+        Normalize a URL so equivalent spellings share one dedup key.
+        
+        Lowercases scheme and host, drops default ports, fragments, repeated
+        and trailing slashes, and sorts query parameters. The path keeps its
+        case since servers may treat it case-sensitively.
+        """
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        
+        try:
+            port = parts.port
+        except ValueError:
+            return url
+        
+        host = parts.hostname or ''
+        if ':' in host:
+            host = f'[{host}]'
+        if port is not None and port != _DEFAULT_PORTS.get(scheme):
+            host = f'{host}:{port}'
+        userinfo, _, _ = parts.netloc.rpartition('@')
+        netloc = f'{userinfo}@{host}' if userinfo else host
+        
+        path = _SLASHES_RE.sub('/', parts.path).rstrip('/') or '/'
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+        
+        return urlunsplit((scheme, netloc, path, query, ''))
+    
+    @staticmethod
+    def _iter_links(html_content: str) -> Iterator[Tuple[str, str]]:
+        """Yield (href, text) for every link in an HTML page."""
+        if SELECTOLAX_AVAILABLE:
+            for node in HTMLParser(html_content).css('a[href]'):
+                yield node.attributes.get('href'), node.text()
+        elif LXML_AVAILABLE:
+            soup = BeautifulSoup(html_content, 'lxml', parse_only=_LINK_STRAINER)
+            for link in soup.find_all('a', href=True):
+                yield link.get('href'), link.text
+        else:
+            yield from DirectoryCrawler._stream_links(html_content)
+    
+    @staticmethod
+    def _stream_links(html_content: str, chunk_size: int = _HTML_CHUNK_SIZE) -> Iterator[Tuple[str, str]]:
+        """
+        Yield links while tokenizing the page chunk by chunk.
+        
+        Only the links of the current chunk are held in memory, and parsing
+        stops as soon as the caller stops iterating.
+        """
+        extractor = _LinkExtractor()
+        
+        for start in range(0, len(html_content), chunk_size):
+            extractor.feed(html_content[start:start + chunk_size])
+            yield from extractor.links
+            extractor.links.clear()
+        
+        extractor.close()
+        yield from extractor.links
+    
+    @staticmethod
+    def _decode_json(response):
+        """Decode a JSON response body, with orjson when it is installed."""
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+    
+    def _parse_json_directory(self, base_url: str, json_data: dict) -> Tuple[List[str], List[str], bool]:
+        """
+        Parse JSON directory listing (for APIs that return JSON).
+        
+        Returns:
+            Tuple of (file URLs, subdirectory URLs, whether every item was read)
+        """
+        files = []
+        subdirectories = []
+        complete = True
+        
         try:
             # Handle different JSON structures
             items = []
@@ -254,11 +795,16 @@ class DirectoryCrawler:
                 items = json_data
             
             for item in items:
+                if self._cap_reached.is_set():
+                    complete = False
+                    break
+                
                 if isinstance(item, str):
                     # Simple string list
                     full_url = urljoin(base_url, item)
                     if self._is_downloadable_file(full_url):
-                        self.discovered_files.append(full_url)
+                        files.append(full_url)
+                        self._add_file(full_url)
                 
                 elif isinstance(item, dict):
                     # Object with metadata
@@ -270,53 +816,35 @@ class DirectoryCrawler:
                     item_type = item.get('type', '').lower()
                     
                     if item_type == 'file' or self._is_downloadable_file(full_url):
-                        self.discovered_files.append(full_url)
+                        files.append(full_url)
+                        self._add_file(full_url)
                     elif item_type == 'directory' or item_type == 'folder':
-                        self.discovered_directories.append(full_url)
-                        self._crawl_recursive(full_url, current_depth + 1, max_depth)
+                        subdirectories.append(full_url)
+                        self._add_directory(full_url)
         
         except Exception as e:
             error_msg = f"Error parsing JSON directory {base_url}: {str(e)}"
             self.errors.append(error_msg)
             self.logger.error(error_msg)
+            complete = False
+        
+        return files, subdirectories, complete
     
     def _is_downloadable_file(self, url: str) -> bool:
         """Check if URL points to a downloadable file."""
-        parsed = urlparse(url)
-        path = unquote(parsed.path).lower()
-        query = unquote(parsed.query).lower()
+        _, path, query = _url_features(url)
+        extensions = self.config._extension_suffixes
         
         # Check file extension in path
-        for ext in self.config.allowed_extensions:
-            if path.endswith(ext):
-                return True
+        if path.endswith(extensions):
+            return True
         
         # Check file extension in query parameters (for URLs like ?file=document.pdf)
-        if 'file=' in query:
-            for ext in self.config.allowed_extensions:
-                if ext in query:
-                    return True
-        
-        # Check for common file patterns in path
-        file_patterns = [
-            r'\.pdf$',
-            r'\.docx?$',
-            r'\.txt$',
-            r'\.html?$',
-            r'\.rtf$',
-            r'\.odt$',
-        ]
-        
-        for pattern in file_patterns:
-            if re.search(pattern, path):
-                return True
-        
-        # Check for file patterns in query parameters
-        for pattern in file_patterns:
-            if re.search(pattern, query):
-                return True
+        if 'file=' in query and any(ext in query for ext in extensions):
+            return True
         
-        return False
+        # Check for common file patterns in path and query parameters
+        return bool(_FILE_RE.search(path) or _FILE_RE.search(query))
     
     def _looks_like_directory(self, href: str, link_text: str) -> bool:
         """Check if a link looks like a directory."""
@@ -329,34 +857,16 @@ class DirectoryCrawler:
             return True
         
         # Link text suggests directory
-        directory_indicators = ['folder', 'dir', 'directory', '[DIR]', '📁']
-        for indicator in directory_indicators:
-            if indicator.lower() in link_text.lower():
-                return True
+        link_text = link_text.lower()
+        if any(indicator in link_text for indicator in _DIRECTORY_INDICATORS):
+            return True
         
         # Common directory patterns
-        directory_patterns = [
-            r'^\d{4}/?$',  # Year directories like "1377", "1378/"
-            r'^[a-zA-Z]+-\d{4}/?$',  # Archive-year like "neshat-1377/"
-            r'^(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)',  # Month names
-            r'^(فروردین|اردیبهشت|خرداد|تیر|مرداد|شهریور|مهر|آبان|آذر|دی|بهمن|اسفند)',  # Persian months
-        ]
-        
-        for pattern in directory_patterns:
-            if re.search(pattern, href, re.IGNORECASE):
-                return True
-        
-        return False
+        return bool(_DIRECTORY_RE.search(href))
     
     def _is_blocked_url(self, url: str) -> bool:
         """Check if URL should be blocked from crawling."""
-        url_lower = url.lower()
-        
-        for pattern in self.config.blocked_patterns:
-            if pattern in url_lower:
-                return True
-        
-        return False
+        return self._blocked_re is not None and self._blocked_re.search(_url_features(url)[0]) is not None
     
     def generate_urls_config(self, crawl_result: CrawlResult, archive_info: Dict[str, str]) -> List[Dict[str, any]]:
         """
@@ -369,25 +879,20 @@ class DirectoryCrawler:
         Returns:
             List of dictionaries in urls.yml format, one per newspaper
         """
-        # Group files by newspaper name and year
-        newspapers = {}
-        ungrouped_files = []
+        # Group files by newspaper name and year (ungrouped files by year only),
+        # extracting each file's year exactly once
+        newspapers: Dict[str, Dict[str, List[str]]] = defaultdict(lambda: defaultdict(list))
+        ungrouped_by_year: Dict[str, List[str]] = defaultdict(list)
         
         for file_url in crawl_result.discovered_files:
-            newspaper_name = self._extract_newspaper_name_from_url(file_url)
             year = self._extract_year_from_url(file_url)
+            year_key = str(year) if year else "unknown"
+            newspaper_name = self._extract_newspaper_name_from_url(file_url)
             
             if newspaper_name:
-                if newspaper_name not in newspapers:
-                    newspapers[newspaper_name] = {}
-                
-                year_key = str(year) if year else "unknown"
-                if year_key not in newspapers[newspaper_name]:
-                    newspapers[newspaper_name][year_key] = []
-                
                 newspapers[newspaper_name][year_key].append(file_url)
             else:
-                ungrouped_files.append(file_url)
+                ungrouped_by_year[year_key].append(file_url)
         
         # Create archive configurations for each newspaper
         archive_configs = []
@@ -402,7 +907,7 @@ class DirectoryCrawler:
                 'folder': folder_name,
                 'category': archive_info.get('category', 'old-newspaper'),
                 'description': f'آرشیو نشریه {newspaper_name} - دانلود از {crawl_result.base_url}',
-                'years': years_data,
+                'years': dict(years_data),
                 'source_info': {
                     'base_url': crawl_result.base_url,
                     'crawl_date': time.strftime('%Y-%m-%d %H:%M:%S'),
@@ -413,16 +918,7 @@ class DirectoryCrawler:
             archive_configs.append(archive_config)
         
         # Handle ungrouped files if any
-        if ungrouped_files:
-            # Group ungrouped files by year
-            ungrouped_by_year = {}
-            for file_url in ungrouped_files:
-                year = self._extract_year_from_url(file_url)
-                year_key = str(year) if year else "unknown"
-                if year_key not in ungrouped_by_year:
-                    ungrouped_by_year[year_key] = []
-                ungrouped_by_year[year_key].append(file_url)
-            
+        if ungrouped_by_year:
             # Create a general archive for ungrouped files
             archive_config = {
                 'title_fa': archive_info.get('title_fa', 'آرشیو کراول شده'),
@@ -430,11 +926,11 @@ class DirectoryCrawler:
                 'folder': archive_info.get('folder', 'crawled-archive'),
                 'category': archive_info.get('category', 'old-newspaper'),
                 'description': f'فایل‌های متفرقه - دانلود از {crawl_result.base_url}',
-                'years': ungrouped_by_year,
+                'years': dict(ungrouped_by_year),
                 'source_info': {
                     'base_url': crawl_result.base_url,
                     'crawl_date': time.strftime('%Y-%m-%d %H:%M:%S'),
-                    'total_files': len(ungrouped_files)
+                    'total_files': sum(len(files) for files in ungrouped_by_year.values())
                 }
             }
             archive_configs.append(archive_config)
@@ -456,19 +952,26 @@ class DirectoryCrawler:
     
     def _extract_year_from_url(self, url: str) -> Optional[int]:
         """Extract year from URL path."""
-        # Persian/Jalali years (1300-1450)
-        persian_year_match = re.search(r'1[3-4]\d{2}', url)
-        if persian_year_match:
-            year = int(persian_year_match.group())
-            if 1300 <= year <= 1450:
-                return year
+        persian_year = None
+        gregorian_year = None
+        
+        # Single scan; only the first candidate of each calendar is considered
+        for match in _YEAR_RE.finditer(url):
+            if match.lastgroup == 'persian':
+                if persian_year is None:
+                    persian_year = int(match.group('persian'))
+                    # Persian/Jalali years (1300-1450) take precedence
+                    if persian_year <= 1450:
+                        return persian_year
+            elif gregorian_year is None:
+                gregorian_year = int(match.group('gregorian'))
+            
+            if persian_year is not None and gregorian_year is not None:
+                break
         
         # Gregorian years (1900-2100)
-        gregorian_year_match = re.search(r'(19|20|21)\d{2}', url)
-        if gregorian_year_match:
-            year = int(gregorian_year_match.group())
-            if 1900 <= year <= 2100:
-                return year
+        if gregorian_year is not None and gregorian_year <= 2100:
+            return gregorian_year
         
         return None
     
@@ -515,16 +1018,18 @@ def crawl_directory_url(url: str, config: CrawlConfig = None) -> CrawlResult:
     Returns:
         CrawlResult with discovered files
     """
-    crawler = DirectoryCrawler(config)
-    return crawler.crawl_directory(url)
+    with DirectoryCrawler(config) as crawler:
+        return crawler.crawl_directory(url)
 
 
 def main():
     """Main function for command-line usage."""
     import argparse
+    from itertools import islice
     
     parser = argparse.ArgumentParser(description='Crawl directory URLs to discover files')
-    parser.add_argument('url', help='Base URL to crawl')
+    parser.add_argument('urls', nargs='*', metavar='url', help='Base URL(s) to crawl')
+    parser.add_argument('--url-file', help='File with one base URL per line')
     parser.add_argument('--max-depth', type=int, default=5, help='Maximum crawl depth')
     parser.add_argument('--max-files', type=int, default=10000, help='Maximum total files')
     parser.add_argument('--delay', type=float, default=1.0, help='Delay between requests (seconds)')
@@ -533,6 +1038,13 @@ def main():
     
     args = parser.parse_args()
     
+    urls = list(args.urls)
+    if args.url_file:
+        with open(args.url_file, 'r', encoding='utf-8') as f:
+            urls.extend(line.strip() for line in f if line.strip() and not line.startswith('#'))
+    if not urls:
+        parser.error('at least one url or --url-file is required')
+    
     # Setup logging
     level = logging.DEBUG if args.verbose else logging.INFO
     logging.basicConfig(level=level, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -541,41 +1053,50 @@ def main():
     config = CrawlConfig(
         max_depth=args.max_depth,
         max_total_files=args.max_files,
-        delay_between_requests=args.delay
+        delay_between_requests=args.delay,
+        # Keep listing validators next to the output so re-runs can skip unchanged directories
+        cache_file=f"{args.output}.cache.json" if args.output else None,
+        output_file=args.output
     )
     
-    # Crawl directory
-    print(f"🕷️  Crawling directory: {args.url}")
-    result = crawl_directory_url(args.url, config)
-    
-    # Display results
-    print(f"\n📊 Crawl Results:")
-    print(f"   Base URL: {result.base_url}")
-    print(f"   Files found: {result.total_files}")
-    print(f"   Directories found: {len(result.discovered_directories)}")
-    print(f"   Processing time: {result.processing_time:.2f}s")
-    print(f"   Errors: {len(result.errors)}")
-    
-    if result.errors:
-        print(f"\n❌ Errors:")
-        for error in result.errors[:5]:  # Show first 5 errors
-            print(f"   {error}")
-        if len(result.errors) > 5:
-            print(f"   ... and {len(result.errors) - 5} more errors")
+    # Crawl all directories through one crawler so connections are reused
+    print(f"🕷️  Crawling {len(urls)} director{'y' if len(urls) == 1 else 'ies'}")
+    with DirectoryCrawler(config) as crawler:
+        results = crawler.crawl_many(urls)
+    
+    for result in results:
+        # Display results
+        print(f"\n📊 Crawl Results:")
+        print(f"   Base URL: {result.base_url}")
+        print(f"   Files found: {result.total_files}")
+        print(f"   Directories found: {len(result.discovered_directories)}")
+        print(f"   Processing time: {result.processing_time:.2f}s")
+        print(f"   Errors: {len(result.errors)}")
+        
+        if result.errors:
+            print(f"\n❌ Errors:")
+            for error in result.errors[:5]:  # Show first 5 errors
+                print(f"   {error}")
+            if len(result.errors) > 5:
+                print(f"   ... and {len(result.errors) - 5} more errors")
     
     # Show sample files
-    if result.discovered_files:
+    total_files = sum(result.total_files for result in results)
+    if total_files:
+        if args.output:
+            with open(args.output, 'r', encoding='utf-8') as f:
+                sample_files = [line.rstrip('\n') for line in islice(f, 10)]
+        else:
+            sample_files = [file_url for result in results for file_url in result.discovered_files][:10]
+        
         print(f"\n📄 Sample files:")
-        for file_url in result.discovered_files[:10]:  # Show first 10 files
+        for file_url in sample_files:  # Show first 10 files
             print(f"   {file_url}")
-        if len(result.discovered_files) > 10:
-            print(f"   ... and {len(result.discovered_files) - 10} more files")
+        if total_files > 10:
+            print(f"   ... and {total_files - 10} more files")
     
-    # Save to file if requested
+    # URLs were streamed to the output file during the crawl
     if args.output:
-        with open(args.output, 'w', encoding='utf-8') as f:
-            for file_url in result.discovered_files:
-                f.write(f"{file_url}\n")
         print(f"\n💾 URLs saved to: {args.output}")
 
 
@@ -6,16 +6,47 @@ This module provides comprehensive error handling with categorization,
 retry mechanisms, and detailed logging for workflow operations.
 """
 
+import asyncio
 import logging
+import os
+import random
+import re
+import socket
 import time
 import traceback
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Any, Callable, Tuple
+from types import TracebackType
+from typing import BinaryIO, Deque, Dict, List, Optional, Any, Callable, Tuple, Union
 from dataclasses import dataclass, field
 from pathlib import Path
 import json
 
+# Error reports and spill lines encode much faster with orjson when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# One formatter shared by every WorkflowLogger handler
+_SHARED_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S',
+    validate=False
+)
+
+# Optional exception classes used to categorize errors by class identity
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
 
 class ErrorCategory(Enum):
     """Categories of errors that can occur during workflow execution."""
@@ -26,44 +57,210 @@ class ErrorCategory(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Keep traceback objects on logged errors so they can be formatted on demand.
+# Set FORMAT_TRACEBACKS=0 to drop them and never format tracebacks at all.
+FORMAT_TRACEBACKS = os.environ.get('FORMAT_TRACEBACKS', '1').lower() not in ('0', 'false', 'no')
+
+# Number of most recent errors kept in memory by ProcessingSummary
+MAX_RECENT_ERRORS = 1000
+
+# Enum conversions computed once instead of through ErrorCategory(...) and the
+# .value descriptor for every logged error
+_CATEGORY_FROM_STR = {category.value: category for category in ErrorCategory}
+_CATEGORY_STR = {category: category.value for category in ErrorCategory}
+_CATEGORY_LABEL = {category: f"[{category.value.upper()}]" for category in ErrorCategory}
+
+# Wall-clock time paired with the monotonic clock at import. Errors record
+# cheap time.monotonic_ns() stamps that are converted against this anchor
+# only when a timestamp is actually read.
+_CLOCK_ANCHOR = (datetime.now(), time.monotonic_ns())
+
+
+def _monotonic_to_datetime(timestamp_ns: int) -> datetime:
+    """Convert a time.monotonic_ns() reading to a wall-clock datetime."""
+    anchor_wall, anchor_ns = _CLOCK_ANCHOR
+    return anchor_wall + timedelta(microseconds=(timestamp_ns - anchor_ns) // 1000)
+
+
+# Maximum number of recycled ErrorDetails kept by a pooling WorkflowLogger
+ERROR_POOL_SIZE = 256
+
+
+# Indicator substrings for RetryHandler._categorize_error, one named group per
+# category in precedence order. The whole alternation sits inside a lookahead
+# so every position of the subject is tried, which makes overlapping
+# indicators visible; at each position the leftmost group wins, so the
+# highest-precedence category at any position is always the one reported.
+# Type-only validation indicators (validation_type) only count inside the
+# exception type name, message-only ones (validation) only inside the message.
+_CATEGORY_RE = re.compile(
+    r"(?=(?:"
+    r"(?P<network>requests\.exceptions|connectionerror|timeout|httperror|urlerror"
+    r"|socket|dns|network|connection|unreachable)"
+    r"|(?P<filesystem>oserror|ioerror|permissionerror|filenotfounderror"
+    r"|isadirectoryerror|notadirectoryerror|disk|space|permission denied"
+    r"|no such file|directory)"
+    r"|(?P<validation_type>valueerror|typeerror|keyerror|indexerror)"
+    r"|(?P<configuration>configurationerror|yaml|json|parsing|configuration"
+    r"|missing|malformed)"
+    r"|(?P<validation>validation|invalid|format)"
+    r"))",
+    re.IGNORECASE
+)
+
+_CATEGORY_PRECEDENCE: Dict[Optional[str], Tuple[int, ErrorCategory]] = {
+    'network': (0, ErrorCategory.NETWORK),
+    'filesystem': (1, ErrorCategory.FILESYSTEM),
+    'validation_type': (2, ErrorCategory.VALIDATION),
+    'configuration': (3, ErrorCategory.CONFIGURATION),
+    'validation': (4, ErrorCategory.VALIDATION),
+}
+
+# Exception type names that categorize without looking at the message. Only
+# names containing a network indicator qualify: NETWORK has the highest
+# precedence, so nothing in the message can change their category.
+_EXACT_TYPE_MAP = {
+    name: ErrorCategory.NETWORK
+    for name in (
+        'ConnectionError', 'ConnectionRefusedError', 'ConnectionResetError',
+        'ConnectionAbortedError', 'TimeoutError', 'ConnectTimeout',
+        'ReadTimeout', 'Timeout', 'HTTPError', 'URLError', 'TimeoutException',
+        'ConnectTimeoutError', 'ReadTimeoutError', 'NewConnectionError',
+    )
+}
+
+
+def _category_classes() -> Tuple[Tuple[Tuple[type, ...], ErrorCategory], ...]:
+    """Build the exception class -> category table, checked in order."""
+    network: List[type] = [ConnectionError, TimeoutError, socket.gaierror, socket.herror]
+    configuration: List[type] = [json.JSONDecodeError]
+    if requests is not None:
+        # requests exceptions derive from OSError, so list the network ones
+        # explicitly; the rest must not fall into the FILESYSTEM classes
+        network += [requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                    requests.exceptions.HTTPError, requests.exceptions.ChunkedEncodingError]
+    if yaml is not None:
+        configuration.append(yaml.YAMLError)
+    return (
+        (tuple(network), ErrorCategory.NETWORK),
+        ((FileNotFoundError, PermissionError, IsADirectoryError,
+          NotADirectoryError, FileExistsError), ErrorCategory.FILESYSTEM),
+        # JSONDecodeError is a ValueError, so configuration is checked first
+        (tuple(configuration), ErrorCategory.CONFIGURATION),
+        ((ValueError, TypeError, KeyError, IndexError), ErrorCategory.VALIDATION),
+    )
+
+
+_CATEGORY_BY_CLASS = _category_classes()
+
+
+@dataclass(slots=True, init=False)
 class ErrorDetails:
-    """Detailed information about an error occurrence."""
+    """Detailed information about an error occurrence.
+    
+    Errors logged by WorkflowLogger record a time.monotonic_ns() reading in
+    timestamp_ns; the wall-clock `timestamp` is only built when read.
+    """
     category: ErrorCategory
     message: str
-    timestamp: datetime
-    url: Optional[str] = None
-    file_path: Optional[str] = None
-    exception_type: Optional[str] = None
-    traceback_info: Optional[str] = None
-    retry_count: int = 0
-    context: Dict[str, Any] = field(default_factory=dict)
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error details to dictionary for serialization."""
+    timestamp_ns: Optional[int]
+    url: Optional[str]
+    file_path: Optional[str]
+    exception_type: Optional[str]
+    traceback_info: Optional[Union[str, TracebackType]]
+    retry_count: int
+    context: Dict[str, Any]
+    _timestamp: Optional[datetime] = field(repr=False)
+    
+    def __init__(self, category: ErrorCategory, message: str,
+                 timestamp: Optional[datetime] = None,
+                 url: Optional[str] = None, file_path: Optional[str] = None,
+                 exception_type: Optional[str] = None,
+                 traceback_info: Optional[Union[str, TracebackType]] = None,
+                 retry_count: int = 0, context: Optional[Dict[str, Any]] = None,
+                 *, timestamp_ns: Optional[int] = None) -> None:
+        self.reset(category, message, timestamp, url, file_path, exception_type,
+                   traceback_info, retry_count, context, timestamp_ns=timestamp_ns)
+    
+    def reset(self, category: ErrorCategory, message: str,
+              timestamp: Optional[datetime] = None,
+              url: Optional[str] = None, file_path: Optional[str] = None,
+              exception_type: Optional[str] = None,
+              traceback_info: Optional[Union[str, TracebackType]] = None,
+              retry_count: int = 0, context: Optional[Dict[str, Any]] = None,
+              *, timestamp_ns: Optional[int] = None) -> 'ErrorDetails':
+        """Re-initialize every field so a recycled instance can be reused."""
+        if timestamp is None and timestamp_ns is None:
+            raise TypeError("ErrorDetails needs a timestamp or a timestamp_ns reading")
+        self.category = category
+        self.message = message
+        self._timestamp = timestamp
+        self.timestamp_ns = timestamp_ns
+        self.url = url
+        self.file_path = file_path
+        self.exception_type = exception_type
+        self.traceback_info = traceback_info
+        self.retry_count = retry_count
+        self.context = context if context is not None else {}
+        return self
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Wall-clock timestamp, converted from timestamp_ns on first access."""
+        if self._timestamp is None:
+            self._timestamp = _monotonic_to_datetime(self.timestamp_ns)
+        return self._timestamp
+    
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self._timestamp = value
+        self.timestamp_ns = None
+    
+    @property
+    def traceback_info_str(self) -> Optional[str]:
+        """Formatted traceback, formatted on first access and then cached."""
+        if isinstance(self.traceback_info, TracebackType):
+            self.traceback_info = (
+                "Traceback (most recent call last):\n"
+                + "".join(traceback.format_tb(self.traceback_info))
+            )
+        return self.traceback_info
+    
+    def to_dict(self, include_traceback: bool = False) -> Dict[str, Any]:
+        """Convert error details to dictionary for serialization.
+        
+        Args:
+            include_traceback: Format and include the traceback (default: False)
+        """
         return {
-            'category': self.category.value,
+            'category': _CATEGORY_STR[self.category],
             'message': self.message,
             'timestamp': self.timestamp.isoformat(),
             'url': self.url,
             'file_path': self.file_path,
             'exception_type': self.exception_type,
-            'traceback_info': self.traceback_info,
+            'traceback_info': self.traceback_info_str if include_traceback else None,
             'retry_count': self.retry_count,
             'context': self.context
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingSummary:
     """Summary of processing results including errors and successes."""
     total_operations: int = 0
     successful_operations: int = 0
     failed_operations: int = 0
-    errors_by_category: Dict[ErrorCategory, int] = field(default_factory=dict)
-    error_details: List[ErrorDetails] = field(default_factory=list)
+    errors_by_category: Dict[ErrorCategory, int] = field(
+        default_factory=lambda: dict.fromkeys(ErrorCategory, 0)
+    )
+    error_details: Deque[ErrorDetails] = field(
+        default_factory=lambda: deque(maxlen=MAX_RECENT_ERRORS)
+    )
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
+    start_ns: Optional[int] = None
+    end_ns: Optional[int] = None
     
     @property
     def success_rate(self) -> float:
@@ -75,64 +272,94 @@ class ProcessingSummary:
     @property
     def duration(self) -> Optional[float]:
         """Calculate processing duration in seconds."""
+        if self.start_ns is not None and self.end_ns is not None:
+            return (self.end_ns - self.start_ns) / 1e9
         if self.start_time and self.end_time:
             return (self.end_time - self.start_time).total_seconds()
         return None
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert summary to dictionary for serialization."""
-        return {
+    def to_dict(self, include_traceback: bool = False,
+                include_errors: bool = True) -> Dict[str, Any]:
+        """Convert summary to dictionary for serialization.
+        
+        Args:
+            include_traceback: Include formatted tracebacks of logged errors
+            include_errors: Include the recent error details
+        """
+        data = {
             'total_operations': self.total_operations,
             'successful_operations': self.successful_operations,
             'failed_operations': self.failed_operations,
             'success_rate': round(self.success_rate, 2),
             'duration_seconds': self.duration,
-            'errors_by_category': {cat.value: count for cat, count in self.errors_by_category.items()},
-            'error_details': [error.to_dict() for error in self.error_details],
+            'errors_by_category': {
+                _CATEGORY_STR[cat]: count for cat, count in self.errors_by_category.items()
+            },
             'start_time': self.start_time.isoformat() if self.start_time else None,
             'end_time': self.end_time.isoformat() if self.end_time else None
         }
+        if include_errors:
+            data['error_details'] = [error.to_dict(include_traceback) for error in self.error_details]
+        return data
 
 
 class WorkflowLogger:
     """Enhanced logger with structured error handling and categorization."""
     
-    def __init__(self, name: str = "iranian_archive_workflow", log_level: int = logging.INFO):
+    def __init__(self, name: str = "iranian_archive_workflow", log_level: int = logging.INFO,
+                 spill_path: Optional[Union[str, Path]] = None,
+                 pool_error_details: bool = False) -> None:
         """Initialize the workflow logger.
         
         Args:
             name: Logger name
             log_level: Logging level (default: INFO)
+            spill_path: JSONL file that every logged error is appended to.
+                Only the most recent errors are kept in memory, so set this
+                to keep a full record of long runs.
+            pool_error_details: Recycle ErrorDetails evicted from the recent
+                errors buffer for later log_error calls. Returned
+                ErrorDetails may then be overwritten once they leave the
+                buffer, so callers must not hold on to them.
         """
         self.logger = logging.getLogger(name)
         self.logger.setLevel(log_level)
         
-        # Remove existing handlers to avoid duplicates
-        for handler in self.logger.handlers[:]:
-            self.logger.removeHandler(handler)
+        # Add the console handler only once per logger name, leaving any
+        # handlers configured elsewhere in place; the logger level filters
+        if not self.logger.handlers:
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(_SHARED_FORMATTER)
+            self.logger.addHandler(console_handler)
         
-        # Create console handler with detailed formatting
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(log_level)
+        # Track processing summary
+        self.summary = ProcessingSummary()
         
-        # Create detailed formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
+        self._error_pool: Optional[Deque[ErrorDetails]] = (
+            deque(maxlen=ERROR_POOL_SIZE) if pool_error_details else None
         )
-        console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
         
-        # Track processing summary
-        self.summary = ProcessingSummary()
+        self.spill_path = Path(spill_path) if spill_path else None
+        self._spill_file: Optional[BinaryIO] = None
+        if self.spill_path:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            self._spill_file = open(self.spill_path, 'ab')
+    
+    def close(self) -> None:
+        """Close the error spill file, if any."""
+        if self._spill_file:
+            self._spill_file.close()
+            self._spill_file = None
     
     def start_processing(self) -> None:
         """Mark the start of processing operations."""
         self.summary.start_time = datetime.now()
+        self.summary.start_ns = time.monotonic_ns()
         self.logger.info("Starting workflow processing")
     
     def end_processing(self) -> None:
         """Mark the end of processing operations."""
+        self.summary.end_ns = time.monotonic_ns()
         self.summary.end_time = datetime.now()
         self.logger.info(f"Workflow processing completed in {self.summary.duration:.2f} seconds")
         self._log_summary()
@@ -153,30 +380,44 @@ class WorkflowLogger:
         Returns:
             ErrorDetails object containing structured error information
         """
-        error_details = ErrorDetails(
+        pool = self._error_pool
+        error_details = pool.pop() if pool else ErrorDetails.__new__(ErrorDetails)
+        error_details.reset(
             category=category,
             message=str(error),
-            timestamp=datetime.now(),
+            timestamp_ns=time.monotonic_ns(),
             url=url,
             file_path=file_path,
             exception_type=type(error).__name__,
-            traceback_info=traceback.format_exc(),
+            traceback_info=getattr(error, '__traceback__', None) if FORMAT_TRACEBACKS else None,
             retry_count=retry_count,
             context=context or {}
         )
         
-        # Add to summary
-        self.summary.error_details.append(error_details)
+        # Add to summary; the ring buffer drops the oldest error once full,
+        # so write the full record to the spill file first. Context values
+        # JSON cannot encode (paths, datetimes, exceptions) are written as
+        # str() so logging an error never raises itself.
+        if self._spill_file:
+            if orjson is not None:
+                line = orjson.dumps(error_details.to_dict(), default=str,
+                                    option=orjson.OPT_APPEND_NEWLINE)
+            else:
+                line = (json.dumps(error_details.to_dict(), ensure_ascii=False, default=str)
+                        + "\n").encode('utf-8')
+            self._spill_file.write(line)
+        recent = self.summary.error_details
+        if pool is not None and len(recent) == recent.maxlen:
+            pool.append(recent.popleft())
+        recent.append(error_details)
         self.summary.failed_operations += 1
         
-        # Update category counts
-        if category not in self.summary.errors_by_category:
-            self.summary.errors_by_category[category] = 0
+        # Update category counts (every category is preinitialized to 0)
         self.summary.errors_by_category[category] += 1
         
-        # Log the error
-        log_message = self._format_error_message(error_details)
-        self.logger.error(log_message)
+        # Log the error, skipping message formatting when ERROR is filtered out
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(self._format_error_message(error_details))
         
         return error_details
     
@@ -191,16 +432,28 @@ class WorkflowLogger:
             context: Additional context information
         """
         self.summary.successful_operations += 1
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         
-        log_parts = [operation]
+        # Pass the parts as logging args so they are only %-formatted
+        # (and the context dict only repr'd) if a handler emits the record
+        log_format = "%s"
+        args = [operation]
         if url:
-            log_parts.append(f"URL: {url}")
+            log_format += " | URL: %s"
+            args.append(url)
         if file_path:
-            log_parts.append(f"File: {file_path}")
+            log_format += " | File: %s"
+            args.append(file_path)
         if context:
-            log_parts.append(f"Context: {context}")
+            log_format += " | Context: %s"
+            args.append(context)
         
-        self.logger.info(" | ".join(log_parts))
+        self.logger.info(log_format, *args)
+    
+    def get_processing_summary(self) -> ProcessingSummary:
+        """Get the processing summary collected so far."""
+        return self.summary
     
     def increment_total_operations(self, count: int = 1) -> None:
         """Increment the total operations counter.
@@ -220,7 +473,7 @@ class WorkflowLogger:
             Formatted error message
         """
         parts = [
-            f"[{error_details.category.value.upper()}]",
+            _CATEGORY_LABEL[error_details.category],
             error_details.message
         ]
         
@@ -251,23 +504,40 @@ class WorkflowLogger:
         if self.summary.duration:
             self.logger.info(f"Duration: {self.summary.duration:.2f} seconds")
         
-        if self.summary.errors_by_category:
+        if self.summary.failed_operations:
             self.logger.info("Errors by Category:")
             for category, count in self.summary.errors_by_category.items():
-                self.logger.info(f"  {category.value}: {count}")
+                if count:
+                    self.logger.info(f"  {_CATEGORY_STR[category]}: {count}")
         
         self.logger.info("=" * 60)
     
-    def save_error_report(self, file_path: str) -> None:
-        """Save detailed error report to JSON file.
+    def save_error_report(self, file_path: str, include_traceback: bool = False) -> None:
+        """Save error report to JSON file.
+        
+        The report holds the summary statistics and the most recent errors.
+        When errors are spilled to a JSONL file, the report references that
+        file instead of repeating its contents.
         
         Args:
             file_path: Path to save the error report
+            include_traceback: Include formatted tracebacks in the report
         """
         try:
-            report_data = self.summary.to_dict()
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(report_data, f, indent=2, ensure_ascii=False)
+            report_data = {'summary': self.summary.to_dict(include_errors=False)}
+            if self._spill_file:
+                self._spill_file.flush()
+                report_data['error_log'] = str(self.spill_path)
+            else:
+                report_data['recent_errors'] = [
+                    error.to_dict(include_traceback) for error in self.summary.error_details
+                ]
+            if orjson is not None:
+                with open(file_path, 'wb') as f:
+                    f.write(orjson.dumps(report_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    json.dump(report_data, f, indent=2, ensure_ascii=False)
             self.logger.info(f"Error report saved to: {file_path}")
         except Exception as e:
             self.logger.error(f"Failed to save error report: {e}")
@@ -277,7 +547,8 @@ class RetryHandler:
     """Handles retry logic with exponential backoff for network operations."""
     
     def __init__(self, max_retries: int = 3, base_delay: float = 1.0, 
-                 max_delay: float = 60.0, backoff_factor: float = 2.0):
+                 max_delay: float = 60.0, backoff_factor: float = 2.0,
+                 jitter: bool = False) -> None:
         """Initialize retry handler.
         
         Args:
@@ -285,16 +556,19 @@ class RetryHandler:
             base_delay: Base delay in seconds for first retry
             max_delay: Maximum delay in seconds between retries
             backoff_factor: Multiplier for exponential backoff
+            jitter: Sleep a random time between 0 and the backoff delay
+                ("full jitter") so concurrent retries don't fire in lockstep
         """
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.backoff_factor = backoff_factor
+        self.jitter = jitter
     
-    def execute_with_retry(self, operation: Callable, *args, 
+    def execute_with_retry(self, operation: Callable[..., Any], *args: Any, 
                           error_categories: Optional[List[ErrorCategory]] = None,
                           logger: Optional[WorkflowLogger] = None,
-                          context: Optional[Dict[str, Any]] = None, **kwargs) -> Tuple[bool, Any, Optional[ErrorDetails]]:
+                          context: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Tuple[bool, Any, Optional[ErrorDetails]]:
         """Execute an operation with retry logic.
         
         Args:
@@ -316,49 +590,113 @@ class RetryHandler:
         for attempt in range(self.max_retries + 1):
             try:
                 result = operation(*args, **kwargs)
-                
-                if logger and attempt > 0:
-                    logger.log_success(
-                        f"Operation succeeded after {attempt} retries",
-                        context={'operation': operation.__name__, 'attempts': attempt + 1}
-                    )
-                
-                return True, result, None
-                
             except Exception as e:
-                # Categorize the error
-                error_category = self._categorize_error(e)
-                
-                # Log the error
-                if logger:
-                    last_error = logger.log_error(
-                        e, error_category, 
-                        context=context, 
-                        retry_count=attempt
-                    )
-                
-                # Check if this error type should trigger a retry
-                if attempt < self.max_retries and error_category in error_categories:
-                    delay = self._calculate_delay(attempt)
-                    
-                    if logger:
-                        logger.logger.warning(
-                            f"Retrying operation in {delay:.1f} seconds "
-                            f"(attempt {attempt + 1}/{self.max_retries})"
-                        )
-                    
-                    time.sleep(delay)
-                    continue
-                else:
-                    # No more retries or error type doesn't warrant retry
-                    if logger:
-                        logger.logger.error(
-                            f"Operation failed after {attempt + 1} attempts: {e}"
-                        )
+                delay, last_error = self._handle_failure(
+                    e, attempt, error_categories, logger, context, last_error
+                )
+                if delay is None:
                     return False, None, last_error
+                time.sleep(delay)
+                continue
+            
+            self._log_recovery(operation, attempt, logger)
+            return True, result, None
         
         return False, None, last_error
     
+    async def execute_with_retry_async(self, operation: Callable[..., Any], *args: Any,
+                                       error_categories: Optional[List[ErrorCategory]] = None,
+                                       logger: Optional[WorkflowLogger] = None,
+                                       context: Optional[Dict[str, Any]] = None,
+                                       **kwargs: Any) -> Tuple[bool, Any, Optional[ErrorDetails]]:
+        """Async variant of execute_with_retry for coroutine operations.
+        
+        Backoff delays are awaited with asyncio.sleep, so the event loop keeps
+        running other tasks while this operation waits to retry.
+        
+        Args:
+            operation: Coroutine function to execute
+            *args: Positional arguments for the operation
+            error_categories: List of error categories that should trigger retries
+            logger: Logger instance for error reporting
+            context: Additional context for error logging
+            **kwargs: Keyword arguments for the operation
+            
+        Returns:
+            Tuple of (success: bool, result: Any, error_details: Optional[ErrorDetails])
+        """
+        if error_categories is None:
+            error_categories = [ErrorCategory.NETWORK]
+        
+        last_error = None
+        
+        for attempt in range(self.max_retries + 1):
+            try:
+                result = await operation(*args, **kwargs)
+            except Exception as e:
+                delay, last_error = self._handle_failure(
+                    e, attempt, error_categories, logger, context, last_error
+                )
+                if delay is None:
+                    return False, None, last_error
+                await asyncio.sleep(delay)
+                continue
+            
+            self._log_recovery(operation, attempt, logger)
+            return True, result, None
+        
+        return False, None, last_error
+    
+    def _log_recovery(self, operation: Callable[..., Any], attempt: int,
+                      logger: Optional[WorkflowLogger]) -> None:
+        """Log that an operation succeeded after one or more retries."""
+        if logger and attempt > 0:
+            logger.log_success(
+                f"Operation succeeded after {attempt} retries",
+                context={'operation': operation.__name__, 'attempts': attempt + 1}
+            )
+    
+    def _handle_failure(self, error: Exception, attempt: int,
+                        error_categories: List[ErrorCategory],
+                        logger: Optional[WorkflowLogger],
+                        context: Optional[Dict[str, Any]],
+                        last_error: Optional[ErrorDetails]) -> Tuple[Optional[float], Optional[ErrorDetails]]:
+        """Log a failed attempt and decide whether to retry it.
+        
+        Returns:
+            Tuple of (delay before the next attempt, or None to give up,
+            error details of the latest logged failure)
+        """
+        # Categorize the error
+        error_category = self._categorize_error(error)
+        
+        # Log the error
+        if logger:
+            last_error = logger.log_error(
+                error, error_category, 
+                context=context, 
+                retry_count=attempt
+            )
+        
+        # Check if this error type should trigger a retry
+        if attempt < self.max_retries and error_category in error_categories:
+            delay = self._calculate_delay(attempt)
+            
+            if logger:
+                logger.logger.warning(
+                    f"Retrying operation in {delay:.1f} seconds "
+                    f"(attempt {attempt + 1}/{self.max_retries})"
+                )
+            
+            return delay, last_error
+        
+        # No more retries or error type doesn't warrant retry
+        if logger:
+            logger.logger.error(
+                f"Operation failed after {attempt + 1} attempts: {error}"
+            )
+        return None, last_error
+    
     def _calculate_delay(self, attempt: int) -> float:
         """Calculate delay for exponential backoff.
         
@@ -368,12 +706,21 @@ class RetryHandler:
         Returns:
             Delay in seconds
         """
-        delay = self.base_delay * (self.backoff_factor ** attempt)
-        return min(delay, self.max_delay)
+        if self.backoff_factor == 2.0:
+            delay = self.base_delay * (1 << attempt)
+        else:
+            delay = self.base_delay * (self.backoff_factor ** attempt)
+        delay = min(delay, self.max_delay)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
     
     def _categorize_error(self, error: Exception) -> ErrorCategory:
         """Categorize an error based on its type and message.
         
+        Known exception classes (and their subclasses) are categorized by
+        class alone; other errors are matched by type name and message.
+        
         Args:
             error: Exception to categorize
             
@@ -381,68 +728,50 @@ class RetryHandler:
             ErrorCategory enum value
         """
         error_type = type(error).__name__
-        error_message = str(error).lower()
-        
-        # Network-related errors
-        network_indicators = [
-            'requests.exceptions', 'connectionerror', 'timeout', 'httperror',
-            'urlerror', 'socket', 'dns', 'network', 'connection', 'unreachable'
-        ]
-        
-        if any(indicator in error_type.lower() or indicator in error_message 
-               for indicator in network_indicators):
-            return ErrorCategory.NETWORK
-        
-        # Filesystem-related errors
-        filesystem_indicators = [
-            'oserror', 'ioerror', 'permissionerror', 'filenotfounderror',
-            'isadirectoryerror', 'notadirectoryerror', 'disk', 'space',
-            'permission denied', 'no such file', 'directory'
-        ]
-        
-        if any(indicator in error_type.lower() or indicator in error_message 
-               for indicator in filesystem_indicators):
-            return ErrorCategory.FILESYSTEM
-        
-        # Validation errors (check first for specific validation types)
-        validation_indicators = [
-            'valueerror', 'typeerror', 'keyerror', 'indexerror'
-        ]
-        
-        if any(indicator in error_type.lower() for indicator in validation_indicators):
-            return ErrorCategory.VALIDATION
-        
-        # Configuration-related errors
-        configuration_indicators = [
-            'configurationerror', 'yaml', 'json', 'parsing', 'configuration',
-            'missing', 'malformed'
-        ]
-        
-        if any(indicator in error_type.lower() or indicator in error_message 
-               for indicator in configuration_indicators):
-            return ErrorCategory.CONFIGURATION
-        
-        # Check for validation-specific messages
-        validation_message_indicators = ['validation', 'invalid', 'format']
-        
-        if any(indicator in error_message for indicator in validation_message_indicators):
-            return ErrorCategory.VALIDATION
-        
-        return ErrorCategory.UNKNOWN
+        category = _EXACT_TYPE_MAP.get(error_type)
+        if category is not None:
+            return category
+        
+        for classes, category in _CATEGORY_BY_CLASS:
+            if isinstance(error, classes):
+                return category
+        
+        # The NUL separator keeps indicators from matching across the
+        # boundary between the type name and the message.
+        type_end = len(error_type)
+        subject = f"{error_type}\0{error}"
+        best: Optional[Tuple[int, ErrorCategory]] = None
+        
+        for match in _CATEGORY_RE.finditer(subject):
+            group = match.lastgroup
+            in_type = match.start() < type_end
+            if group == 'validation_type' and not in_type:
+                continue
+            if group == 'validation' and in_type:
+                continue
+            rank = _CATEGORY_PRECEDENCE[group]
+            if best is None or rank[0] < best[0]:
+                best = rank
+                if rank[0] == 0:
+                    break
+        
+        return best[1] if best is not None else ErrorCategory.UNKNOWN
 
 
 def create_workflow_logger(name: str = "iranian_archive_workflow", 
-                          log_level: int = logging.INFO) -> WorkflowLogger:
+                          log_level: int = logging.INFO,
+                          spill_path: Optional[Union[str, Path]] = None) -> WorkflowLogger:
     """Factory function to create a configured workflow logger.
     
     Args:
         name: Logger name
         log_level: Logging level
+        spill_path: Optional JSONL file receiving every logged error
         
     Returns:
         Configured WorkflowLogger instance
     """
-    return WorkflowLogger(name, log_level)
+    return WorkflowLogger(name, log_level, spill_path)
 
 
 def create_retry_handler(max_retries: int = 3, base_delay: float = 1.0) -> RetryHandler:
@@ -458,23 +787,67 @@ def create_retry_handler(max_retries: int = 3, base_delay: float = 1.0) -> Retry
     return RetryHandler(max_retries=max_retries, base_delay=base_delay)
 
 
+class _ErrorLogFileHandler(logging.FileHandler):
+    """File handler installed by ErrorHandler, so it can find and replace it."""
+
+
 class ErrorHandler:
     """Main error handler that combines logging and retry functionality."""
     
-    def __init__(self, log_file: str = "workflow_errors.log"):
-        self.logger = WorkflowLogger(log_file)
+    def __init__(self, log_file: Optional[str] = None,
+                 name: str = "iranian_archive_workflow") -> None:
+        """Initialize the error handler.
+        
+        Args:
+            log_file: File that logged errors are also written to (optional)
+            name: Logger name
+        """
+        self.logger = WorkflowLogger(name)
         self.retry_handler = RetryHandler()
+        
+        if log_file:
+            self._attach_log_file(os.path.abspath(log_file))
     
-    def log_error(self, message: str, category: str, **kwargs) -> None:
-        """Log an error with the specified category."""
-        try:
-            error_category = ErrorCategory(category)
-        except ValueError:
-            error_category = ErrorCategory.UNKNOWN
+    def _attach_log_file(self, log_path: str) -> None:
+        """Point the logger's error log file handler at log_path.
+        
+        Loggers are shared by name, so a log file from an earlier
+        ErrorHandler is replaced rather than stacked; handlers added by
+        other code are left alone.
+        """
+        logger = self.logger.logger
+        for handler in logger.handlers[:]:
+            if isinstance(handler, _ErrorLogFileHandler):
+                if handler.baseFilename == log_path:
+                    return
+                logger.removeHandler(handler)
+                handler.close()
+        
+        file_handler = _ErrorLogFileHandler(log_path, encoding='utf-8', delay=True)
+        file_handler.setLevel(logging.ERROR)
+        file_handler.setFormatter(_SHARED_FORMATTER)
+        logger.addHandler(file_handler)
+    
+    def log_error(self, message: Union[str, Exception], category: Union[str, ErrorCategory],
+                  **kwargs: Any) -> None:
+        """Log an error with the specified category.
+        
+        Args:
+            message: Error message, or the exception itself
+            category: ErrorCategory or its string value; unknown strings
+                are logged as UNKNOWN
+            **kwargs: Extra arguments for WorkflowLogger.log_error
+        """
+        error = message if isinstance(message, Exception) else RuntimeError(message)
+        if isinstance(category, ErrorCategory):
+            error_category = category
+        else:
+            error_category = _CATEGORY_FROM_STR.get(category, ErrorCategory.UNKNOWN)
         
-        self.logger.log_error(message, error_category, **kwargs)
+        self.logger.log_error(error, error_category, **kwargs)
     
-    def execute_with_retry(self, operation: Callable, *args, **kwargs) -> Any:
+    def execute_with_retry(self, operation: Callable[..., Any], *args: Any,
+                           **kwargs: Any) -> Tuple[bool, Any, Optional[ErrorDetails]]:
         """Execute operation with retry logic."""
         return self.retry_handler.execute_with_retry(operation, *args, **kwargs)
     
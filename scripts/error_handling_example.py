@@ -115,10 +115,11 @@ def demonstrate_error_handling():
     print(f"   Success Rate: {summary.success_rate:.1f}%")
     print(f"   Duration: {summary.duration:.2f} seconds")
     
-    if summary.errors_by_category:
+    if summary.failed_operations:
         print("   Errors by Category:")
         for category, count in summary.errors_by_category.items():
-            print(f"     {category}: {count}")
+            if count:
+                print(f"     {category}: {count}")
     
     # 6. Save error report
     print("\n6. Saving Error Report...")
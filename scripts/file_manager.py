@@ -9,13 +9,21 @@ This module provides functionality for:
 """
 
 import os
+import errno
+import stat
 import time
+import asyncio
+import ipaddress
+import tempfile
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
 from pathlib import Path
-from typing import Optional, Tuple, Set
-from urllib.parse import urlparse, urljoin
+from typing import Optional, Tuple, Set, List, Iterable, Iterator
+from urllib.parse import ParseResult, urlparse, urljoin
 import logging
-import mimetypes
 import re
 
 from error_handler import (
@@ -23,19 +31,81 @@ from error_handler import (
     create_workflow_logger, create_retry_handler
 )
 
+# Suspicious URL patterns, compiled once into a single alternation
+# (used for non-ASCII URLs, where regex case folding is the reference)
+_SUSPICIOUS_RE = re.compile(
+    r'\.\./'           # Directory traversal
+    r'|%2e%2e%2f'      # URL encoded directory traversal
+    r'|javascript:'    # JavaScript protocol
+    r'|data:'          # Data protocol
+    r'|file:'          # File protocol
+    r'|ftp:'           # FTP protocol
+    r'|@'              # Potential credential injection
+    r'|[<>"\']',       # HTML/script injection characters
+    re.IGNORECASE
+)
+
+# The same patterns split for plain substring scans of ASCII URLs
+_SUSPICIOUS_LITERALS = ('../', '%2e%2e%2f', 'javascript:', 'data:', 'file:', 'ftp:')
+_SUSPICIOUS_CHARS = frozenset('@<>"\'')
+
+# Number of distinct hostnames whose safety verdict is cached
+HOST_CACHE_SIZE = 4096
+
+# os.link errors meaning the filesystem cannot hard-link the downloaded file
+_NO_HARD_LINK_ERRNOS = frozenset({
+    errno.EPERM, errno.EXDEV, errno.ENOTSUP, errno.EOPNOTSUPP, errno.EMLINK
+})
+
+# Permissions for downloaded files: what open() would give a new file under
+# the process umask. os.umask can only be read by setting it, so it is read
+# once at import, before any download threads exist.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_FILE_MODE = 0o666 & ~_UMASK
+
+# Number of distinct URLs whose parsed form is cached
+URL_CACHE_SIZE = 1024
+
+# Leading bytes of every PDF file, and how many of them a signature check reads
+_PDF_MAGIC = b'%PDF-'
+_PDF_MAGIC_LEN = len(_PDF_MAGIC)
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _parse_url(url: str) -> ParseResult:
+    """Parse a URL once for all the validation steps that look at it."""
+    return urlparse(url)
+
+
+def _is_private_address(hostname: str) -> bool:
+    """Check if hostname is a private, loopback, link-local or multicast IP."""
+    # IPv4 literals start with a digit and IPv6 literals contain a colon, so
+    # ordinary domain names never need to go through ipaddress parsing
+    if ':' not in hostname and not hostname[:1].isdigit():
+        return False
+    
+    try:
+        ip = ipaddress.ip_address(hostname)
+        return ip.is_private or ip.is_loopback or ip.is_link_local or ip.is_multicast
+    except ValueError:
+        # Not an IP address, check if it resolves to private IP
+        return False
+
+
 class FileManager:
     """Handles file downloads and directory management for archive workflow."""
     
     # Security configuration
     ALLOWED_SCHEMES = {'http', 'https'}
-    ALLOWED_CONTENT_TYPES = {
+    ALLOWED_CONTENT_TYPES = frozenset({
         'application/pdf',
         'application/x-pdf',
         'application/acrobat',
         'applications/vnd.pdf',
         'text/pdf',
         'text/x-pdf'
-    }
+    })
     BLOCKED_DOMAINS = {
         'localhost',
         '127.0.0.1',
@@ -51,6 +121,26 @@ class FileManager:
         '240.0.0.0/4'      # Reserved
     ]
     
+    # Connection pool sizing for the shared HTTP session
+    POOL_CONNECTIONS = 16   # Number of per-host pools to cache
+    POOL_MAXSIZE = 64       # Connections kept alive per host (>= concurrent downloads)
+    
+    # Downloads run at the same time by download_many (<= POOL_MAXSIZE)
+    DOWNLOAD_CONCURRENCY = 8
+    
+    # Bytes read from the response and written to disk per step
+    DOWNLOAD_CHUNK_SIZE = 1 << 20
+    
+    # Default headers sent with every request on the shared session. Connections
+    # are kept alive explicitly for servers that otherwise default to closing them;
+    # never send "Connection: close", it defeats the pooled session
+    DEFAULT_HEADERS = {
+        'User-Agent': 'Iranian Archive Workflow/1.0',
+        'Accept': 'application/pdf,application/octet-stream;q=0.9,*/*;q=0.1',
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+    }
+    
     def __init__(self, max_file_size_mb: int = 100, max_retries: int = 3, timeout: int = 300,
                  logger: Optional[WorkflowLogger] = None, max_redirects: int = 5):
         """
@@ -70,6 +160,58 @@ class FileManager:
         self.logger = logger or create_workflow_logger("file_manager")
         self.retry_handler = create_retry_handler(max_retries=max_retries)
         
+        # Shared HTTP session, created on first use so connections are kept alive
+        # and reused across all downloads instead of a new TCP/TLS handshake per file
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+        
+        # Absolute paths of directories this instance has already created, so a
+        # batch sharing one {category}/{folder}/{year} directory calls mkdir once
+        self._known_dirs: Set[str] = set()
+    
+    @property
+    def session(self) -> requests.Session:
+        """Shared, connection-pooled HTTP session used for all requests."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+    
+    def _create_session(self) -> requests.Session:
+        """
+        Create the pooled HTTP session.
+        
+        Retries are handled by RetryHandler, so the adapter itself does not retry.
+        
+        Returns:
+            Configured requests.Session instance
+        """
+        session = requests.Session()
+        session.max_redirects = self.max_redirects
+        session.headers.update(self.DEFAULT_HEADERS)
+        
+        adapter = HTTPAdapter(pool_connections=self.POOL_CONNECTIONS,
+                              pool_maxsize=self.POOL_MAXSIZE,
+                              max_retries=0)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        
+        return session
+    
+    def close(self) -> None:
+        """Close the shared HTTP session and release pooled connections."""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+    
+    def __enter__(self) -> 'FileManager':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+        
     def create_directory_structure(self, category: str, folder: str, year: str) -> Path:
         """
         Create nested directory structure for archive organization.
@@ -91,12 +233,11 @@ class FileManager:
             
             # Create directory path: {category}/{folder}/{year}
             dir_path = Path(category) / sanitized_folder / year
-            dir_path.mkdir(parents=True, exist_ok=True)
-            
-            self.logger.log_success(
-                f"Created directory structure: {dir_path}",
-                context={"category": category, "folder": folder, "year": year}
-            )
+            if self._ensure_directory(dir_path):
+                self.logger.log_success(
+                    f"Created directory structure: {dir_path}",
+                    context={"category": category, "folder": folder, "year": year}
+                )
             return dir_path
             
         except OSError as e:
@@ -106,6 +247,85 @@ class FileManager:
             )
             raise
     
+    def _ensure_directory(self, dir_path: Path) -> bool:
+        """
+        Create a directory (and parents) unless this instance already created it.
+        
+        Args:
+            dir_path: Directory to create
+            
+        Returns:
+            True if mkdir was called, False if the directory was already known
+            
+        Raises:
+            OSError: If directory creation fails
+        """
+        key = os.path.abspath(dir_path)
+        if key in self._known_dirs:
+            return False
+        
+        dir_path.mkdir(parents=True, exist_ok=True)
+        self._known_dirs.add(key)
+        return True
+    
+    def _open_temp_file(self, target_path: Path):
+        """
+        Open a hidden temporary file next to the download target, recreating
+        the directory if needed.
+        
+        Args:
+            target_path: Local path the file will eventually be saved to
+            
+        Returns:
+            Tuple of (binary file object opened for writing, temporary file path)
+        """
+        # The ".part" suffix keeps partial downloads out of get_next_file_number
+        prefix = f".{target_path.name}."
+        try:
+            fd, temp_name = tempfile.mkstemp(suffix='.part', prefix=prefix, dir=target_path.parent)
+        except FileNotFoundError:
+            # A cached directory was removed after it was created
+            self._known_dirs.discard(os.path.abspath(target_path.parent))
+            self._ensure_directory(target_path.parent)
+            fd, temp_name = tempfile.mkstemp(suffix='.part', prefix=prefix, dir=target_path.parent)
+        
+        # mkstemp creates the file owner-only; the published PDF keeps this inode
+        os.fchmod(fd, _FILE_MODE)
+        return os.fdopen(fd, 'wb'), Path(temp_name)
+    
+    def _publish_file(self, temp_path: Path, target_path: Path) -> None:
+        """
+        Move a completed download into place without overwriting an existing file.
+        
+        Args:
+            temp_path: Completed temporary file
+            target_path: Final location of the file
+        """
+        try:
+            # link() fails if the target exists, so concurrent downloads of the
+            # same file leave exactly one winner and never a half-written file
+            os.link(temp_path, target_path)
+        except FileExistsError:
+            self.logger.logger.debug("File already saved by another download: %s", target_path)
+        except OSError as e:
+            if e.errno not in _NO_HARD_LINK_ERRNOS:
+                raise
+            
+            # Filesystem without hard links: claim the name with an exclusive
+            # create, then swap the complete file over the empty placeholder
+            try:
+                fd = os.open(target_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            except FileExistsError:
+                self.logger.logger.debug("File already saved by another download: %s", target_path)
+                return
+            os.close(fd)
+            try:
+                os.replace(temp_path, target_path)
+            except OSError:
+                # Never leave the empty placeholder behind looking like a download
+                target_path.unlink(missing_ok=True)
+                raise
+    
     def file_exists(self, file_path: Path) -> bool:
         """
         Check if file already exists to prevent duplicate downloads.
@@ -116,7 +336,12 @@ class FileManager:
         Returns:
             True if file exists, False otherwise
         """
-        exists = file_path.exists() and file_path.is_file()
+        # One stat call instead of separate exists() and is_file() probes
+        try:
+            exists = stat.S_ISREG(os.stat(file_path).st_mode)
+        except (FileNotFoundError, NotADirectoryError):
+            exists = False
+        
         if exists:
             self.logger.log_success(
                 f"File already exists, skipping: {file_path}",
@@ -134,23 +359,28 @@ class FileManager:
         Returns:
             Next available file number (starting from 1)
         """
-        if not directory.exists():
+        # Single readdir pass over the names; no Path objects or stat calls
+        highest = 0
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if len(name) <= 4 or name[-4:] != '.pdf':
+                        continue
+                    try:
+                        # Extract number from filename (e.g., "5.pdf" -> 5)
+                        number = int(name[:-4])
+                    except ValueError:
+                        # Skip files with non-numeric names
+                        continue
+                    if number > highest:
+                        highest = number
+        except (FileNotFoundError, NotADirectoryError):
             return 1
-            
-        # Find all PDF files with numeric names
-        existing_numbers = []
-        for file_path in directory.glob("*.pdf"):
-            try:
-                # Extract number from filename (e.g., "5.pdf" -> 5)
-                number = int(file_path.stem)
-                existing_numbers.append(number)
-            except ValueError:
-                # Skip files with non-numeric names
-                continue
         
         # Return next sequential number
-        next_number = max(existing_numbers, default=0) + 1
-        self.logger.logger.debug(f"Next file number for {directory}: {next_number}")
+        next_number = highest + 1
+        self.logger.logger.debug("Next file number for %s: %s", directory, next_number)
         return next_number
     
     def download_file(self, url: str, target_path: Path) -> Tuple[bool, Optional[str]]:
@@ -180,7 +410,7 @@ class FileManager:
         
         # Ensure target directory exists
         try:
-            target_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_directory(target_path.parent)
         except OSError as e:
             error_details = self.logger.log_error(
                 e, ErrorCategory.FILESYSTEM,
@@ -200,11 +430,11 @@ class FileManager:
         )
         
         if success:
-            # Validate downloaded file is actually a PDF
-            is_valid_pdf, pdf_error = self._validate_pdf_content(target_path)
+            # Validate downloaded file is actually a PDF from the bytes seen while streaming
+            file_size, header = result
+            is_valid_pdf, pdf_error = self._check_pdf_signature(header)
             if not is_valid_pdf:
-                # Remove invalid file
-                target_path.unlink(missing_ok=True)
+                # Invalid files are never moved into place, so there is nothing to remove
                 error = ValueError(f"Downloaded file is not a valid PDF: {pdf_error}")
                 error_details = self.logger.log_error(
                     error, ErrorCategory.VALIDATION,
@@ -216,13 +446,97 @@ class FileManager:
                 f"Successfully downloaded and validated PDF file",
                 url=url,
                 file_path=str(target_path),
-                context={"file_size_bytes": result}
+                context={"file_size_bytes": file_size}
             )
             return True, None
         else:
             return False, error_details.message if error_details else "Download failed"
     
-    def _perform_download(self, url: str, target_path: Path) -> int:
+    def download_many(self, jobs: Iterable[Tuple[str, Path]],
+                      concurrency: Optional[int] = None) -> List[Tuple[bool, Optional[str]]]:
+        """
+        Download several files concurrently.
+        
+        Downloads run on a thread pool over the shared pooled session; requests
+        releases the GIL while waiting on the network, so no event loop is needed
+        and this works the same from scripts, notebooks and async code.
+        
+        Args:
+            jobs: (url, target_path) pairs to download
+            concurrency: Maximum downloads in flight (default: DOWNLOAD_CONCURRENCY)
+            
+        Returns:
+            List of download_file results, in job order
+        """
+        with ThreadPoolExecutor(max_workers=concurrency or self.DOWNLOAD_CONCURRENCY) as pool:
+            return list(pool.map(lambda job: self._download_job(*job), jobs))
+    
+    def iter_downloads(self, jobs: Iterable[Tuple[str, Path]], concurrency: Optional[int] = None
+                       ) -> Iterator[Tuple[Tuple[str, Path], Tuple[bool, Optional[str]]]]:
+        """
+        Download several files concurrently, yielding each result as it finishes.
+        
+        Args:
+            jobs: (url, target_path) pairs to download
+            concurrency: Maximum downloads in flight (default: DOWNLOAD_CONCURRENCY)
+            
+        Yields:
+            ((url, target_path), download_file result) in completion order
+        """
+        with ThreadPoolExecutor(max_workers=concurrency or self.DOWNLOAD_CONCURRENCY) as pool:
+            futures = {pool.submit(self._download_job, url, target_path): (url, target_path)
+                       for url, target_path in jobs}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+    
+    def _download_job(self, url: str, target_path: Path) -> Tuple[bool, Optional[str]]:
+        """
+        Run one download of a batch, turning unexpected errors into a failed result.
+        
+        Args:
+            url: URL to download from
+            target_path: Local path to save the file
+            
+        Returns:
+            Tuple of (success: bool, error_message: Optional[str])
+        """
+        try:
+            return self.download_file(url, target_path)
+        except Exception as e:
+            # Keep one failed download from stopping the rest of the batch
+            error_details = self.logger.log_error(
+                e, ErrorCategory.UNKNOWN, url=url, file_path=str(target_path)
+            )
+            return False, error_details.message
+    
+    async def download_many_async(self, jobs: Iterable[Tuple[str, Path]],
+                                  concurrency: Optional[int] = None) -> List[Tuple[bool, Optional[str]]]:
+        """
+        Download several files concurrently from inside an event loop.
+        
+        Each download runs download_file in a worker thread over the shared
+        pooled session, so the event loop stays free while downloads wait on
+        the network, and at most `concurrency` downloads are in flight.
+        
+        Args:
+            jobs: (url, target_path) pairs to download
+            concurrency: Maximum downloads in flight (default: DOWNLOAD_CONCURRENCY)
+            
+        Returns:
+            List of download_file results, in job order
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.DOWNLOAD_CONCURRENCY)
+        
+        async def _download(url: str, target_path: Path) -> Tuple[bool, Optional[str]]:
+            async with semaphore:
+                return await asyncio.to_thread(self._download_job, url, target_path)
+        
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(_download(url, target_path)) for url, target_path in jobs]
+        
+        return [task.result() for task in tasks]
+    
+    def _perform_download(self, url: str, target_path: Path) -> Tuple[int, bytes]:
         """
         Perform the actual file download operation with security validations.
         
@@ -231,17 +545,15 @@ class FileManager:
             target_path: Local path to save the file
             
         Returns:
-            File size in bytes
+            Tuple of (file size in bytes, leading bytes of the file for signature checks)
             
         Raises:
             Various exceptions for different error conditions
         """
+        response = None
         try:
-            # Make request with timeout and limited redirects
-            session = requests.Session()
-            session.max_redirects = self.max_redirects
-            
-            response = session.get(url, timeout=self.timeout, stream=True, allow_redirects=True)
+            # Make request with timeout and limited redirects over the pooled session
+            response = self.session.get(url, timeout=self.timeout, stream=True, allow_redirects=True)
             response.raise_for_status()
             
             # Validate final URL after redirects
@@ -259,30 +571,41 @@ class FileManager:
             if not is_valid_type:
                 raise ValueError(f"Invalid content type: {type_error}")
             
-            # Check file size from headers
+            # Check file size from headers before reading any of the body
             content_length = response.headers.get('content-length')
-            if content_length and int(content_length) > self.max_file_size_bytes:
-                size_mb = int(content_length) / (1024 * 1024)
+            file_size = int(content_length) if content_length else 0
+            if file_size > self.max_file_size_bytes:
+                size_mb = file_size / (1024 * 1024)
                 max_mb = self.max_file_size_bytes / (1024 * 1024)
                 raise ValueError(f"File too large: {size_mb:.1f}MB (max: {max_mb:.0f}MB)")
             
-            # Download file with size monitoring
+            # Download file with size monitoring into a temporary file that only becomes
+            # target_path once complete; chunks larger than the write buffer go straight to disk
             total_size = 0
-            with open(target_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            header = b''
+            temp_file, temp_path = self._open_temp_file(target_path)
+            try:
+                with temp_file as f:
+                    for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                        if len(header) < _PDF_MAGIC_LEN:
+                            header += chunk[:_PDF_MAGIC_LEN - len(header)]
                         total_size += len(chunk)
                         
-                        # Check size during download
+                        # Check size before the chunk reaches the disk
                         if total_size > self.max_file_size_bytes:
-                            f.close()
-                            target_path.unlink(missing_ok=True)  # Delete partial file
                             size_mb = total_size / (1024 * 1024)
                             max_mb = self.max_file_size_bytes / (1024 * 1024)
                             raise ValueError(f"File exceeded size limit during download: {size_mb:.1f}MB (max: {max_mb:.0f}MB)")
+                        
+                        f.write(chunk)
+                
+                # Only files with a PDF signature are moved into place
+                if header[:_PDF_MAGIC_LEN] == _PDF_MAGIC:
+                    self._publish_file(temp_path, target_path)
+            finally:
+                temp_path.unlink(missing_ok=True)
             
-            return total_size
+            return total_size, header
             
         except requests.exceptions.RequestException as e:
             # Network-related errors that should trigger retries
@@ -293,6 +616,10 @@ class FileManager:
         except Exception as e:
             # Other unexpected errors
             raise RuntimeError(f"Unexpected error downloading {url}: {e}")
+        finally:
+            # Release the pooled connection even when a check aborts the stream
+            if response is not None:
+                response.close()
     
     def _is_valid_url(self, url: str) -> bool:
         """
@@ -305,7 +632,7 @@ class FileManager:
             True if URL is valid, False otherwise
         """
         try:
-            parsed = urlparse(url)
+            parsed = _parse_url(url)
             return bool(parsed.scheme and parsed.netloc and parsed.scheme in self.ALLOWED_SCHEMES)
         except Exception:
             return False
@@ -325,20 +652,17 @@ class FileManager:
             if not self._is_valid_url(url):
                 return False, "Invalid URL format or unsupported scheme"
             
-            parsed = urlparse(url)
+            parsed = _parse_url(url)
             
             # Check for blocked domains
             hostname = parsed.hostname
             if not hostname:
                 return False, "URL must have a valid hostname"
             
-            hostname_lower = hostname.lower()
-            if hostname_lower in self.BLOCKED_DOMAINS:
-                return False, f"Access to domain '{hostname}' is not allowed"
-            
-            # Check for private IP ranges
-            if self._is_private_ip(hostname_lower):
-                return False, f"Access to private IP address '{hostname}' is not allowed"
+            # Blocked domains and private IP ranges, decided once per host
+            host_error = self._classify_host(hostname)
+            if host_error:
+                return False, host_error
             
             # Validate file extension in URL path
             if not self._has_pdf_extension(parsed.path):
@@ -354,6 +678,31 @@ class FileManager:
         except Exception as e:
             return False, f"URL validation error: {e}"
     
+    @staticmethod
+    @lru_cache(maxsize=HOST_CACHE_SIZE)
+    def _classify_host(hostname: str) -> Optional[str]:
+        """
+        Decide whether a hostname may be downloaded from.
+        
+        Archives pull many files from a handful of hosts, so the verdict is
+        cached per hostname rather than recomputed for every URL.
+        
+        Args:
+            hostname: Hostname from the URL
+            
+        Returns:
+            Reason the host is not allowed, or None if it is allowed
+        """
+        hostname_lower = hostname.lower()
+        if hostname_lower in FileManager.BLOCKED_DOMAINS:
+            return f"Access to domain '{hostname}' is not allowed"
+        
+        # Check for private IP ranges
+        if _is_private_address(hostname_lower):
+            return f"Access to private IP address '{hostname}' is not allowed"
+        
+        return None
+    
     def _is_private_ip(self, hostname: str) -> bool:
         """
         Check if hostname is a private IP address.
@@ -364,14 +713,7 @@ class FileManager:
         Returns:
             True if hostname is a private IP, False otherwise
         """
-        import ipaddress
-        
-        try:
-            ip = ipaddress.ip_address(hostname)
-            return ip.is_private or ip.is_loopback or ip.is_link_local or ip.is_multicast
-        except ValueError:
-            # Not an IP address, check if it resolves to private IP
-            return False
+        return _is_private_address(hostname)
     
     def _has_pdf_extension(self, path: str) -> bool:
         """
@@ -383,7 +725,8 @@ class FileManager:
         Returns:
             True if path ends with .pdf, False otherwise
         """
-        return path.lower().endswith('.pdf')
+        # Only the last four characters need case folding
+        return path[-4:].lower() == '.pdf'
     
     def _has_suspicious_patterns(self, url: str) -> bool:
         """
@@ -395,23 +738,14 @@ class FileManager:
         Returns:
             True if suspicious patterns found, False otherwise
         """
-        suspicious_patterns = [
-            r'\.\./',           # Directory traversal
-            r'%2e%2e%2f',      # URL encoded directory traversal
-            r'javascript:',     # JavaScript protocol
-            r'data:',          # Data protocol
-            r'file:',          # File protocol
-            r'ftp:',           # FTP protocol
-            r'@',              # Potential credential injection
-            r'[<>"\']',        # HTML/script injection characters
-        ]
-        
-        url_lower = url.lower()
-        for pattern in suspicious_patterns:
-            if re.search(pattern, url_lower):
-                return True
+        if not url.isascii():
+            return _SUSPICIOUS_RE.search(url) is not None
         
-        return False
+        lowered = url.lower()
+        for literal in _SUSPICIOUS_LITERALS:
+            if literal in lowered:
+                return True
+        return not _SUSPICIOUS_CHARS.isdisjoint(url)
     
     def _validate_content_type(self, content_type: str, url: str) -> Tuple[bool, Optional[str]]:
         """
@@ -426,12 +760,16 @@ class FileManager:
         """
         if not content_type:
             # Some servers don't set content-type, check URL extension
-            if self._has_pdf_extension(urlparse(url).path):
+            if self._has_pdf_extension(_parse_url(url).path):
                 self.logger.logger.warning(f"No content-type header, but URL has .pdf extension: {url}")
                 return True, None
             else:
                 return False, "No content-type header and URL doesn't end with .pdf"
         
+        # Most servers send a bare, lowercase type, which needs no normalizing
+        if content_type in self.ALLOWED_CONTENT_TYPES:
+            return True, None
+        
         # Normalize content type (remove charset, etc.)
         content_type_main = content_type.split(';')[0].strip().lower()
         
@@ -440,7 +778,7 @@ class FileManager:
         
         # Check if it's a generic binary type that might be PDF
         if content_type_main in ['application/octet-stream', 'binary/octet-stream']:
-            if self._has_pdf_extension(urlparse(url).path):
+            if self._has_pdf_extension(_parse_url(url).path):
                 self.logger.logger.warning(f"Generic binary content-type but .pdf extension: {url}")
                 return True, None
         
@@ -457,18 +795,31 @@ class FileManager:
             Tuple of (is_valid: bool, error_message: Optional[str])
         """
         try:
-            with open(file_path, 'rb') as f:
-                # Read first few bytes to check PDF signature
-                header = f.read(8)
-                
-                # PDF files start with %PDF-
-                if header.startswith(b'%PDF-'):
-                    return True, None
-                else:
-                    return False, f"File does not have valid PDF signature (starts with: {header[:8]})"
-                    
-        except Exception as e:
+            # Read just the signature bytes without a buffered file object
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                header = os.read(fd, _PDF_MAGIC_LEN)
+            finally:
+                os.close(fd)
+        except OSError as e:
             return False, f"Error validating PDF content: {e}"
+        
+        return self._check_pdf_signature(header)
+    
+    def _check_pdf_signature(self, header: bytes) -> Tuple[bool, Optional[str]]:
+        """
+        Check the leading bytes of a file against the PDF signature.
+        
+        Args:
+            header: First bytes of the file
+            
+        Returns:
+            Tuple of (is_valid: bool, error_message: Optional[str])
+        """
+        # PDF files start with %PDF-
+        if header[:_PDF_MAGIC_LEN] == _PDF_MAGIC:
+            return True, None
+        return False, f"File does not have valid PDF signature (starts with: {header})"
     
     def _sanitize_folder_name(self, folder_name: str) -> str:
         """
@@ -519,10 +870,7 @@ class FileManager:
         
         try:
             # Make HEAD request to get file info without downloading
-            session = requests.Session()
-            session.max_redirects = self.max_redirects
-            
-            response = session.head(url, timeout=self.timeout, allow_redirects=True)
+            response = self.session.head(url, timeout=self.timeout, allow_redirects=True)
             response.raise_for_status()
             
             # Validate final URL after redirects
@@ -582,6 +930,10 @@ class FileManager:
         """
         Download file with pre-download size check for GitHub compatibility.
         
+        The streaming GET in download_file already rejects oversized files from
+        the response headers before any of the body is read, so no separate
+        HEAD request is needed.
+        
         Args:
             url: URL to download from
             target_path: Local path to save the file
@@ -589,11 +941,4 @@ class FileManager:
         Returns:
             Tuple of (success: bool, error_message: Optional[str])
         """
-        # First check file size
-        can_download, file_size, size_error = self.check_file_size_before_download(url)
-        
-        if not can_download:
-            return False, size_error
-        
-        # If size check passed, proceed with normal download
         return self.download_file(url, target_path)
\ No newline at end of file
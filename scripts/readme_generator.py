@@ -6,6 +6,7 @@ for the Iranian Archive Workflow system.
 """
 
 import os
+import hashlib
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
@@ -17,6 +18,8 @@ class ReadmeGenerator:
         self.persian_template = self._get_persian_template()
         self.english_template = self._get_english_template()
         self.publication_template = self._get_publication_template()
+        # sha256 of the publication README content last written or seen, by path
+        self._publication_readme_hashes: Dict[str, str] = {}
     
     def generate_main_readme(self, language: str, archives: List[Dict[str, Any]], 
                            output_path: str) -> None:
@@ -224,17 +227,30 @@ This archive is automatically updated using GitHub Actions. The goal of this pro
             self.generate_publication_readme(archive, errors, readme_path)
             return
         
+        # Generate new content
+        new_content = self.generate_publication_readme(archive, errors)
+        new_hash = self._content_hash(new_content)
+        
+        # Skip the write when this README is already known to be up to date
+        if self._publication_readme_hashes.get(readme_path) == new_hash:
+            return
+        
         # Read existing content
         with open(readme_path, 'r', encoding='utf-8') as f:
             existing_content = f.read()
         
-        # Generate new content
-        new_content = self.generate_publication_readme(archive, errors)
-        
         # For publication READMEs, we replace the entire content
         # since it's generated based on current archive state
-        with open(readme_path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+        if existing_content != new_content:
+            with open(readme_path, 'w', encoding='utf-8') as f:
+                f.write(new_content)
+        
+        self._publication_readme_hashes[readme_path] = new_hash
+    
+    @staticmethod
+    def _content_hash(content: str) -> str:
+        """Return the sha256 hex digest of README content."""
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
     
     def _generate_publication_readme_bilingual(self, archive: Dict[str, Any],
                                              errors: Optional[List[str]] = None) -> str:
@@ -61,6 +61,16 @@ class StateManager:
         )
         self.processing_results.append(result)
     
+    def track_download_results_batch(self, results: List[Dict[str, Any]]) -> None:
+        """Track the results of several archives at once.
+        
+        Each entry holds the same keyword arguments accepted by track_download_result.
+        """
+        self.processing_results.extend(
+            ProcessingResult(**{**result, 'errors': result.get('errors') or []})
+            for result in results
+        )
+    
     def remove_successful_urls(self, successful_archives: List[str]) -> bool:
         """Remove successfully processed archives from urls.yml configuration."""
         if not successful_archives or not os.path.exists(self.config_path):
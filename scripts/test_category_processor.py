@@ -69,7 +69,7 @@ class TestOldNewspaperProcessor(unittest.TestCase):
     def test_process_archive_success(self):
         """Test successful processing of old newspaper archive."""
         # Mock successful downloads
-        self.file_manager.download_file.return_value = True
+        self.file_manager.download_file.return_value = (True, None)
         
         success, files_downloaded, files_failed, errors = self.processor.process_archive(self.sample_archive)
         
@@ -87,7 +87,7 @@ class TestOldNewspaperProcessor(unittest.TestCase):
     def test_process_archive_partial_failure(self):
         """Test processing with some failed downloads."""
         # Mock mixed success/failure
-        self.file_manager.download_file.side_effect = [True, False]
+        self.file_manager.download_file.side_effect = [(True, None), (False, "Download failed")]
         
         success, files_downloaded, files_failed, errors = self.processor.process_archive(self.sample_archive)
         
@@ -111,12 +111,12 @@ class TestOldNewspaperProcessor(unittest.TestCase):
         self.assertEqual(len(errors), 1)
         self.assertIn('No URLs found', errors[0])
     
-    @patch('os.path.exists')
-    @patch('os.makedirs')
-    def test_process_archive_skip_existing_files(self, mock_makedirs, mock_exists):
+    def test_process_archive_skip_existing_files(self):
         """Test that existing files are skipped."""
-        # Mock that files already exist
-        mock_exists.return_value = True
+        # Create the files that would be downloaded
+        base_dir = self.processor.create_directory_structure(self.sample_archive)
+        for i in (1, 2):
+            open(os.path.join(base_dir, f'kayhan-newspaper_{i:03d}.pdf'), 'wb').close()
         
         success, files_downloaded, files_failed, errors = self.processor.process_archive(self.sample_archive)
         
@@ -124,6 +124,24 @@ class TestOldNewspaperProcessor(unittest.TestCase):
         self.file_manager.download_file.assert_not_called()
         self.assertEqual(files_downloaded, 0)
         self.assertEqual(files_failed, 0)
+    
+    def test_process_archive_downloads_only_missing_files(self):
+        """Test that only files missing from the directory are downloaded."""
+        base_dir = self.processor.create_directory_structure(self.sample_archive)
+        open(os.path.join(base_dir, 'kayhan-newspaper_001.pdf'), 'wb').close()
+        self.file_manager.download_file.return_value = (True, None)
+        
+        with patch('os.path.exists', wraps=os.path.exists) as mock_exists:
+            success, files_downloaded, files_failed, errors = self.processor.process_archive(self.sample_archive)
+        
+        # Existing files come from one directory scan, not a stat per file
+        checked_paths = [str(call.args[0]) for call in mock_exists.call_args_list]
+        self.assertFalse([path for path in checked_paths if path.endswith('.pdf')])
+        
+        self.assertEqual(files_downloaded, 1)
+        url, path = self.file_manager.download_file.call_args[0]
+        self.assertEqual(url, 'http://example.com/file2.pdf')
+        self.assertEqual(path.name, 'kayhan-newspaper_002.pdf')
 
 
 class TestNewspaperProcessor(unittest.TestCase):
@@ -167,6 +185,16 @@ class TestNewspaperProcessor(unittest.TestCase):
         self.assertEqual(base_dir, expected_dir)
         self.assertTrue(os.path.exists(expected_dir))
     
+    def test_create_directory_structure_cached(self):
+        """Test that repeated directory creation skips makedirs."""
+        with patch('category_processor.os.makedirs', wraps=os.makedirs) as mock_makedirs:
+            first = self.processor.create_directory_structure(self.sample_archive)
+            second = self.processor.create_directory_structure(self.sample_archive)
+        
+        self.assertEqual(first, second)
+        created = [call.args[0] for call in mock_makedirs.call_args_list]
+        self.assertEqual(created.count(first), 1)
+    
     def test_should_process_in_scheduled_run(self):
         """Test that newspapers are processed in scheduled runs."""
         result = self.processor.should_process_in_scheduled_run(self.sample_archive)
@@ -179,7 +207,7 @@ class TestNewspaperProcessor(unittest.TestCase):
         mock_datetime.now.return_value.year = 2023
         mock_datetime.now.return_value.strftime.return_value = '20231201'
         
-        self.file_manager.download_file.return_value = True
+        self.file_manager.download_file.return_value = (True, None)
         
         success, files_downloaded, files_failed, errors = self.processor.process_archive(self.sample_archive)
         
@@ -193,32 +221,117 @@ class TestNewspaperProcessor(unittest.TestCase):
         mock_datetime.now.return_value.year = 2023
         mock_datetime.now.return_value.strftime.return_value = '20231201'
         
-        self.file_manager.download_file.return_value = True
+        self.file_manager.download_file.return_value = (True, None)
         
         self.processor.process_archive(self.sample_archive)
         
-        # Check download calls for correct filenames
+        # Check download calls for correct filenames (downloads run concurrently)
         calls = self.file_manager.download_file.call_args_list
         self.assertEqual(len(calls), 2)
         
-        # First file should be tehran-times_20231201_001.pdf
-        first_call_path = calls[0][0][1]  # Second argument (file_path)
-        self.assertIn('tehran-times_20231201_001.pdf', first_call_path)
+        filenames = {call[0][1].name for call in calls}  # Second argument (file_path)
+        self.assertEqual(filenames, {
+            'tehran-times_20231201_001.pdf',
+            'tehran-times_20231201_002.pdf'
+        })
+    
+    def test_process_archive_concurrent_downloads(self):
+        """Test that every URL is downloaded when dispatched through the thread pool."""
+        urls = [f'http://example.com/page{i}.pdf' for i in range(20)]
+        archive = {'folder': 'tehran-times', 'urls': urls}
+        self.file_manager.download_file.return_value = (True, None)
+        
+        success, files_downloaded, files_failed, errors = self.processor.process_archive(archive)
         
-        # Second file should be tehran-times_20231201_002.pdf
-        second_call_path = calls[1][0][1]
-        self.assertIn('tehran-times_20231201_002.pdf', second_call_path)
+        self.assertTrue(success)
+        self.assertEqual(files_downloaded, 20)
+        self.assertEqual(files_failed, 0)
+        downloaded_urls = {call[0][0] for call in self.file_manager.download_file.call_args_list}
+        self.assertEqual(downloaded_urls, set(urls))
+    
+    def test_process_archive_download_exception(self):
+        """Test that exceptions raised by a download are recorded as failures."""
+        self.file_manager.download_file.side_effect = OSError("disk full")
+        
+        success, files_downloaded, files_failed, errors = self.processor.process_archive(self.sample_archive)
+        
+        self.assertFalse(success)
+        self.assertEqual(files_downloaded, 0)
+        self.assertEqual(files_failed, 2)
+        self.assertTrue(all('disk full' in error for error in errors))
+    
+    def test_list_existing_files_creates_missing_directory(self):
+        """Test that scanning a missing directory creates it and reports no files."""
+        year_dir = os.path.join('newspaper', 'tehran-times', '2024')
+        
+        self.assertEqual(self.processor._list_existing_files(year_dir), set())
+        self.assertTrue(os.path.isdir(year_dir))
+        
+        open(os.path.join(year_dir, 'a.pdf'), 'wb').close()
+        self.assertEqual(self.processor._list_existing_files(year_dir), {'a.pdf'})
+        
+        # A directory deleted after it was first seen is created again
+        shutil.rmtree(year_dir)
+        self.assertEqual(self.processor._list_existing_files(year_dir), set())
+        self.assertTrue(os.path.isdir(year_dir))
     
     def test_update_archive_years(self):
         """Test updating archive with year information."""
         archive = {'folder': 'test-paper'}
         
-        self.processor._update_archive_years(archive, 2023, 2)
+        self.processor._update_archive_years(
+            archive, 2023, ['test-paper_20231201_001.pdf', 'test-paper_20231201_002.pdf']
+        )
         
         self.assertIn('years', archive)
         self.assertIn('2023', archive['years'])
         self.assertEqual(len(archive['years']['2023']), 2)
 
+    
+    def test_update_archive_years_no_duplicates(self):
+        """Test that repeated updates do not duplicate year entries."""
+        archive = {'folder': 'test-paper'}
+        filenames = [f'test-paper_20231201_{i:03d}.pdf' for i in (1, 2, 3)]
+        
+        self.processor._update_archive_years(archive, 2023, filenames[:2])
+        self.processor._update_archive_years(archive, 2023, filenames)
+        
+        self.assertEqual(archive['years']['2023'], [
+            'test-paper_20231201_001.pdf',
+            'test-paper_20231201_002.pdf',
+            'test-paper_20231201_003.pdf'
+        ])
+    
+    @patch('category_processor.datetime')
+    def test_process_archive_records_downloaded_filenames(self, mock_datetime):
+        """Test that only successfully downloaded files are recorded for the year."""
+        mock_datetime.now.return_value.year = 2023
+        mock_datetime.now.return_value.strftime.return_value = '20231201'
+        
+        def download_file(url, path):
+            return (True, None) if url.endswith('today2.pdf') else (False, "Download failed")
+        
+        self.file_manager.download_file.side_effect = download_file
+        
+        self.processor.process_archive(self.sample_archive)
+        
+        self.assertEqual(self.sample_archive['years']['2023'], ['tehran-times_20231201_002.pdf'])
+    
+    @patch('category_processor.datetime')
+    def test_process_archive_computes_date_once(self, mock_datetime):
+        """Test that the date string is not recomputed for every URL."""
+        mock_datetime.now.return_value.year = 2023
+        mock_datetime.now.return_value.strftime.return_value = '20231201'
+        archive = {
+            'folder': 'tehran-times',
+            'urls': [f'http://example.com/page{i}.pdf' for i in range(10)]
+        }
+        self.file_manager.download_file.return_value = (False, "Download failed")
+        
+        self.processor.process_archive(archive)
+        
+        self.assertLess(mock_datetime.now.call_count, len(archive['urls']))
+
 
 class TestCategoryProcessorFactory(unittest.TestCase):
     """Test cases for CategoryProcessorFactory class."""
@@ -257,6 +370,39 @@ class TestCategoryProcessorFactory(unittest.TestCase):
             )
         
         self.assertIn('Unsupported category: invalid-category', str(context.exception))
+    
+    def test_get_returns_shared_processors(self):
+        """Test that the factory hands out one pre-built processor per category."""
+        factory = CategoryProcessorFactory(
+            self.file_manager, self.error_handler,
+            self.state_manager, self.readme_generator
+        )
+        
+        self.assertIsInstance(factory.get('old-newspaper'), OldNewspaperProcessor)
+        self.assertIsInstance(factory.get('newspaper'), NewspaperProcessor)
+        self.assertIs(factory.get('newspaper'), factory.get('newspaper'))
+    
+    def test_processors_share_log_lock(self):
+        """Test that processors of different categories serialize error logging together."""
+        factory = CategoryProcessorFactory(
+            self.file_manager, self.error_handler,
+            self.state_manager, self.readme_generator
+        )
+        
+        self.assertIs(factory.get('old-newspaper')._log_lock,
+                      factory.get('newspaper')._log_lock)
+    
+    def test_get_invalid_category(self):
+        """Test looking up a processor for an unsupported category."""
+        factory = CategoryProcessorFactory(
+            self.file_manager, self.error_handler,
+            self.state_manager, self.readme_generator
+        )
+        
+        with self.assertRaises(ValueError) as context:
+            factory.get('invalid-category')
+        
+        self.assertIn('Unsupported category: invalid-category', str(context.exception))
 
 
 class TestWorkflowExecutor(unittest.TestCase):
@@ -289,28 +435,37 @@ class TestWorkflowExecutor(unittest.TestCase):
             ]
         }
     
-    @patch('category_processor.CategoryProcessorFactory.create_processor')
-    def test_process_archives_by_category_manual_run(self, mock_create_processor):
+    def _tracked_results(self):
+        """Collect the results handed to the state manager across batch calls."""
+        return [
+            result
+            for call in self.state_manager.track_download_results_batch.call_args_list
+            for result in call.args[0]
+        ]
+    
+    @patch('category_processor.CategoryProcessorFactory.get')
+    def test_process_archives_by_category_manual_run(self, mock_get_processor):
         """Test processing archives in manual run (all categories)."""
         # Mock processor
         mock_processor = Mock()
         mock_processor.process_archive.return_value = (True, 1, 0, [])
         mock_processor.should_process_in_scheduled_run.return_value = True
-        mock_create_processor.return_value = mock_processor
+        mock_get_processor.return_value = mock_processor
         
         self.executor.process_archives_by_category(self.sample_archives, is_scheduled_run=False)
         
-        # Should create processors for both categories
-        self.assertEqual(mock_create_processor.call_count, 2)
+        # Should look up processors for both categories
+        self.assertEqual(mock_get_processor.call_count, 2)
         
         # Should process both archives
         self.assertEqual(mock_processor.process_archive.call_count, 2)
         
-        # Should track results for both archives
-        self.assertEqual(self.state_manager.track_download_result.call_count, 2)
+        # Should track results for both archives in a single batch
+        self.state_manager.track_download_results_batch.assert_called_once()
+        self.assertEqual(len(self._tracked_results()), 2)
     
-    @patch('category_processor.CategoryProcessorFactory.create_processor')
-    def test_process_archives_by_category_scheduled_run(self, mock_create_processor):
+    @patch('category_processor.CategoryProcessorFactory.get')
+    def test_process_archives_by_category_scheduled_run(self, mock_get_processor):
         """Test processing archives in scheduled run (only active publications)."""
         # Mock processors
         old_processor = Mock()
@@ -320,28 +475,30 @@ class TestWorkflowExecutor(unittest.TestCase):
         new_processor.should_process_in_scheduled_run.return_value = True
         new_processor.process_archive.return_value = (True, 1, 0, [])
         
-        mock_create_processor.side_effect = [old_processor, new_processor]
+        processors = {'old-newspaper': old_processor, 'newspaper': new_processor}
+        mock_get_processor.side_effect = processors.get
         
         self.executor.process_archives_by_category(self.sample_archives, is_scheduled_run=True)
         
-        # Should create processors for both categories
-        self.assertEqual(mock_create_processor.call_count, 2)
+        # Scheduling is decided once per category, not once per archive
+        old_processor.should_process_in_scheduled_run.assert_called_once_with()
+        new_processor.should_process_in_scheduled_run.assert_called_once_with()
         
         # Should only process newspaper archive (not old-newspaper)
         old_processor.process_archive.assert_not_called()
         new_processor.process_archive.assert_called_once()
         
         # Should track result for only one archive
-        self.state_manager.track_download_result.assert_called_once()
+        self.assertEqual(len(self._tracked_results()), 1)
     
-    @patch('category_processor.CategoryProcessorFactory.create_processor')
-    def test_process_archives_handles_processor_exception(self, mock_create_processor):
+    @patch('category_processor.CategoryProcessorFactory.get')
+    def test_process_archives_handles_processor_exception(self, mock_get_processor):
         """Test handling of processor exceptions."""
         # Mock processor that raises exception
         mock_processor = Mock()
         mock_processor.process_archive.side_effect = Exception("Test error")
         mock_processor.should_process_in_scheduled_run.return_value = True
-        mock_create_processor.return_value = mock_processor
+        mock_get_processor.return_value = mock_processor
         
         self.executor.process_archives_by_category(self.sample_archives, is_scheduled_run=False)
         
@@ -349,20 +506,19 @@ class TestWorkflowExecutor(unittest.TestCase):
         self.error_handler.log_error.assert_called()
         
         # Should track failure for both archives
-        self.assertEqual(self.state_manager.track_download_result.call_count, 2)
+        results = self._tracked_results()
+        self.assertEqual(len(results), 2)
         
         # Check that failures were tracked correctly
-        calls = self.state_manager.track_download_result.call_args_list
-        for call in calls:
-            args, kwargs = call
-            self.assertFalse(kwargs['success'])
-            self.assertEqual(kwargs['files_downloaded'], 0)
-            self.assertEqual(kwargs['files_failed'], 1)
-    
-    @patch('category_processor.CategoryProcessorFactory.create_processor')
-    def test_process_archives_handles_invalid_category(self, mock_create_processor):
+        for result in results:
+            self.assertFalse(result['success'])
+            self.assertEqual(result['files_downloaded'], 0)
+            self.assertEqual(result['files_failed'], 1)
+    
+    @patch('category_processor.CategoryProcessorFactory.get')
+    def test_process_archives_handles_invalid_category(self, mock_get_processor):
         """Test handling of invalid category."""
-        mock_create_processor.side_effect = ValueError("Unsupported category")
+        mock_get_processor.side_effect = ValueError("Unsupported category")
         
         invalid_archives = {
             'invalid-category': [
@@ -376,6 +532,61 @@ class TestWorkflowExecutor(unittest.TestCase):
         # Should log error
         self.error_handler.log_error.assert_called()
     
+    @patch('category_processor.CategoryProcessorFactory.get')
+    def test_process_archives_runs_concurrently(self, mock_get_processor):
+        """Test that archives are processed concurrently by the asyncio scheduler."""
+        import threading
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def process_archive(archive):
+            # Both archives must be in flight at the same time to pass the barrier
+            barrier.wait()
+            return True, 1, 0, []
+        
+        mock_processor = Mock()
+        mock_processor.process_archive.side_effect = process_archive
+        mock_get_processor.return_value = mock_processor
+        
+        self.executor.process_archives_by_category(self.sample_archives, is_scheduled_run=False)
+        
+        results = self._tracked_results()
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all(result['success'] for result in results))
+    
+    @patch('category_processor.CategoryProcessorFactory.get')
+    def test_process_archives_sequential_mode(self, mock_get_processor):
+        """Test that a concurrency limit of one keeps the sequential path."""
+        executor = WorkflowExecutor(
+            self.file_manager, self.error_handler,
+            self.state_manager, self.readme_generator,
+            max_concurrent_archives=1
+        )
+        mock_processor = Mock()
+        mock_processor.process_archive.return_value = (True, 1, 0, [])
+        mock_get_processor.return_value = mock_processor
+        
+        with patch('category_processor.asyncio.run') as mock_run:
+            executor.process_archives_by_category(self.sample_archives, is_scheduled_run=False)
+            mock_run.assert_not_called()
+        
+        names = [result['archive_name'] for result in self._tracked_results()]
+        self.assertEqual(names, ['kayhan-newspaper', 'tehran-times'])
+    
+    @patch('category_processor.CategoryProcessorFactory.get')
+    def test_processing_time_uses_monotonic_clock(self, mock_get_processor):
+        """Test that processing time is measured with the monotonic clock."""
+        mock_processor = Mock()
+        mock_processor.process_archive.return_value = (True, 1, 0, [])
+        mock_get_processor.return_value = mock_processor
+        
+        with patch('category_processor.time.monotonic', side_effect=[10.0, 12.5]):
+            self.executor.process_archives_by_category(
+                {'newspaper': self.sample_archives['newspaper']}, is_scheduled_run=False
+            )
+        
+        result, = self._tracked_results()
+        self.assertEqual(result['processing_time'], 2.5)
+    
     def test_should_run_scheduled_processing(self):
         """Test scheduled processing decision logic."""
         # Currently always returns True (can be customized)
@@ -403,6 +614,20 @@ class TestWorkflowExecutor(unittest.TestCase):
         self.assertNotIn('old-newspaper', result)
         self.assertEqual(len(result['newspaper']), 1)
     
+    def test_get_archives_for_processing_caches_scheduled_categories(self):
+        """Test that processors are asked about scheduled runs only once."""
+        with patch.object(self.executor.factory, 'get',
+                          wraps=self.executor.factory.get) as mock_get:
+            first = self.executor.get_archives_for_processing(
+                self.sample_archives, is_scheduled_run=True
+            )
+            second = self.executor.get_archives_for_processing(
+                self.sample_archives, is_scheduled_run=True
+            )
+        
+        self.assertEqual(first, second)
+        self.assertEqual(mock_get.call_count, len(self.executor.factory.SUPPORTED_CATEGORIES))
+    
     def test_get_archives_for_processing_scheduled_run_empty_newspapers(self):
         """Test getting archives for scheduled run when no newspapers exist."""
         archives_no_newspapers = {
@@ -84,6 +84,66 @@ class TestConfigParser(unittest.TestCase):
         finally:
             os.unlink(temp_path)
     
+    def test_parse_configuration_cached_until_file_changes(self):
+        """Test that an unchanged file is parsed once and results are independent copies."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False, encoding='utf-8') as f:
+            yaml.dump(self.valid_config, f, allow_unicode=True)
+            temp_path = f.name
+        
+        try:
+            parser = ConfigParser(temp_path)
+            with patch.object(parser, '_load_and_validate',
+                              wraps=parser._load_and_validate) as mock_load:
+                first = parser.parse_configuration()
+                first[0].years['2020'].append('https://example.com/extra.pdf')
+                second = parser.parse_configuration()
+                
+                self.assertEqual(mock_load.call_count, 1)
+                self.assertEqual(len(second[0].years['2020']), 2)
+                
+                # Writing the configuration invalidates the cached result
+                parser.update_configuration(second[:1])
+                third = parser.parse_configuration()
+                
+                self.assertEqual(mock_load.call_count, 2)
+                self.assertEqual(len(third), 1)
+        finally:
+            os.unlink(temp_path)
+    
+    def test_parse_many_archives_validated_in_workers(self):
+        """Test that entries past the parallel threshold keep their order and error index."""
+        count = ConfigParser.PARALLEL_VALIDATION_THRESHOLD + 3
+        config = {
+            'archives': [
+                {
+                    'title_fa': f'Archive {i}',
+                    'folder': f'archive-{i}',
+                    'category': 'newspaper',
+                    'description': f'Description {i}',
+                    'years': {'2023': [f'https://example.com/file-{i}.pdf']}
+                }
+                for i in range(count)
+            ]
+        }
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False, encoding='utf-8') as f:
+            yaml.dump(config, f, allow_unicode=True)
+            temp_path = f.name
+        
+        try:
+            archives = ConfigParser(temp_path).parse_configuration()
+            self.assertEqual([a.folder for a in archives], [f'archive-{i}' for i in range(count)])
+            
+            config['archives'][count - 1]['category'] = 'invalid-category'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                yaml.dump(config, f, allow_unicode=True)
+            
+            with self.assertRaises(ConfigurationError) as cm:
+                ConfigParser(temp_path).parse_configuration()
+            self.assertIn(f'Archive entry {count - 1}', str(cm.exception))
+        finally:
+            os.unlink(temp_path)
+    
     def test_parse_nonexistent_file(self):
         """Test parsing a non-existent configuration file."""
         parser = ConfigParser('nonexistent.yml')
@@ -123,6 +183,44 @@ class TestConfigParser(unittest.TestCase):
         finally:
             os.unlink(temp_path)
     
+    def test_parse_stops_at_first_invalid_entry(self):
+        """Test that entries are validated as they stream in, before later YAML is read."""
+        content = (
+            "archives:\n"
+            "  - title_fa: Test\n"
+            "    folder: test\n"
+            "    category: invalid-category\n"
+            "    description: Test\n"
+            "    years: {}\n"
+            "  - title_fa: 'unterminated\n"
+        )
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False, encoding='utf-8') as f:
+            f.write(content)
+            temp_path = f.name
+        
+        try:
+            parser = ConfigParser(temp_path)
+            with self.assertRaises(ConfigurationError) as cm:
+                parser.parse_configuration()
+            self.assertIn('Archive entry 0', str(cm.exception))
+        finally:
+            os.unlink(temp_path)
+    
+    def test_parse_archives_not_a_list(self):
+        """Test parsing configuration whose 'archives' value is not a list."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False, encoding='utf-8') as f:
+            f.write("archives: none\n")
+            temp_path = f.name
+        
+        try:
+            parser = ConfigParser(temp_path)
+            with self.assertRaises(ConfigurationError) as cm:
+                parser.parse_configuration()
+            self.assertIn("'archives' must be a list", str(cm.exception))
+        finally:
+            os.unlink(temp_path)
+    
     def test_validate_archive_entry_missing_fields(self):
         """Test validation with missing required fields."""
         incomplete_archive = {
@@ -268,10 +366,22 @@ class TestConfigParser(unittest.TestCase):
         self.assertLessEqual(len(result), 100)
         self.assertTrue(result.startswith('a'))
     
+    def test_validate_years_structure_interns_urls(self):
+        """Test that identical URLs in different years share one string object."""
+        years = {
+            '2020': [''.join(['https://example.com/', 'shared.pdf'])],
+            '2021': [''.join(['https://example.com/', 'shared.pdf'])],
+        }
+        self.assertIsNot(years['2020'][0], years['2021'][0])
+        
+        validated = self.parser._validate_years_structure(years)
+        
+        self.assertIs(validated['2020'][0], validated['2021'][0])
+    
     def test_is_valid_year(self):
         """Test year validation function."""
         valid_years = ['2020', '2023', '1900', '2099']
-        invalid_years = ['20', '202', '20200', 'abcd', '']
+        invalid_years = ['20', '202', '20200', 'abcd', '', '²⁰²⁰', 2020]
         
         for year in valid_years:
             with self.subTest(year=year):
@@ -297,6 +407,8 @@ class TestConfigParser(unittest.TestCase):
             'https://',
             '',
             'not-a-url',
+            'http://-bad-.com/x',
+            'http://example.com#frag',
         ]
         
         for url in valid_urls:
@@ -307,6 +419,72 @@ class TestConfigParser(unittest.TestCase):
             with self.subTest(url=url):
                 self.assertFalse(self.parser._is_valid_url(url))
     
+    def test_is_valid_url_scheme_case_and_unsafe_characters(self):
+        """Test that scheme case is ignored and unsafe path characters are rejected."""
+        self.assertTrue(self.parser._is_valid_url('HTTPS://Example.com/file.pdf'))
+        self.assertTrue(self.parser._is_valid_url('https://example.com/file.pdf?page=1'))
+        self.assertFalse(self.parser._is_valid_url('https://example.com/file<script>.pdf'))
+        self.assertFalse(self.parser._is_valid_url('https://' + 'a-' * 5000 + '!'))
+    
+    def test_check_url(self):
+        """Test combined URL format and security validation."""
+        self.parser._check_url('https://example.com/file.pdf', '2023')
+        
+        with self.assertRaises(ConfigurationError) as cm:
+            self.parser._check_url('not-a-url', '2023')
+        self.assertIn('Invalid URL format in year 2023', str(cm.exception))
+        
+        with self.assertRaises(ConfigurationError) as cm:
+            self.parser._check_url('https://example.com/onload.pdf', '2023')
+        self.assertIn('dangerous pattern: onload', str(cm.exception))
+        
+        with self.assertRaises(ConfigurationError) as cm:
+            self.parser._check_url('https://localhost/file.pdf', '2023')
+        self.assertIn("local address 'localhost'", str(cm.exception))
+    
+    def test_extract_year_from_url(self):
+        """Test Persian and Gregorian year detection in URLs."""
+        cases = {
+            'https://example.com/1399/file.pdf': 1399,
+            'https://example.com/2020/file.pdf': 2020,
+            'https://example.com/2020/1399/file.pdf': 1399,  # Persian takes precedence
+            'https://example.com/21399/file.pdf': 1399,      # Overlapping candidates
+            'https://example.com/1460/2021/file.pdf': 2021,  # Persian out of range
+            'https://example.com/2150/file.pdf': None,
+            'https://example.com/file.pdf': None,
+        }
+        
+        for url, expected in cases.items():
+            with self.subTest(url=url):
+                self.assertEqual(self.parser._extract_year_from_url(url), expected)
+    
+    def test_group_urls_by_year(self):
+        """Test grouping URLs by year, with undated URLs joining the latest year."""
+        groups = self.parser._group_urls_by_year([
+            'https://example.com/2020/a.pdf',
+            'https://example.com/undated.pdf',
+            'https://example.com/2021/b.pdf',
+            'https://example.com/2020/c.pdf',
+        ])
+        
+        self.assertEqual(groups, {
+            '2020': ['https://example.com/2020/a.pdf', 'https://example.com/2020/c.pdf'],
+            '2021': ['https://example.com/2021/b.pdf', 'https://example.com/undated.pdf'],
+        })
+        self.assertIs(type(groups), dict)
+    
+    @patch('config_parser.URLPatternDetector', create=True)
+    @patch('config_parser.CRAWLER_AVAILABLE', True)
+    def test_detector_is_reused(self, mock_detector_class):
+        """Test that crawl checks share one lazily created URLPatternDetector."""
+        mock_detector_class.return_value.analyze_url.side_effect = Exception("offline")
+        
+        self.parser._should_crawl_url('https://example.com/archive/')
+        self.parser._should_crawl_url('https://example.com/files/')
+        
+        mock_detector_class.assert_called_once_with()
+        self.assertIs(self.parser.detector, mock_detector_class.return_value)
+    
     def test_update_configuration(self):
         """Test updating configuration file."""
         archives = [
@@ -412,6 +590,26 @@ class TestConfigParser(unittest.TestCase):
         self.assertIn("&lt;", sanitized)
         self.assertIn("&gt;", sanitized)
     
+    def test_input_sanitization_multiple_patterns(self):
+        """Test that every dangerous pattern is removed, including multi-line tags."""
+        dangerous_title = (
+            "<script>\nalert('xss')\n</script>Title "
+            "<iframe src='x'></iframe>javascript:onclick= data:"
+        )
+        sanitized = self.parser._sanitize_string_input(dangerous_title, "title")
+        self.assertEqual(sanitized, "Title")
+    
+    def test_input_sanitization_clean_input_fast_path(self):
+        """Test that clean input is only trimmed and still length-checked."""
+        with patch('config_parser.html.escape') as mock_escape:
+            sanitized = self.parser._sanitize_string_input(" روزنامه کیهان ", "title")
+        
+        self.assertEqual(sanitized, "روزنامه کیهان")
+        mock_escape.assert_not_called()
+        
+        with self.assertRaises(ConfigurationError):
+            self.parser._sanitize_string_input("a" * 11, "title", 10)
+    
     def test_url_security_validation(self):
         """Test URL security validation."""
         # Valid URLs should pass
@@ -465,6 +663,21 @@ class TestArchiveDataClass(unittest.TestCase):
         self.assertEqual(archive.description, 'Test description')
         self.assertEqual(archive.years, {'2023': ['https://example.com/test.pdf']})
 
+    
+    def test_archive_is_frozen_and_slotted(self):
+        """Test that Archive fields cannot be reassigned and carry no instance dict."""
+        archive = Archive(
+            title_fa='Test Title',
+            folder='test-folder',
+            category='newspaper',
+            description='Test description',
+            years={}
+        )
+        
+        with self.assertRaises(AttributeError):
+            archive.folder = 'other-folder'
+        self.assertFalse(hasattr(archive, '__dict__'))
+
 
 class TestConfigurationError(unittest.TestCase):
     """Test cases for ConfigurationError exception."""
@@ -0,0 +1,620 @@
+"""
+Unit tests for Directory Crawler module.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+import directory_crawler
+from directory_crawler import DirectoryCrawler, CrawlConfig, CrawlResult
+
+
+def make_response(body, content_type='text/html'):
+    """Build a fake requests.Response for a directory listing."""
+    response = Mock()
+    response.headers = {'content-type': content_type}
+    response.text = body
+    response.raise_for_status = Mock()
+    return response
+
+
+def listing(*hrefs):
+    """Build an autoindex-style HTML page linking to the given hrefs."""
+    links = ''.join(f'<a href="{href}">{href}</a>' for href in hrefs)
+    return f'<html><body><a href="../">Parent</a>{links}</body></html>'
+
+
+class TestDirectoryCrawler(unittest.TestCase):
+    """Test cases for DirectoryCrawler class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.pages = {
+            'http://example.com/': listing('1377/', '1378/', 'index.pdf'),
+            'http://example.com/1377/': listing('1.pdf', '2.pdf'),
+            'http://example.com/1378/': listing('1.pdf'),
+        }
+        self.crawler = DirectoryCrawler(CrawlConfig(delay_between_requests=0))
+        self.crawler.session = Mock()
+        self.crawler.session.get.side_effect = lambda url, **kwargs: make_response(self.pages[url])
+
+    def test_crawl_discovers_nested_files(self):
+        """Test files in nested directories are discovered."""
+        result = self.crawler.crawl_directory('http://example.com/')
+
+        self.assertEqual(result.errors, [])
+        self.assertEqual(sorted(result.discovered_files), [
+            'http://example.com/1377/1.pdf',
+            'http://example.com/1377/2.pdf',
+            'http://example.com/1378/1.pdf',
+            'http://example.com/index.pdf',
+        ])
+        self.assertEqual(sorted(result.discovered_directories), [
+            'http://example.com/1377/',
+            'http://example.com/1378/',
+        ])
+
+    def test_sibling_directories_fetched_concurrently(self):
+        """Test sibling subdirectories are fetched at the same time."""
+        self.pages['http://example.com/'] = listing('1377/', '1378/', '1379/', '1380/')
+        for year in ('1377', '1378', '1379', '1380'):
+            self.pages[f'http://example.com/{year}/'] = listing('1.pdf')
+
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_get(url, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            return make_response(self.pages[url])
+
+        self.crawler.session.get.side_effect = slow_get
+        result = self.crawler.crawl_directory('http://example.com/')
+
+        self.assertEqual(result.total_files, 4)
+        self.assertGreater(peak, 1)
+
+    def test_concurrency_bounded_by_config(self):
+        """Test no more than max_concurrent_requests fetches are in flight."""
+        self.crawler.config.max_concurrent_requests = 1
+        self.pages['http://example.com/'] = listing('1377/', '1378/', '1379/')
+        for year in ('1377', '1378', '1379'):
+            self.pages[f'http://example.com/{year}/'] = listing('1.pdf')
+
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_get(url, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return make_response(self.pages[url])
+
+        self.crawler.session.get.side_effect = slow_get
+        result = self.crawler.crawl_directory('http://example.com/')
+
+        self.assertEqual(result.total_files, 3)
+        self.assertEqual(peak, 1)
+
+    def test_crawl_is_breadth_first(self):
+        """Test all directories of one level are fetched before the next level."""
+        self.crawler.config.max_concurrent_requests = 1
+        self.pages['http://example.com/1377/'] = listing('farvardin/')
+        self.pages['http://example.com/1377/farvardin/'] = listing('1.pdf')
+
+        result = self.crawler.crawl_directory('http://example.com/')
+
+        fetched = [call.args[0] for call in self.crawler.session.get.call_args_list]
+        self.assertEqual(fetched, [
+            'http://example.com/',
+            'http://example.com/1377/',
+            'http://example.com/1378/',
+            'http://example.com/1377/farvardin/',
+        ])
+        self.assertEqual(result.total_files, 3)
+
+    def test_delay_applies_per_host(self):
+        """Test the request delay only spaces out fetches to the same host."""
+        self.crawler.config.delay_between_requests = 0.2
+        self.pages['http://example.com/'] = listing('1377/', 'http://mirror.org/1378/')
+        self.pages['http://mirror.org/1378/'] = listing('1.pdf')
+
+        started = {}
+
+        def get(url, **kwargs):
+            started[url] = time.monotonic()
+            return make_response(self.pages[url])
+
+        self.crawler.session.get.side_effect = get
+        result = self.crawler.crawl_directory('http://example.com/')
+
+        self.assertEqual(result.total_files, 3)
+        root = started['http://example.com/']
+        self.assertGreaterEqual(started['http://example.com/1377/'] - root, 0.2)
+        self.assertLess(started['http://mirror.org/1378/'] - root, 0.2)
+
+    def test_max_total_files_stops_crawl(self):
+        """Test the file limit holds within a listing and stops queued fetches."""
+        self.crawler.config.max_total_files = 2
+        self.pages['http://example.com/'] = listing('1377/', '1378/', 'a.pdf', 'b.pdf', 'c.pdf')
+
+        result = self.crawler.crawl_directory('http://example.com/')
+
+        self.assertEqual(result.discovered_files, ['http://example.com/a.pdf', 'http://example.com/b.pdf'])
+        self.assertEqual(result.total_files, 2)
+        self.assertEqual(self.crawler.session.get.call_count, 1)
+
+    def test_max_total_files_cancels_in_flight_fetches(self):
+        """Test reaching the limit ends the crawl without waiting for slow siblings."""
+        self.crawler.config.max_total_files = 1
+        self.pages['http://example.com/'] = listing('1377/', '1378/')
+        release = threading.Event()
+
+        def get(url, **kwargs):
+            if url == 'http://example.com/1378/':
+                release.wait(5)
+            return make_response(self.pages[url])
+
+        self.crawler.session.get.side_effect = get
+
+        async def crawl():
+            task = asyncio.create_task(self.crawler._crawl_async('http://example.com/', 5))
+            await asyncio.wait_for(task, timeout=2)
+            release.set()
+
+        asyncio.run(crawl())
+
+        self.assertEqual(self.crawler.discovered_files, ['http://example.com/1377/1.pdf'])
+
+    def test_failed_fetch_recorded_as_error(self):
+        """Test a failing subdirectory does not stop its siblings."""
+        def get(url, **kwargs):
+            if url == 'http://example.com/1377/':
+                raise requests.exceptions.ConnectionError('connection refused')
+            return make_response(self.pages[url])
+
+        self.crawler.session.get.side_effect = get
+        result = self.crawler.crawl_directory('http://example.com/')
+
+        self.assertEqual(sorted(result.discovered_files), [
+            'http://example.com/1378/1.pdf',
+            'http://example.com/index.pdf',
+        ])
+        self.assertEqual(len(result.errors), 1)
+        self.assertIn('Failed to crawl http://example.com/1377/', result.errors[0])
+
+    def test_non_navigational_links_skipped(self):
+        """Test anchors, other schemes and autoindex sort links are not followed."""
+        self.pages['http://example.com/'] = listing(
+            '#top', 'mailto:archive@example.com', 'javascript:void(0)', 'tel:+98',
+            'data:text/plain,x.pdf', '?C=N;O=D', '?C=M;O=A', './', '1378/'
+        )
+
+        result = self.crawler.crawl_directory('http://example.com/')
+
+        self.assertEqual(result.discovered_files, ['http://example.com/1378/1.pdf'])
+        self.assertEqual(result.discovered_directories, ['http://example.com/1378/'])
+        self.assertEqual(self.crawler.session.get.call_count, 2)
+
+    def test_duplicate_links_recorded_once(self):
+        """Test files and directories linked repeatedly are only recorded once."""
+        self.pages['http://example.com/'] = listing('1377/', '1377/', 'index.pdf', 'index.pdf')
+        self.pages['http://example.com/1377/'] = listing('1.pdf', '../index.pdf')
+
+        result = self.crawler.crawl_directory('http://example.com/')
+
+        self.assertEqual(result.discovered_files, [
+            'http://example.com/index.pdf',
+            'http://example.com/1377/1.pdf',
+        ])
+        self.assertEqual(result.discovered_directories, ['http://example.com/1377/'])
+
+    def test_json_listing(self):
+        """Test JSON directory listings are parsed and deduplicated."""
+        self.pages['http://example.com/'] = {'files': [
+            'index.pdf', 'index.pdf',
+            {'name': '1377/', 'type': 'directory'},
+            {'name': '1377/', 'type': 'directory'},
+        ]}
+        self.pages['http://example.com/1377/'] = {'items': [{'filename': '1.pdf', 'type': 'file'}]}
+
+        def get(url, **kwargs):
+            response = make_response('', 'application/json')
+            response.content = json.dumps(self.pages[url]).encode('utf-8')
+            response.json.return_value = self.pages[url]
+            return response
+
+        self.crawler.session.get.side_effect = get
+        result = self.crawler.crawl_directory('http://example.com/')
+
+        self.assertEqual(result.discovered_files, [
+            'http://example.com/index.pdf',
+            'http://example.com/1377/1.pdf',
+        ])
+        self.assertEqual(result.discovered_directories, ['http://example.com/1377/'])
+        self.assertEqual(self.crawler.session.get.call_count, 2)
+
+    def test_canonicalize(self):
+        """Test equivalent URL spellings share one canonical form."""
+        canonical = 'http://example.com/Neshat/1377'
+        for url in ('http://example.com/Neshat/1377/',
+                    'HTTP://Example.COM:80/Neshat/1377',
+                    'http://example.com//Neshat///1377/?',
+                    'http://example.com/Neshat/1377/#issues'):
+            self.assertEqual(self.crawler._canonicalize(url), canonical)
+
+        self.assertEqual(self.crawler._canonicalize('https://example.com:443/?b=2&a=1'),
+                         'https://example.com/?a=1&b=2')
+        self.assertEqual(self.crawler._canonicalize('https://example.com:8443/a'),
+                         'https://example.com:8443/a')
+        self.assertNotEqual(self.crawler._canonicalize('http://example.com/a'),
+                            self.crawler._canonicalize('http://example.com/A'))
+
+    def test_equivalent_urls_crawled_once(self):
+        """Test equivalent directory and file URLs are only fetched and recorded once."""
+        self.pages['http://example.com/'] = listing('1377/', '1377', '1377/#top', 'a.pdf', 'a.pdf#p2')
+        self.pages['http://example.com/1377/'] = listing('1.pdf', '//example.com/1377/1.pdf')
+
+        result = self.crawler.crawl_directory('http://example.com/')
+
+        self.assertEqual(result.discovered_files, ['http://example.com/a.pdf', 'http://example.com/1377/1.pdf'])
+        self.assertEqual(result.discovered_directories, ['http://example.com/1377/'])
+        self.assertEqual(self.crawler.session.get.call_count, 2)
+
+    def test_unchanged_listings_reused_from_cache(self):
+        """Test listings answered with 304 reuse the children saved by the previous crawl."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = CrawlConfig(delay_between_requests=0,
+                                 cache_file=os.path.join(temp_dir, 'crawl.cache.json'))
+            requests_made = []
+
+            def get(url, headers=None, **kwargs):
+                requests_made.append((url, headers))
+                etag = f'"{url}"'
+                if headers and headers.get('If-None-Match') == etag:
+                    response = make_response('')
+                    response.status_code = 304
+                    return response
+                response = make_response(self.pages[url])
+                response.status_code = 200
+                response.headers['etag'] = etag
+                return response
+
+            first = DirectoryCrawler(config)
+            first.session = Mock()
+            first.session.get.side_effect = get
+            first_result = first.crawl_directory('http://example.com/')
+
+            second = DirectoryCrawler(config)
+            second.session = Mock()
+            second.session.get.side_effect = get
+            requests_made.clear()
+            second_result = second.crawl_directory('http://example.com/')
+
+        self.assertEqual(second_result.discovered_files, first_result.discovered_files)
+        self.assertEqual(second_result.discovered_directories, first_result.discovered_directories)
+        self.assertEqual(len(requests_made), 3)
+        for url, headers in requests_made:
+            self.assertEqual(headers, {'If-None-Match': f'"{url}"'})
+
+    def test_not_modified_not_raised_as_error(self):
+        """Test a 304 is reused even when raise_for_status rejects non-2xx like httpx."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = CrawlConfig(delay_between_requests=0,
+                                 cache_file=os.path.join(temp_dir, 'crawl.cache.json'))
+
+            def get(url, headers=None, **kwargs):
+                etag = f'"{url}"'
+                if headers and headers.get('If-None-Match') == etag:
+                    response = make_response('')
+                    response.status_code = 304
+                else:
+                    response = make_response(self.pages[url])
+                    response.status_code = 200
+                    response.headers['etag'] = etag
+                if not 200 <= response.status_code < 300:
+                    response.raise_for_status.side_effect = requests.HTTPError(
+                        f"{response.status_code} for {url}"
+                    )
+                return response
+
+            first = DirectoryCrawler(config)
+            first.session = Mock()
+            first.session.get.side_effect = get
+            first_result = first.crawl_directory('http://example.com/')
+
+            second = DirectoryCrawler(config)
+            second.session = Mock()
+            second.session.get.side_effect = get
+            second_result = second.crawl_directory('http://example.com/')
+
+        self.assertEqual(second_result.errors, [])
+        self.assertEqual(second_result.discovered_files, first_result.discovered_files)
+        self.assertEqual(second_result.discovered_directories, first_result.discovered_directories)
+
+    def test_listing_cut_short_not_cached(self):
+        """Test a listing cut off by a limit is fetched in full after a 304-capable run."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_file = os.path.join(temp_dir, 'crawl.cache.json')
+
+            def get(url, headers=None, **kwargs):
+                etag = f'"{url}"'
+                if headers and headers.get('If-None-Match') == etag:
+                    response = make_response('')
+                    response.status_code = 304
+                    return response
+                response = make_response(self.pages[url])
+                response.status_code = 200
+                response.headers['etag'] = etag
+                return response
+
+            for limits in ({'max_total_files': 2}, {'max_files_per_directory': 1}):
+                with self.subTest(**limits):
+                    if os.path.exists(cache_file):
+                        os.remove(cache_file)
+                    first = DirectoryCrawler(CrawlConfig(delay_between_requests=0,
+                                                         cache_file=cache_file, **limits))
+                    first.session = Mock()
+                    first.session.get.side_effect = get
+                    first_result = first.crawl_directory('http://example.com/')
+                    self.assertLess(len(first_result.discovered_files), 4)
+
+                    second = DirectoryCrawler(CrawlConfig(delay_between_requests=0,
+                                                          cache_file=cache_file))
+                    second.session = Mock()
+                    second.session.get.side_effect = get
+                    second_result = second.crawl_directory('http://example.com/')
+
+                    self.assertEqual(sorted(second_result.discovered_files), [
+                        'http://example.com/1377/1.pdf',
+                        'http://example.com/1377/2.pdf',
+                        'http://example.com/1378/1.pdf',
+                        'http://example.com/index.pdf',
+                    ])
+
+    def test_files_streamed_to_output_file(self):
+        """Test discovered files are written to output_file instead of kept in memory."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = os.path.join(temp_dir, 'urls.txt')
+            self.crawler.config.output_file = output_file
+
+            result = self.crawler.crawl_directory('http://example.com/')
+
+            with open(output_file, encoding='utf-8') as f:
+                written = f.read().splitlines()
+
+        self.assertEqual(result.discovered_files, [])
+        self.assertEqual(result.total_files, 4)
+        self.assertEqual(sorted(written), [
+            'http://example.com/1377/1.pdf',
+            'http://example.com/1377/2.pdf',
+            'http://example.com/1378/1.pdf',
+            'http://example.com/index.pdf',
+        ])
+
+    def test_results_independent_between_crawls(self):
+        """Test a second crawl does not change the result of the first."""
+        first = self.crawler.crawl_directory('http://example.com/')
+        files = list(first.discovered_files)
+
+        self.crawler.crawl_directory('http://example.com/1378/')
+
+        self.assertEqual(first.discovered_files, files)
+
+    def test_decode_json(self):
+        """Test JSON bodies decode the same with or without orjson."""
+        response = Mock()
+        response.content = '{"files": ["۱.pdf"]}'.encode('utf-8')
+        response.json.return_value = {'files': ['۱.pdf']}
+
+        with patch('directory_crawler.orjson', None):
+            self.assertEqual(self.crawler._decode_json(response), {'files': ['۱.pdf']})
+
+        if directory_crawler.orjson is not None:
+            self.assertEqual(self.crawler._decode_json(response), {'files': ['۱.pdf']})
+
+    def test_crawl_many_shares_session(self):
+        """Test several base URLs are crawled with one session and one output file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = os.path.join(temp_dir, 'urls.txt')
+            self.crawler.config.output_file = output_file
+
+            with self.crawler as crawler:
+                results = crawler.crawl_many(['http://example.com/1377/', 'http://example.com/1378/'])
+
+            with open(output_file, encoding='utf-8') as f:
+                written = f.read().splitlines()
+
+        self.assertEqual([result.base_url for result in results],
+                         ['http://example.com/1377/', 'http://example.com/1378/'])
+        self.assertEqual([result.total_files for result in results], [2, 1])
+        self.assertEqual(written, [
+            'http://example.com/1377/1.pdf',
+            'http://example.com/1377/2.pdf',
+            'http://example.com/1378/1.pdf',
+        ])
+        self.assertEqual(self.crawler.session.get.call_count, 2)
+        self.crawler.session.close.assert_called_once()
+
+    def test_iter_links(self):
+        """Test link extraction returns href and text of anchors only."""
+        html = ('<html><head><link href="style.css"></head><body>'
+                '<a href="1377/"><b>1377</b>/</a><a name="top">Top</a>'
+                '<a href="1.pdf">Issue 1</a></body></html>')
+
+        links = list(self.crawler._iter_links(html))
+
+        self.assertEqual(links, [('1377/', '1377/'), ('1.pdf', 'Issue 1')])
+
+    def test_stream_links_across_chunks(self):
+        """Test streamed link extraction handles tags split between chunks."""
+        html = ('<html><body><a href="1377/">[DIR] 1377</a>'
+                '<a href="1.pdf">Issue &amp; 1</a><a href="2.pdf">2</a></body></html>')
+
+        for chunk_size in (1, 7, 64, len(html)):
+            links = list(self.crawler._stream_links(html, chunk_size=chunk_size))
+            self.assertEqual(links, [
+                ('1377/', '[DIR] 1377'),
+                ('1.pdf', 'Issue & 1'),
+                ('2.pdf', '2'),
+            ])
+
+    def test_stream_links_unclosed_anchor(self):
+        """Test an anchor left open at the end of the page is still returned."""
+        links = list(self.crawler._stream_links('<a href="1.pdf">Issue 1'))
+
+        self.assertEqual(links, [('1.pdf', 'Issue 1')])
+
+    def test_is_downloadable_file(self):
+        """Test file detection by extension in path and query."""
+        self.assertTrue(self.crawler._is_downloadable_file('http://example.com/1377/1.PDF'))
+        self.assertTrue(self.crawler._is_downloadable_file('http://example.com/a.rtf'))
+        self.assertTrue(self.crawler._is_downloadable_file('http://example.com/get?file=issue.docx'))
+        self.assertTrue(self.crawler._is_downloadable_file('http://example.com/get?id=issue.odt'))
+        self.assertFalse(self.crawler._is_downloadable_file('http://example.com/1377/'))
+        self.assertFalse(self.crawler._is_downloadable_file('http://example.com/a.pdf.zip'))
+
+    def test_custom_allowed_extensions(self):
+        """Test configured extensions are recognised in path and query."""
+        crawler = DirectoryCrawler(CrawlConfig(allowed_extensions={'.djvu', '.epub'}))
+
+        self.assertTrue(crawler._is_downloadable_file('http://example.com/1377/1.DjVu'))
+        self.assertTrue(crawler._is_downloadable_file('http://example.com/get?file=book.epub&v=2'))
+        self.assertFalse(crawler._is_downloadable_file('http://example.com/get?id=book.epub'))
+        self.assertFalse(crawler._is_downloadable_file('http://example.com/1377/1.zip'))
+
+    def test_url_features_cached(self):
+        """Test each URL is parsed once across the link predicates."""
+        directory_crawler._url_features.cache_clear()
+        url = 'http://example.com/Admin/%D9%86.PDF?File=A.pdf'
+
+        self.assertEqual(directory_crawler._url_features(url),
+                         (url.lower(), '/admin/ن.pdf', 'file=a.pdf'))
+        self.crawler._is_downloadable_file(url)
+        self.crawler._is_blocked_url(url)
+
+        info = directory_crawler._url_features.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 2)
+
+    def test_is_blocked_url(self):
+        """Test blocked patterns match anywhere in the URL, case-insensitively."""
+        self.assertTrue(self.crawler._is_blocked_url('http://example.com/Admin/'))
+        self.assertTrue(self.crawler._is_blocked_url('http://example.com/1377/?next=LOGIN'))
+        self.assertFalse(self.crawler._is_blocked_url('http://example.com/1377/'))
+
+        crawler = DirectoryCrawler(CrawlConfig(blocked_patterns={'a.b', '(x)'}))
+        self.assertTrue(crawler._is_blocked_url('http://example.com/a.b/'))
+        self.assertTrue(crawler._is_blocked_url('http://example.com/(x)/'))
+        self.assertFalse(crawler._is_blocked_url('http://example.com/axb/x/'))
+
+        crawler = DirectoryCrawler(CrawlConfig(blocked_patterns=set()))
+        self.assertFalse(crawler._is_blocked_url('http://example.com/admin/'))
+
+    def test_looks_like_directory(self):
+        """Test directory detection by href and link text."""
+        self.assertTrue(self.crawler._looks_like_directory('1377/', ''))
+        self.assertTrue(self.crawler._looks_like_directory('neshat', ''))
+        self.assertTrue(self.crawler._looks_like_directory('a.b', '[DIR] a.b'))
+        self.assertTrue(self.crawler._looks_like_directory('Mar.2001', ''))
+        self.assertTrue(self.crawler._looks_like_directory('مهر.1377', ''))
+        self.assertFalse(self.crawler._looks_like_directory('issue.pdf', 'issue'))
+
+    def test_extract_year_from_url(self):
+        """Test Persian years take precedence over Gregorian years."""
+        self.assertEqual(self.crawler._extract_year_from_url('http://example.com/2001/1377/1.pdf'), 1377)
+        self.assertEqual(self.crawler._extract_year_from_url('http://example.com/2001/1.pdf'), 2001)
+        self.assertIsNone(self.crawler._extract_year_from_url('http://example.com/1.pdf'))
+        # Only the first candidate of each calendar counts, as before
+        self.assertEqual(self.crawler._extract_year_from_url('http://example.com/1499/2001/1377.pdf'), 2001)
+        self.assertIsNone(self.crawler._extract_year_from_url('http://example.com/2150/2001.pdf'))
+        self.assertEqual(self.crawler._extract_year_from_url('http://example.com/21377.pdf'), 1377)
+
+    def test_accept_encoding_matches_installed_decoders(self):
+        """Test brotli and zstd are only advertised when they can be decoded."""
+        session = DirectoryCrawler()._create_session()
+        self.assertEqual(session.headers['Accept-Encoding'], directory_crawler.ACCEPT_ENCODING)
+
+        with patch('importlib.util.find_spec', return_value=None):
+            self.assertEqual(directory_crawler._supported_encodings(), 'gzip, deflate')
+
+        with patch('importlib.util.find_spec', side_effect=lambda name: name in ('brotli', 'zstandard')):
+            self.assertEqual(directory_crawler._supported_encodings(), 'gzip, deflate, br, zstd')
+
+    def test_session_keeps_per_host_pools(self):
+        """Test the requests session caches pools for many hosts."""
+        with patch('directory_crawler.HTTP2_AVAILABLE', False):
+            session = DirectoryCrawler(CrawlConfig(max_concurrent_requests=5))._create_session()
+
+        adapter = session.get_adapter('https://example.com/')
+        self.assertEqual(adapter._pool_connections, DirectoryCrawler.POOL_CONNECTIONS)
+        self.assertEqual(adapter._pool_maxsize, 5)
+
+    def test_generate_urls_config(self):
+        """Test files are grouped per newspaper and year into plain dicts."""
+        result = CrawlResult(
+            base_url='http://example.com/',
+            discovered_files=[
+                'http://example.com/neshat-1377/1.pdf',
+                'http://example.com/neshat-1377/2.pdf',
+                'http://example.com/neshat-1378/1.pdf',
+                'http://example.com/1377/1.p',
+                'http://example.com/1.p',
+            ],
+            discovered_directories=[],
+            total_files=5,
+            crawl_depth=2,
+            errors=[],
+            processing_time=0.0
+        )
+
+        configs = self.crawler.generate_urls_config(result, {'folder': 'misc'})
+
+        self.assertEqual(len(configs), 2)
+        neshat, ungrouped = configs
+        self.assertEqual(neshat['folder'], 'neshat')
+        self.assertEqual(neshat['years'], {
+            '1377': ['http://example.com/neshat-1377/1.pdf', 'http://example.com/neshat-1377/2.pdf'],
+            '1378': ['http://example.com/neshat-1378/1.pdf'],
+        })
+        self.assertEqual(neshat['source_info']['total_files'], 3)
+        self.assertEqual(ungrouped['folder'], 'misc')
+        self.assertEqual(ungrouped['years'], {
+            '1377': ['http://example.com/1377/1.p'],
+            'unknown': ['http://example.com/1.p'],
+        })
+        self.assertEqual(ungrouped['source_info']['total_files'], 2)
+        self.assertIs(type(neshat['years']), dict)
+        self.assertIs(type(ungrouped['years']), dict)
+
+    def test_crawl_from_running_event_loop(self):
+        """Test the synchronous API still works when called from async code."""
+        async def crawl():
+            return self.crawler.crawl_directory('http://example.com/')
+
+        result = asyncio.run(crawl())
+
+        self.assertEqual(result.total_files, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,17 +6,24 @@ Tests cover error categorization, retry mechanisms, logging functionality,
 and various error scenarios that can occur during workflow execution.
 """
 
+import asyncio
+import logging
+import socket
 import unittest
 import tempfile
 import json
 import time
-from unittest.mock import Mock, patch, MagicMock
+from collections import deque
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from datetime import datetime
 from pathlib import Path
 
+import requests
+import yaml
+
 from error_handler import (
     ErrorCategory, ErrorDetails, ProcessingSummary, WorkflowLogger,
-    RetryHandler, create_workflow_logger, create_retry_handler
+    RetryHandler, ErrorHandler, create_workflow_logger, create_retry_handler
 )
 
 
@@ -46,6 +53,7 @@ class TestErrorDetails(unittest.TestCase):
         self.assertEqual(error_details.exception_type, "TimeoutError")
         self.assertEqual(error_details.retry_count, 2)
         self.assertEqual(error_details.context["operation"], "download")
+        self.assertFalse(hasattr(error_details, "__dict__"))
     
     def test_error_details_to_dict(self):
         """Test converting ErrorDetails to dictionary."""
@@ -64,6 +72,38 @@ class TestErrorDetails(unittest.TestCase):
         self.assertEqual(result["timestamp"], timestamp.isoformat())
         self.assertEqual(result["url"], "https://example.com/file.pdf")
         self.assertIsNone(result["file_path"])
+    
+    def test_traceback_formatted_lazily(self):
+        """Test that tracebacks are kept raw until requested."""
+        try:
+            raise ValueError("boom")
+        except ValueError as e:
+            error = e
+        
+        logger = WorkflowLogger("test_traceback_logger")
+        error_details = logger.log_error(error, ErrorCategory.VALIDATION)
+        
+        self.assertNotIsInstance(error_details.traceback_info, str)
+        self.assertIsNone(error_details.to_dict()["traceback_info"])
+        
+        formatted = error_details.to_dict(include_traceback=True)["traceback_info"]
+        self.assertIn("Traceback (most recent call last):", formatted)
+        self.assertIn("test_traceback_formatted_lazily", formatted)
+        self.assertIs(error_details.traceback_info_str, error_details.traceback_info_str)
+    
+    def test_monotonic_timestamp_converted_lazily(self):
+        """Test that logged errors carry a monotonic stamp until read."""
+        logger = WorkflowLogger("test_timestamp_logger")
+        before = datetime.now()
+        error_details = logger.log_error(RuntimeError("boom"), ErrorCategory.UNKNOWN)
+        
+        self.assertIsInstance(error_details.timestamp_ns, int)
+        self.assertIsNone(error_details._timestamp)
+        
+        self.assertIsInstance(error_details.timestamp, datetime)
+        self.assertLess(abs((error_details.timestamp - before).total_seconds()), 1.0)
+        self.assertEqual(error_details.to_dict()["timestamp"], error_details.timestamp.isoformat())
+        self.assertIs(error_details.timestamp, error_details.timestamp)
 
 
 class TestProcessingSummary(unittest.TestCase):
@@ -76,10 +116,11 @@ class TestProcessingSummary(unittest.TestCase):
         self.assertEqual(summary.total_operations, 0)
         self.assertEqual(summary.successful_operations, 0)
         self.assertEqual(summary.failed_operations, 0)
-        self.assertEqual(len(summary.errors_by_category), 0)
+        self.assertEqual(summary.errors_by_category, dict.fromkeys(ErrorCategory, 0))
         self.assertEqual(len(summary.error_details), 0)
         self.assertIsNone(summary.start_time)
         self.assertIsNone(summary.end_time)
+        self.assertFalse(hasattr(summary, "__dict__"))
     
     def test_success_rate_calculation(self):
         """Test success rate calculation."""
@@ -111,6 +152,11 @@ class TestProcessingSummary(unittest.TestCase):
         summary.end_time = end_time
         
         self.assertAlmostEqual(summary.duration, 5.5, places=1)
+        
+        # Monotonic readings take precedence over wall-clock times
+        summary.start_ns = 1_000_000_000
+        summary.end_ns = 3_500_000_000
+        self.assertAlmostEqual(summary.duration, 2.5)
     
     def test_summary_to_dict(self):
         """Test converting ProcessingSummary to dictionary."""
@@ -143,6 +189,22 @@ class TestWorkflowLogger(unittest.TestCase):
         self.assertIsNotNone(self.logger.logger)
         self.assertIsInstance(self.logger.summary, ProcessingSummary)
     
+    def test_logger_reuses_existing_handlers(self):
+        """Test that re-creating a logger does not stack or clobber handlers."""
+        handlers = list(self.logger.logger.handlers)
+        WorkflowLogger("test_logger")
+        self.assertEqual(self.logger.logger.handlers, handlers)
+        # Records still reach root handlers such as app log config and caplog
+        self.assertTrue(self.logger.logger.propagate)
+        
+        extra_handler = logging.NullHandler()
+        self.logger.logger.addHandler(extra_handler)
+        try:
+            WorkflowLogger("test_logger")
+            self.assertIn(extra_handler, self.logger.logger.handlers)
+        finally:
+            self.logger.logger.removeHandler(extra_handler)
+    
     def test_start_and_end_processing(self):
         """Test start and end processing tracking."""
         self.assertIsNone(self.logger.summary.start_time)
@@ -193,6 +255,20 @@ class TestWorkflowLogger(unittest.TestCase):
         
         self.assertEqual(self.logger.summary.successful_operations, 1)
     
+    def test_log_success_message_format(self):
+        """Test success message layout and skipping when INFO is disabled."""
+        with self.assertLogs("test_logger", level="INFO") as captured:
+            self.logger.log_success("Saved", url="https://example.com/a.pdf",
+                                    context={"size": "1MB"})
+        self.assertEqual(captured.records[0].getMessage(),
+                         "Saved | URL: https://example.com/a.pdf | Context: {'size': '1MB'}")
+        
+        self.logger.logger.setLevel(logging.WARNING)
+        with patch.object(self.logger.logger, 'info') as mock_info:
+            self.logger.log_success("Skipped", context={"size": "1MB"})
+        mock_info.assert_not_called()
+        self.assertEqual(self.logger.summary.successful_operations, 2)
+    
     def test_increment_total_operations(self):
         """Test incrementing total operations counter."""
         self.assertEqual(self.logger.summary.total_operations, 0)
@@ -221,13 +297,71 @@ class TestWorkflowLogger(unittest.TestCase):
             with open(report_path, 'r') as f:
                 report_data = json.load(f)
             
-            self.assertEqual(report_data["total_operations"], 2)
-            self.assertEqual(report_data["successful_operations"], 1)
-            self.assertEqual(report_data["failed_operations"], 1)
-            self.assertEqual(len(report_data["error_details"]), 1)
+            self.assertEqual(report_data["summary"]["total_operations"], 2)
+            self.assertEqual(report_data["summary"]["successful_operations"], 1)
+            self.assertEqual(report_data["summary"]["failed_operations"], 1)
+            self.assertEqual(len(report_data["recent_errors"]), 1)
             
         finally:
             Path(report_path).unlink(missing_ok=True)
+    
+    def test_error_details_bounded_with_spill(self):
+        """Test that only recent errors stay in memory while all are spilled."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            spill_path = Path(temp_dir) / "errors.jsonl"
+            report_path = Path(temp_dir) / "report.json"
+            logger = WorkflowLogger("test_spill_logger", spill_path=spill_path)
+            logger.summary.error_details = deque(maxlen=3)
+            
+            for i in range(5):
+                logger.log_error(RuntimeError(f"error {i}"), ErrorCategory.UNKNOWN)
+            logger.save_error_report(str(report_path))
+            logger.close()
+            
+            self.assertEqual([e.message for e in logger.summary.error_details],
+                             ["error 2", "error 3", "error 4"])
+            self.assertEqual(logger.summary.failed_operations, 5)
+            
+            lines = spill_path.read_text(encoding='utf-8').splitlines()
+            self.assertEqual([json.loads(line)["message"] for line in lines],
+                             [f"error {i}" for i in range(5)])
+            
+            report_data = json.loads(report_path.read_text(encoding='utf-8'))
+            self.assertEqual(report_data["error_log"], str(spill_path))
+            self.assertNotIn("recent_errors", report_data)
+    
+    def test_spill_with_unserialisable_context(self):
+        """Test that context values JSON cannot encode do not make log_error raise."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            spill_path = Path(temp_dir) / "errors.jsonl"
+            logger = WorkflowLogger("test_spill_context_logger", spill_path=spill_path)
+            
+            details = logger.log_error(RuntimeError("disk full"), ErrorCategory.FILESYSTEM,
+                                       context={"path": Path("/x")})
+            logger.close()
+            
+            self.assertEqual(details.context, {"path": Path("/x")})
+            record = json.loads(spill_path.read_text(encoding='utf-8'))
+            self.assertEqual(record["context"], {"path": str(Path("/x"))})
+    
+    def test_error_details_pooling(self):
+        """Test that evicted ErrorDetails are recycled when pooling is enabled."""
+        logger = WorkflowLogger("test_pool_logger", pool_error_details=True)
+        logger.summary.error_details = deque(maxlen=2)
+        
+        first = logger.log_error(RuntimeError("error 0"), ErrorCategory.UNKNOWN,
+                                 url="https://example.com/a.pdf")
+        logger.log_error(RuntimeError("error 1"), ErrorCategory.UNKNOWN)
+        logger.log_error(RuntimeError("error 2"), ErrorCategory.UNKNOWN)
+        recycled = logger.log_error(ValueError("error 3"), ErrorCategory.VALIDATION)
+        
+        self.assertIs(recycled, first)
+        self.assertEqual(recycled.message, "error 3")
+        self.assertEqual(recycled.exception_type, "ValueError")
+        self.assertIsNone(recycled.url)
+        self.assertEqual(recycled.context, {})
+        self.assertEqual([e.message for e in logger.summary.error_details],
+                         ["error 2", "error 3"])
 
 
 class TestRetryHandler(unittest.TestCase):
@@ -328,6 +462,43 @@ class TestRetryHandler(unittest.TestCase):
         
         # Test max delay cap
         self.assertEqual(handler._calculate_delay(10), 10.0)
+        
+        # Non-doubling factors still use exponentiation
+        handler = RetryHandler(base_delay=1.0, backoff_factor=3.0, max_delay=100.0)
+        self.assertEqual(handler._calculate_delay(2), 9.0)
+    
+    def test_delay_calculation_with_jitter(self):
+        """Test that full jitter stays within the capped backoff delay."""
+        handler = RetryHandler(base_delay=1.0, max_delay=10.0, jitter=True)
+        
+        for attempt in range(8):
+            delay = handler._calculate_delay(attempt)
+            self.assertGreaterEqual(delay, 0.0)
+            self.assertLessEqual(delay, min(2 ** attempt, 10.0))
+    
+    def test_async_operation_succeeds_after_retries(self):
+        """Test the async retry variant with a coroutine operation."""
+        call_count = 0
+        
+        async def flaky_operation(value):
+            nonlocal call_count
+            call_count += 1
+            if call_count < 3:
+                raise ConnectionError("Network error")
+            return value
+        
+        with patch('error_handler.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            success, result, error = asyncio.run(
+                self.retry_handler.execute_with_retry_async(
+                    flaky_operation, "done", logger=self.logger
+                )
+            )
+        
+        self.assertTrue(success)
+        self.assertEqual(result, "done")
+        self.assertIsNone(error)
+        self.assertEqual(call_count, 3)
+        self.assertEqual(mock_sleep.await_count, 2)
     
     def test_error_categorization(self):
         """Test error categorization logic."""
@@ -371,6 +542,90 @@ class TestRetryHandler(unittest.TestCase):
         unknown_error = Exception("Some unknown error")
         category = self.retry_handler._categorize_error(unknown_error)
         self.assertEqual(category, ErrorCategory.UNKNOWN)
+    
+    def test_error_categorization_precedence(self):
+        """Test that category precedence does not depend on indicator position."""
+        custom_value_error = type("CustomValueError", (Exception,), {})
+        custom_os_error = type("CustomOSError", (Exception,), {})
+        cases = [
+            (custom_value_error("connection refused"), ErrorCategory.NETWORK),
+            (custom_os_error("request timeout"), ErrorCategory.NETWORK),
+            (custom_value_error("no such file"), ErrorCategory.FILESYSTEM),
+            (custom_value_error("malformed yaml"), ErrorCategory.VALIDATION),
+            (Exception("invalid yaml"), ErrorCategory.CONFIGURATION),
+            (Exception("valueerror raised"), ErrorCategory.UNKNOWN),
+            (type("ValidationError", (Exception,), {})(), ErrorCategory.UNKNOWN),
+            (Exception("permission\x00denied"), ErrorCategory.UNKNOWN),
+        ]
+        
+        for error, expected in cases:
+            with self.subTest(error=repr(error)):
+                self.assertEqual(self.retry_handler._categorize_error(error), expected)
+    
+    def test_error_categorization_by_class(self):
+        """Test that known exception classes categorize by class identity."""
+        cases = [
+            (socket.gaierror("Name or service not known"), ErrorCategory.NETWORK),
+            (requests.exceptions.ReadTimeout("read timed out"), ErrorCategory.NETWORK),
+            (requests.exceptions.HTTPError("404 Client Error"), ErrorCategory.NETWORK),
+            (FileNotFoundError("request timeout"), ErrorCategory.FILESYSTEM),
+            (json.JSONDecodeError("Expecting value", "", 0), ErrorCategory.CONFIGURATION),
+            (yaml.YAMLError("bad indentation"), ErrorCategory.CONFIGURATION),
+            (ValueError("connection refused"), ErrorCategory.VALIDATION),
+            (UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte"),
+             ErrorCategory.VALIDATION),
+        ]
+        
+        for error, expected in cases:
+            with self.subTest(error=repr(error)):
+                self.assertEqual(self.retry_handler._categorize_error(error), expected)
+
+
+class TestErrorHandler(unittest.TestCase):
+    """Test cases for the combined ErrorHandler."""
+    
+    def test_log_error_maps_category_strings(self):
+        """Test category strings map to enum members, unknown ones to UNKNOWN."""
+        handler = ErrorHandler(name="test_error_handler_logger")
+        handler.log_error("Connection refused", "network")
+        handler.log_error("Odd failure", "not-a-category")
+        handler.log_error("Bad value", ErrorCategory.VALIDATION)
+        
+        counts = handler.logger.summary.errors_by_category
+        self.assertEqual(counts[ErrorCategory.NETWORK], 1)
+        self.assertEqual(counts[ErrorCategory.UNKNOWN], 1)
+        self.assertEqual(counts[ErrorCategory.VALIDATION], 1)
+        
+        message = handler.logger._format_error_message(handler.logger.summary.error_details[0])
+        self.assertTrue(message.startswith("[NETWORK] | Connection refused"))
+        self.assertIn("Type: RuntimeError", message)
+        self.assertIs(handler.get_error_summary(), handler.logger.summary)
+    
+    def test_log_file_handler(self):
+        """Test that errors are also written to the configured log file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = str(Path(temp_dir) / "errors.log")
+            other_log_file = str(Path(temp_dir) / "other.log")
+            ErrorHandler(other_log_file, name="test_error_handler_file_logger")
+            handler = ErrorHandler(log_file, name="test_error_handler_file_logger")
+            ErrorHandler(log_file, name="test_error_handler_file_logger")
+            logger = handler.logger.logger
+            file_handlers = [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
+            try:
+                self.assertEqual(len(file_handlers), 1)
+                self.assertEqual(logger.name, "test_error_handler_file_logger")
+                
+                handler.logger.log_success("Saved file")
+                handler.log_error("Disk full", "filesystem")
+                file_handlers[0].flush()
+                log_text = Path(log_file).read_text(encoding='utf-8')
+                self.assertIn("[FILESYSTEM] | Disk full", log_text)
+                self.assertNotIn("Saved file", log_text)
+                self.assertFalse(Path(other_log_file).exists())
+            finally:
+                for file_handler in file_handlers:
+                    logger.removeHandler(file_handler)
+                    file_handler.close()
 
 
 class TestFactoryFunctions(unittest.TestCase):
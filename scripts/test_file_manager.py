@@ -11,10 +11,17 @@ Tests cover:
 
 import unittest
 import tempfile
+import os
 import shutil
+import stat
+import errno
+import asyncio
+import threading
+import time
 from pathlib import Path
 from unittest.mock import patch, Mock, MagicMock
 import requests
+import file_manager
 from file_manager import FileManager
 
 
@@ -60,6 +67,24 @@ class TestFileManager(unittest.TestCase):
         finally:
             os.chdir(original_cwd)
     
+    def test_known_directories_skip_mkdir(self):
+        """Test that a directory is created once and recreated if removed."""
+        dir_path = self.temp_dir / "newspaper" / "daily-news" / "2024"
+        
+        with patch.object(Path, 'mkdir', autospec=True, side_effect=Path.mkdir) as mock_mkdir:
+            self.assertTrue(self.file_manager._ensure_directory(dir_path))
+            calls = mock_mkdir.call_count
+            self.assertFalse(self.file_manager._ensure_directory(dir_path))
+            self.assertEqual(mock_mkdir.call_count, calls)
+        
+        # A removed directory is recreated when the download is opened
+        shutil.rmtree(self.temp_dir / "newspaper")
+        temp_file, temp_path = self.file_manager._open_temp_file(dir_path / "1.pdf")
+        with temp_file as f:
+            f.write(b'%PDF-1.4')
+        self.assertTrue(temp_path.exists())
+        self.assertEqual(temp_path.parent, dir_path)
+    
     def test_sanitize_folder_name(self):
         """Test folder name sanitization."""
         # Test various problematic characters
@@ -112,6 +137,12 @@ class TestFileManager(unittest.TestCase):
         # Should return 6 (next after highest number)
         self.assertEqual(self.file_manager.get_next_file_number(test_dir), 6)
         
+        # Only lowercase .pdf names with a numeric stem count
+        (test_dir / "12.PDF").touch()
+        (test_dir / "9.pdf.part").touch()
+        (test_dir / ".pdf").touch()
+        self.assertEqual(self.file_manager.get_next_file_number(test_dir), 6)
+        
         # Test non-existing directory
         non_existing_dir = self.temp_dir / "nonexistent"
         self.assertEqual(self.file_manager.get_next_file_number(non_existing_dir), 1) 
@@ -305,6 +336,315 @@ class TestFileManager(unittest.TestCase):
                 )
                 self.assertFalse(is_valid, f"Invalid type not rejected: {content_type}")
 
+    
+    def test_session_is_shared_and_pooled(self):
+        """Test that a single pooled session is reused across requests."""
+        session = self.file_manager.session
+        
+        self.assertIs(session, self.file_manager.session)
+        self.assertEqual(session.max_redirects, self.file_manager.max_redirects)
+        
+        adapter = session.get_adapter("https://example.com/test.pdf")
+        self.assertEqual(adapter._pool_maxsize, FileManager.POOL_MAXSIZE)
+        self.assertEqual(adapter.max_retries.total, 0)
+        self.assertEqual(session.headers["User-Agent"], FileManager.DEFAULT_HEADERS["User-Agent"])
+        self.assertEqual(session.headers["Connection"], "keep-alive")
+        self.assertEqual(session.headers["Accept-Encoding"], "gzip, deflate")
+        self.assertTrue(session.headers["Accept"].startswith("application/pdf"))
+        
+        self.file_manager.close()
+        self.assertIsNot(session, self.file_manager.session)
+    
+    def test_host_safety_cached_per_host(self):
+        """Test that host verdicts are computed once and reused across URLs."""
+        FileManager._classify_host.cache_clear()
+        
+        for i in range(3):
+            is_safe, error = self.file_manager._is_safe_url(f"https://example.com/{i}.pdf")
+            self.assertTrue(is_safe, error)
+        is_safe, error = self.file_manager._is_safe_url("http://192.168.1.10/file.pdf")
+        self.assertFalse(is_safe)
+        self.assertIn("private IP", error)
+        
+        cache_info = FileManager._classify_host.cache_info()
+        self.assertEqual(cache_info.misses, 2)
+        self.assertEqual(cache_info.hits, 2)
+    
+    def test_url_parsed_once_per_download(self):
+        """Test that URL validation and content-type checks share one parse."""
+        file_manager._parse_url.cache_clear()
+        url = "https://example.com/parse-once.pdf"
+        
+        self.assertTrue(self.file_manager._is_safe_url(url)[0])
+        self.assertTrue(self.file_manager._validate_content_type("", url)[0])
+        self.assertTrue(self.file_manager._validate_content_type("application/octet-stream", url)[0])
+        
+        cache_info = file_manager._parse_url.cache_info()
+        self.assertEqual(cache_info.misses, 1)
+        self.assertEqual(cache_info.hits, 3)
+    
+    def test_private_ip_prefilter(self):
+        """Test that domain names skip IP parsing and IP literals still get it."""
+        with patch('file_manager.ipaddress.ip_address', wraps=file_manager.ipaddress.ip_address) as mock_parse:
+            self.assertFalse(self.file_manager._is_private_ip("example.com"))
+            self.assertFalse(self.file_manager._is_private_ip("cdn.example.ir"))
+            mock_parse.assert_not_called()
+            
+            self.assertTrue(self.file_manager._is_private_ip("192.168.1.1"))
+            self.assertTrue(self.file_manager._is_private_ip("fe80::1"))
+            self.assertFalse(self.file_manager._is_private_ip("8.8.8.8"))
+            self.assertFalse(self.file_manager._is_private_ip("1password.com"))
+            self.assertEqual(mock_parse.call_count, 4)
+    
+    def test_download_many_bounds_concurrency(self):
+        """Test that download_many keeps job order and the concurrency limit."""
+        jobs = [(f"https://example.com/{i}.pdf", self.temp_dir / f"{i}.pdf") for i in range(6)]
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+        
+        def fake_download(url, target_path):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            if url.endswith("3.pdf"):
+                raise OSError("disk full")
+            return True, None
+        
+        with patch.object(self.file_manager, 'download_file', side_effect=fake_download):
+            results = self.file_manager.download_many(jobs, concurrency=2)
+        
+        self.assertEqual(len(results), 6)
+        self.assertEqual(results[0], (True, None))
+        self.assertEqual(results[3], (False, "disk full"))
+        self.assertLessEqual(peak, 2)
+        self.assertGreater(peak, 0)
+    
+    def test_iter_downloads_yields_as_completed(self):
+        """Test that iter_downloads yields every job with its result as it finishes."""
+        jobs = [(f"https://example.com/{i}.pdf", self.temp_dir / f"{i}.pdf") for i in range(4)]
+        
+        def fake_download(url, target_path):
+            # Earlier jobs take longer, so completion order is the reverse of job order
+            time.sleep(0.05 * (3 - int(target_path.stem)))
+            if url.endswith("2.pdf"):
+                raise OSError("disk full")
+            return True, None
+        
+        with patch.object(self.file_manager, 'download_file', side_effect=fake_download):
+            results = list(self.file_manager.iter_downloads(jobs, concurrency=4))
+            async_results = asyncio.run(self.file_manager.download_many_async(jobs, concurrency=4))
+        
+        self.assertEqual([job for job, _ in results], jobs[::-1])
+        self.assertEqual(dict(results)[jobs[2]], (False, "disk full"))
+        self.assertEqual(async_results, [(True, None), (True, None), (False, "disk full"), (True, None)])
+    
+    def test_context_manager_closes_session(self):
+        """Test that leaving the context manager drains the pooled session."""
+        with FileManager() as file_manager:
+            session = file_manager.session
+        
+        self.assertIsNone(file_manager._session)
+        self.assertIsNot(session, file_manager.session)
+    
+    def test_download_reuses_session(self):
+        """Test that consecutive downloads go through the same session."""
+        mock_session = Mock()
+        mock_session.get.side_effect = requests.exceptions.ConnectionError("Network error")
+        self.file_manager._session = mock_session
+        
+        with patch('file_manager.requests.Session') as mock_session_class, \
+                patch('error_handler.time.sleep'):
+            for i in range(2):
+                self.file_manager.download_file(
+                    f"https://example.com/test{i}.pdf", self.temp_dir / f"test{i}.pdf"
+                )
+            mock_session_class.assert_not_called()
+        
+        self.assertEqual(mock_session.get.call_count, 2 * (self.file_manager.max_retries + 1))
+    
+    def test_suspicious_scan_matches_regex(self):
+        """Test that the substring scan agrees with the reference pattern."""
+        urls = [
+            "https://example.com/archive/2023/issue-1.pdf",
+            "https://example.com/%2E%2E%2Fetc/passwd",
+            "https://example.com/JavaScript:alert(1)",
+            "https://user@example.com/file.pdf",
+            "https://example.com/a'b.pdf",
+            "https://example.com/DATA:x",
+            "https://example.com/ſ/file.pdf",
+            "https://example.com/javaſcript:alert(1)",
+        ]
+        
+        for url in urls:
+            with self.subTest(url=url):
+                self.assertEqual(
+                    self.file_manager._has_suspicious_patterns(url),
+                    file_manager._SUSPICIOUS_RE.search(url) is not None
+                )
+    
+    def test_download_reads_large_chunks(self):
+        """Test that the body is streamed in DOWNLOAD_CHUNK_SIZE reads."""
+        mock_response = Mock()
+        mock_response.url = "https://example.com/test.pdf"
+        mock_response.headers = {'content-type': 'application/pdf'}
+        mock_response.iter_content.return_value = [b'%PDF-1.4\n', b'', b'x' * 100]
+        mock_session = Mock()
+        mock_session.get.return_value = mock_response
+        self.file_manager._session = mock_session
+        
+        target_path = self.temp_dir / "chunked.pdf"
+        success, error = self.file_manager.download_file("https://example.com/test.pdf", target_path)
+        
+        self.assertTrue(success, error)
+        mock_response.iter_content.assert_called_once_with(chunk_size=FileManager.DOWNLOAD_CHUNK_SIZE)
+        self.assertEqual(target_path.read_bytes(), b'%PDF-1.4\n' + b'x' * 100)
+    
+    def test_download_checks_signature_while_streaming(self):
+        """Test that the PDF signature is checked from the streamed chunks."""
+        mock_response = Mock()
+        mock_response.url = "https://example.com/test.pdf"
+        mock_response.headers = {'content-type': 'application/pdf'}
+        mock_session = Mock()
+        mock_session.get.return_value = mock_response
+        self.file_manager._session = mock_session
+        
+        with patch.object(self.file_manager, '_validate_pdf_content') as mock_validate:
+            # Signature split across chunks is still recognised
+            mock_response.iter_content.return_value = [b'%P', b'DF-1.4', b'\n']
+            success, error = self.file_manager.download_file(
+                "https://example.com/test.pdf", self.temp_dir / "split.pdf"
+            )
+            self.assertTrue(success, error)
+            
+            mock_response.iter_content.return_value = [b'<html>not a pdf</html>']
+            target_path = self.temp_dir / "page.pdf"
+            success, error = self.file_manager.download_file(
+                "https://example.com/page.pdf", target_path
+            )
+            self.assertFalse(success)
+            self.assertIn("PDF signature", error)
+            self.assertFalse(target_path.exists())
+            
+            mock_validate.assert_not_called()
+    
+    def test_download_publishes_complete_files_only(self):
+        """Test that downloads land atomically and never overwrite a saved file."""
+        mock_response = Mock()
+        mock_response.url = "https://example.com/test.pdf"
+        mock_response.headers = {'content-type': 'application/pdf'}
+        mock_session = Mock()
+        mock_session.get.return_value = mock_response
+        self.file_manager._session = mock_session
+        target_path = self.temp_dir / "1.pdf"
+        
+        mock_response.iter_content.return_value = [b'%PDF-first']
+        size, header = self.file_manager._perform_download("https://example.com/test.pdf", target_path)
+        self.assertEqual((size, header), (10, b'%PDF-'))
+        
+        # A second download racing for the same target does not replace the winner
+        mock_response.iter_content.return_value = [b'%PDF-second']
+        self.file_manager._perform_download("https://example.com/test.pdf", target_path)
+        self.assertEqual(target_path.read_bytes(), b'%PDF-first')
+        
+        # Oversized downloads never appear under their final name
+        mock_response.iter_content.return_value = [b'%PDF-', b'x' * self.file_manager.max_file_size_bytes]
+        with self.assertRaises(RuntimeError):
+            self.file_manager._perform_download("https://example.com/test.pdf", self.temp_dir / "2.pdf")
+        
+        self.assertEqual(sorted(p.name for p in self.temp_dir.iterdir()), ["1.pdf"])
+    
+    def test_published_file_uses_umask_mode(self):
+        """Test downloads get the usual umask permissions, not mkstemp's owner-only mode."""
+        umask = os.umask(0o022)
+        try:
+            mock_response = Mock()
+            mock_response.url = "https://example.com/test.pdf"
+            mock_response.headers = {'content-type': 'application/pdf'}
+            mock_response.iter_content.return_value = [b'%PDF-1.4']
+            mock_session = Mock()
+            mock_session.get.return_value = mock_response
+            self.file_manager._session = mock_session
+            
+            with patch('file_manager._FILE_MODE', 0o644):
+                target_path = self.temp_dir / "1.pdf"
+                self.file_manager._perform_download("https://example.com/test.pdf", target_path)
+                
+                fallback_path = self.temp_dir / "2.pdf"
+                with patch('file_manager.os.link', side_effect=OSError(errno.EPERM, "no links")):
+                    self.file_manager._perform_download("https://example.com/test.pdf", fallback_path)
+        finally:
+            os.umask(umask)
+        
+        self.assertEqual(stat.S_IMODE(target_path.stat().st_mode), 0o644)
+        self.assertEqual(stat.S_IMODE(fallback_path.stat().st_mode), 0o644)
+        self.assertEqual(file_manager._FILE_MODE, 0o666 & ~umask)
+    
+    def test_failed_fallback_leaves_no_placeholder(self):
+        """Test the empty placeholder is removed when the fallback replace fails."""
+        temp_path = self.temp_dir / ".1.pdf.part"
+        temp_path.write_bytes(b'%PDF-1.4')
+        target_path = self.temp_dir / "1.pdf"
+        
+        with patch('file_manager.os.link', side_effect=OSError(errno.EPERM, "no links")), \
+                patch('file_manager.os.replace', side_effect=OSError(errno.EIO, "I/O error")):
+            with self.assertRaises(OSError):
+                self.file_manager._publish_file(temp_path, target_path)
+        
+        self.assertFalse(target_path.exists())
+    
+    def test_publish_without_hard_links_never_overwrites(self):
+        """Test the no-hard-link fallback keeps one winner and re-raises real errors."""
+        target_path = self.temp_dir / "1.pdf"
+        
+        def make_temp(content):
+            temp_path = self.temp_dir / ".1.pdf.part"
+            temp_path.write_bytes(content)
+            return temp_path
+        
+        no_links = OSError(errno.EPERM, "Operation not permitted")
+        with patch('file_manager.os.link', side_effect=no_links):
+            self.file_manager._publish_file(make_temp(b'%PDF-first'), target_path)
+            self.assertEqual(target_path.read_bytes(), b'%PDF-first')
+            
+            # A later download does not replace the file already in place
+            self.file_manager._publish_file(make_temp(b'%PDF-second'), target_path)
+            self.assertEqual(target_path.read_bytes(), b'%PDF-first')
+        
+        with patch('file_manager.os.link', side_effect=OSError(errno.EIO, "I/O error")):
+            with self.assertRaises(OSError):
+                self.file_manager._publish_file(make_temp(b'%PDF-third'), self.temp_dir / "2.pdf")
+        self.assertFalse((self.temp_dir / "2.pdf").exists())
+    
+    def test_download_with_size_check_single_request(self):
+        """Test that the size check rides on the download GET without a HEAD."""
+        mock_response = Mock()
+        mock_response.url = "https://example.com/large.pdf"
+        mock_response.headers = {
+            'content-type': 'application/pdf',
+            'content-length': str(self.file_manager.max_file_size_bytes + 1)
+        }
+        mock_session = Mock()
+        mock_session.get.return_value = mock_response
+        self.file_manager._session = mock_session
+        
+        target_path = self.temp_dir / "large.pdf"
+        success, error = self.file_manager.download_with_size_check(
+            "https://example.com/large.pdf", target_path
+        )
+        
+        self.assertFalse(success)
+        self.assertIn("File too large", error)
+        mock_session.head.assert_not_called()
+        mock_session.get.assert_called_once()
+        mock_response.iter_content.assert_not_called()
+        mock_response.close.assert_called_once()
+        self.assertFalse(target_path.exists())
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
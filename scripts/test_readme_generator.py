@@ -321,6 +321,23 @@ class TestPublicationReadmeGenerator(unittest.TestCase):
         self.assertIn('روزنامه کیهان / Kayhan Newspaper', written_content)
         self.assertNotIn('Old content', written_content)
     
+    def test_update_publication_readme_skips_unchanged_content(self):
+        """Test that an unchanged publication README is not rewritten."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            readme_path = os.path.join(temp_dir, 'README.md')
+            content = self.generator.generate_publication_readme(self.sample_archive)
+            with open(readme_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            
+            with patch('builtins.open', wraps=open) as mock_file:
+                self.generator.update_publication_readme(readme_path, self.sample_archive)
+                self.generator.update_publication_readme(readme_path, self.sample_archive)
+            
+            modes = [call.args[1] for call in mock_file.call_args_list]
+            self.assertNotIn('w', modes)
+            # The second call is answered from the content-hash cache
+            self.assertEqual(modes.count('r'), 1)
+    
     def test_years_section_generation(self):
         """Test years section generation."""
         years_section = self.generator._generate_years_section(self.sample_archive)
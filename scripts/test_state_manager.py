@@ -97,6 +97,38 @@ class TestStateManager(unittest.TestCase):
         self.assertEqual(result.files_failed, 3)
         self.assertEqual(result.errors, errors)
     
+    def test_track_download_results_batch(self):
+        """Test tracking several results in a single batch."""
+        self.state_manager.track_download_results_batch([
+            {
+                'archive_name': 'kayhan-newspaper',
+                'category': 'old-newspaper',
+                'success': True,
+                'files_downloaded': 5,
+                'processing_time': 1.5
+            },
+            {
+                'archive_name': 'tehran-times',
+                'category': 'newspaper',
+                'success': False,
+                'files_failed': 2,
+                'errors': None
+            }
+        ])
+        
+        self.assertEqual(len(self.state_manager.processing_results), 2)
+        first, second = self.state_manager.processing_results
+        
+        self.assertEqual(first.archive_name, 'kayhan-newspaper')
+        self.assertTrue(first.success)
+        self.assertEqual(first.files_downloaded, 5)
+        self.assertEqual(first.processing_time, 1.5)
+        
+        self.assertEqual(second.archive_name, 'tehran-times')
+        self.assertFalse(second.success)
+        self.assertEqual(second.files_failed, 2)
+        self.assertEqual(second.errors, [])
+    
     def test_remove_successful_urls_single_archive(self):
         """Test removing single successful archive from configuration."""
         successful_archives = ['kayhan-newspaper']
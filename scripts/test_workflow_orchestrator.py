@@ -101,16 +101,17 @@ archives:
             folder='test',
             category='old-newspaper',
             description='Test archive',
-            years={'2023': ['file1.pdf']}
+            years={'2023': ['http://example.com/file1.pdf']}
         )
-        # Add urls attribute for workflow compatibility
-        mock_archive.urls = ['http://example.com']
         self.orchestrator.config_parser.parse_configuration = Mock(return_value=[mock_archive])
         
         result = self.orchestrator._load_configuration()
         
         self.assertTrue(result)
         self.assertIsNotNone(self.orchestrator.archives)
+        # URLs are taken from the archive's years
+        self.assertEqual(self.orchestrator.archives['old-newspaper'][0]['urls'],
+                         ['http://example.com/file1.pdf'])
     
     def test_load_configuration_file_not_found(self):
         """Test configuration loading when file doesn't exist."""